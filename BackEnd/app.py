@@ -4,20 +4,28 @@ from flask          import Flask
 from flask_cors     import CORS
 
 from model          import ProductDao, SellerDao, OrderDao, UserDao, CouponDao, EventDao
-from service        import ProductService, SellerService, OrderService, UserService, CouponService, EventService
+from service        import ProductService, SellerService, OrderService, UserService, CouponService, EventService, EventViewCountService, ExportService
 from view           import create_endpoints
+from connection     import register_connection_handlers
+from utils.job_backend import create_job_backend
 
 class Services:
     pass
 
 # 작성자: 김태수
 # 수정일: 2020.09.21.월
+# 수정일: 2026.10.18.일 - 요청 범위 커넥션 핸들러 등록
+# 수정일: 2026.10.18.일 - 기준 데이터 캐시 미리 읽기
+# 수정일: 2026.10.18.일 - 내보내기 작업 서비스 등록
 def create_app(test_config = None):
     app = Flask(__name__)
     app.config['JSON_AS_ASCII'] = False
 
     CORS(app)
 
+    # 요청 범위 커넥션 커밋/롤백 및 반환
+    register_connection_handlers(app)
+
     if test_config is None:
         app.config.from_pyfile("config.py")
     else:
@@ -38,8 +46,18 @@ def create_app(test_config = None):
     services.user_service    = UserService(user_dao, app.config)
     services.coupon_service  = CouponService(coupon_dao, app.config)
     services.event_service   = EventService(event_dao, app.config)
+    services.event_view_count_service = EventViewCountService(event_dao, app.config)
+    services.export_service  = ExportService(create_job_backend(app.config), app.config)
+
+    # 내보내기 작업 종류 -> 파일 만드는 함수
+    services.export_service.register('products', services.product_service.export_products)
+    services.export_service.register('sellers', services.seller_service.export_sellers)
+    services.export_service.register('coupon_serials', services.coupon_service.export_serials)
 
     create_endpoints(app, services)
 
+    # 상품 화면 선택 목록(국가, 색상, 사이즈, 카테고리)을 첫 요청 전에 읽어 둔다.
+    app.before_first_request(services.product_service.reference_cache.refresh)
+
     return app
 
@@ -1,14 +1,459 @@
+import os
+import threading
+import time
+from collections import deque
+
 import pymysql
 
+from flask             import g, has_request_context
+from pymysql.constants import CLIENT, SERVER_STATUS
+
 from config import database
 
-def get_connection():
+# 커넥션 풀 기본 설정값 (config.database 딕셔너리에서 덮어쓸 수 있다)
+POOL_MIN_SIZE              = 2
+POOL_MAX_SIZE              = 10
+POOL_MAX_LIFETIME          = 3600 # 초
+POOL_TIMEOUT               = 10   # 초, 풀이 가득 찼을 때 반환을 기다리는 시간
+POOL_HEALTH_CHECK_INTERVAL = 30   # 초, 이 시간보다 오래 놀던 커넥션은 꺼낼 때 ping
+
+def create_connection():
+    """
+    풀을 거치지 않는 새 데이터베이스 커넥션 생성
+
+    Args:
+
+    Returns:
+        pymysql 커넥션 객체
+
+    Author:
+        김태수
+
+    History:
+        2026-10-18(김태수): get_connection 에서 분리
+        2026-10-18(김태수): multi_statements 설정 추가
+    """
     return pymysql.connect(
-        host       = database['host'],
-        port       = database['port'],
-        user       = database['user'],
-        passwd     = database['password'],
-        db         = database['database'],
-        charset    = 'utf8mb4',
-        autocommit = False
-)
\ No newline at end of file
+        host        = database['host'],
+        port        = database['port'],
+        user        = database['user'],
+        passwd      = database['password'],
+        db          = database['database'],
+        charset     = 'utf8mb4',
+        autocommit  = False,
+        # 리스트 + 개수처럼 두 쿼리를 한 번에 보낼 수 있도록 허용 (선택)
+        client_flag = CLIENT.MULTI_STATEMENTS if database.get('multi_statements') else 0
+    )
+
+class PoolTimeoutError(pymysql.err.OperationalError):
+    """
+    풀이 가득 찬 상태에서 timeout 안에 커넥션을 반환받지 못한 경우.
+    뷰의 기존 OperationalError 처리(500)에 그대로 걸리도록 상속한다.
+    """
+    def __init__(self, timeout):
+        super().__init__(10900, f"CONNECTION_POOL_TIMEOUT_{timeout}S")
+
+class _PoolEntry:
+    """
+    풀 안에서 관리되는 실제 커넥션과 생성/사용 시각
+    """
+    def __init__(self, raw):
+        self.raw          = raw
+        self.created_at   = time.monotonic()
+        self.last_used_at = self.created_at
+
+class PooledConnection:
+    """
+    풀에서 꺼낸 커넥션. pymysql 커넥션과 같은 인터페이스를 제공하고
+    close() 를 호출하면 실제로 끊지 않고 풀에 반환한다.
+    """
+    def __init__(self, pool, entry):
+        self._pool  = pool
+        self._entry = entry
+
+    def __getattr__(self, name):
+        entry = self.__dict__.get('_entry')
+        if entry is None:
+            raise pymysql.err.InterfaceError(0, "CONNECTION_ALREADY_RETURNED_TO_POOL")
+        return getattr(entry.raw, name)
+
+    def close(self):
+        # 두 번 close 해도 한 번만 반환된다.
+        entry, self._entry = self._entry, None
+        if entry is not None:
+            self._pool.release(entry)
+
+    @property
+    def open(self):
+        return self._entry is not None and self._entry.raw.open
+
+class RequestConnection:
+    """
+    요청 하나 동안 데코레이터, 뷰, 서비스, DAO 가 함께 쓰는 커넥션.
+    close() 는 아무 일도 하지 않고, 실제 반환은 teardown 핸들러가 담당한다.
+    """
+    def __init__(self, conn):
+        self._conn = conn
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+    def close(self):
+        pass
+
+    def release(self):
+        self._conn.close()
+
+class ConnectionPool:
+    def __init__(
+        self,
+        connect,
+        min_size              = POOL_MIN_SIZE,
+        max_size              = POOL_MAX_SIZE,
+        max_lifetime          = POOL_MAX_LIFETIME,
+        timeout               = POOL_TIMEOUT,
+        health_check_interval = POOL_HEALTH_CHECK_INTERVAL
+    ):
+        """
+        데이터베이스 커넥션 풀
+
+        Args:
+            connect              : 새 커넥션을 만드는 함수
+            min_size             : 미리 열어 두는 커넥션 수
+            max_size             : 동시에 열 수 있는 최대 커넥션 수
+            max_lifetime         : 커넥션 최대 수명(초), 지나면 닫고 새로 연다
+            timeout              : 풀이 가득 찼을 때 반환을 기다리는 최대 시간(초)
+            health_check_interval: 꺼낼 때 ping 으로 상태를 확인하는 유휴 시간 기준(초)
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("INVALID_POOL_SIZE")
+
+        self.min_size              = min_size
+        self.max_size              = max_size
+        self.max_lifetime          = max_lifetime
+        self.timeout               = timeout
+        self.health_check_interval = health_check_interval
+
+        self._connect   = connect
+        self._idle      = deque()
+        self._size      = 0 # 풀이 관리하는 전체 커넥션 수 (대여중 + 유휴)
+        self._condition = threading.Condition()
+
+    def warm_up(self):
+        """
+        min_size 만큼 커넥션을 미리 열어 둔다.
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        while True:
+            with self._condition:
+                if self._size >= self.min_size:
+                    return
+                self._size += 1
+
+            entry = self._open_entry()
+            with self._condition:
+                self._idle.append(entry)
+                self._condition.notify()
+
+    def acquire(self):
+        """
+        풀에서 커넥션을 꺼낸다.
+        유휴 커넥션이 없고 max_size 에 도달했으면 timeout 까지 반환을 기다린다.
+
+        Returns:
+            PooledConnection 객체
+
+        Raises:
+            PoolTimeoutError: timeout 안에 커넥션을 얻지 못함
+            pymysql.err.OperationalError: 새 커넥션 생성 실패
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        deadline = time.monotonic() + self.timeout
+        entry    = None
+
+        with self._condition:
+            while True:
+                if self._idle:
+                    # 가장 최근에 반환된 커넥션부터 사용 (LIFO) - 오래 논 커넥션은 자연스럽게 만료
+                    entry = self._idle.pop()
+                    break
+
+                if self._size < self.max_size:
+                    self._size += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeoutError(self.timeout)
+                self._condition.wait(remaining)
+
+        if entry is None:
+            entry = self._open_entry()
+        else:
+            entry = self._check_entry(entry)
+
+        return PooledConnection(self, entry)
+
+    def release(self, entry):
+        """
+        커넥션을 풀에 반환한다.
+        끝나지 않은 트랜잭션은 롤백해서 다음 사용자가 깨끗한 상태로 받도록 한다.
+
+        Args:
+            entry: 반환할 _PoolEntry
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        raw = entry.raw
+
+        try:
+            if not raw.open:
+                raise pymysql.err.InterfaceError(0, "CONNECTION_CLOSED")
+
+            if raw.server_status & SERVER_STATUS.SERVER_STATUS_IN_TRANS:
+                raw.rollback()
+        except pymysql.err.Error:
+            self._discard(entry)
+            return
+
+        entry.last_used_at = time.monotonic()
+
+        if self._is_expired(entry):
+            self._discard(entry)
+            return
+
+        with self._condition:
+            self._idle.append(entry)
+            self._condition.notify()
+
+    def close_all(self):
+        """
+        유휴 커넥션을 모두 닫는다. 대여중인 커넥션은 반환될 때 정리된다.
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        with self._condition:
+            idle, self._idle = list(self._idle), deque()
+
+        for entry in idle:
+            self._discard(entry)
+
+    def stats(self):
+        with self._condition:
+            return {
+                'size'    : self._size,
+                'idle'    : len(self._idle),
+                'in_use'  : self._size - len(self._idle),
+                'max_size': self.max_size
+            }
+
+    def _open_entry(self):
+        # 슬롯(_size)은 이미 확보된 상태에서 호출된다. 실패하면 슬롯을 돌려준다.
+        try:
+            return _PoolEntry(self._connect())
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+
+    def _check_entry(self, entry):
+        now = time.monotonic()
+
+        if not self._is_expired(entry, now) and now - entry.last_used_at < self.health_check_interval:
+            return entry
+
+        if not self._is_expired(entry, now):
+            try:
+                entry.raw.ping(reconnect=False)
+                return entry
+            except pymysql.err.Error:
+                pass
+
+        # 수명이 다했거나 ping 에 실패한 커넥션은 같은 슬롯에서 새로 연다.
+        self._close_quietly(entry.raw)
+        return self._open_entry()
+
+    def _is_expired(self, entry, now=None):
+        now = now if now is not None else time.monotonic()
+        return now - entry.created_at >= self.max_lifetime
+
+    def _discard(self, entry):
+        self._close_quietly(entry.raw)
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    @staticmethod
+    def _close_quietly(raw):
+        try:
+            raw.close()
+        except pymysql.err.Error:
+            pass
+
+_pool      = None
+_pool_pid  = None
+_pool_lock = threading.Lock()
+
+def get_pool():
+    """
+    프로세스별 커넥션 풀. gunicorn 워커처럼 fork 된 프로세스에서는 새로 만든다.
+
+    Returns:
+        ConnectionPool 객체
+
+    Author:
+        김태수
+
+    History:
+        2026-10-18(김태수): 초기 생성
+    """
+    global _pool, _pool_pid
+
+    if _pool is not None and _pool_pid == os.getpid():
+        return _pool
+
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            pool = ConnectionPool(
+                create_connection,
+                min_size              = database.get('pool_min_size', POOL_MIN_SIZE),
+                max_size              = database.get('pool_max_size', POOL_MAX_SIZE),
+                max_lifetime          = database.get('pool_max_lifetime', POOL_MAX_LIFETIME),
+                timeout               = database.get('pool_timeout', POOL_TIMEOUT),
+                health_check_interval = database.get('pool_health_check_interval', POOL_HEALTH_CHECK_INTERVAL)
+            )
+            pool.warm_up()
+            _pool, _pool_pid = pool, os.getpid()
+
+    return _pool
+
+def get_connection():
+    """
+    데이터베이스 커넥션을 꺼낸다.
+    요청 처리 중이면 요청 범위 커넥션을, 그 밖(크론 작업 등)에서는 풀의 커넥션을 준다.
+    어느 쪽이든 사용 후 conn.close() 를 호출하면 된다.
+
+    Returns:
+        RequestConnection 또는 PooledConnection 객체
+
+    Author:
+        김태수
+
+    History:
+        2026-10-18(김태수): 요청마다 새로 연결하던 방식에서 커넥션 풀로 변경
+        2026-10-18(김태수): 요청 처리 중에는 요청 범위 커넥션을 공유하도록 변경
+    """
+    if has_request_context():
+        return get_request_connection()
+
+    return get_pool().acquire()
+
+def get_request_connection():
+    """
+    요청 범위 커넥션. 처음 사용할 때 풀에서 꺼내 flask g 에 저장한다.
+
+    Returns:
+        RequestConnection 객체
+
+    Author:
+        김태수
+
+    History:
+        2026-10-18(김태수): 초기 생성
+    """
+    if 'db_conn' not in g:
+        g.db_conn = RequestConnection(get_pool().acquire())
+
+    return g.db_conn
+
+def _in_transaction(conn):
+    return bool(conn.open and conn.server_status & SERVER_STATUS.SERVER_STATUS_IN_TRANS)
+
+def finish_request_connection(response):
+    """
+    뷰의 결과에 따라 요청 범위 커넥션의 트랜잭션을 마무리한다.
+    응답 코드가 400 미만이면 커밋, 그 외에는 롤백한다.
+    뷰에서 이미 커밋/롤백했다면 열린 트랜잭션이 없으므로 아무 일도 하지 않는다.
+
+    Args:
+        response: 뷰가 만든 응답 객체
+
+    Returns:
+        response
+
+    Author:
+        김태수
+
+    History:
+        2026-10-18(김태수): 초기 생성
+    """
+    conn = g.get('db_conn', None)
+
+    if conn is not None and _in_transaction(conn):
+        if response.status_code < 400:
+            conn.commit()
+        else:
+            conn.rollback()
+
+    return response
+
+def release_request_connection(exception=None):
+    """
+    요청이 끝나면 요청 범위 커넥션을 풀에 반환한다.
+    처리되지 않은 예외로 끝났다면 열린 트랜잭션은 롤백된다.
+
+    Args:
+        exception: 요청 처리 중 발생한 예외
+
+    Author:
+        김태수
+
+    History:
+        2026-10-18(김태수): 초기 생성
+    """
+    conn = g.pop('db_conn', None)
+
+    if conn is not None:
+        # 반환할 때 풀이 열린 트랜잭션을 롤백한다.
+        conn.release()
+
+def register_connection_handlers(app):
+    """
+    요청 범위 커넥션을 마무리하는 핸들러를 앱에 등록한다.
+
+    Args:
+        app: Flask 앱 객체
+
+    Author:
+        김태수
+
+    History:
+        2026-10-18(김태수): 초기 생성
+    """
+    app.after_request(finish_request_connection)
+    app.teardown_request(release_request_connection)
@@ -26,4 +26,19 @@ class ProductIdListEmptyError(Exception):
 class InvalidDownloadTypeError(Exception):
     def __init__(self, message):
         super().__init__()
-        self.message = message
\ No newline at end of file
+        self.message = message
+
+class ExportJobNotFoundError(Exception):
+    def __init__(self, message):
+        super().__init__()
+        self.message = message
+
+class ExportJobLimitError(Exception):
+    def __init__(self, message):
+        super().__init__()
+        self.message = message
+
+class ExportJobNotReadyError(Exception):
+    def __init__(self, message):
+        super().__init__()
+        self.message = message
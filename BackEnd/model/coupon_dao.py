@@ -84,35 +84,35 @@ class CouponDao:
             if rows <= 0:
                 raise pymysql.err.InternalError(10101, "DAO_COULD_NOT_CREATE_COUPON_DETAIL")
 
-    def create_serial_number(self, conn, params):
+    def create_serial_numbers(self, conn, coupon_id, serial_numbers):
         """
-        시리얼 넘버 생성
+        시리얼 넘버 여러 개를 한 번에 생성
+        executemany 는 여러 줄 INSERT 문으로 묶어서 보낸다. (max_stmt_length 를 넘으면 여러 문장으로 나뉜다)
+        이미 있는 시리얼 넘버(유니크 키 중복)는 넣지 않고 건너뛴다.
 
         Args:
-            conn  : 데이터베이스 커넥션 객체
-            params: 입력 파라미터 딕셔너리
+            conn          : 데이터베이스 커넥션 객체
+            coupon_id     : 쿠폰 아이디
+            serial_numbers: 시리얼 넘버 리스트
 
         Returns:
-        
+            실제로 들어간 시리얼 넘버 개수
+
         Author:
-            이충희(choonghee.dev@gmail.com)
+            김태수
 
         History:
-            2020-10-09(이충희): 초기 생성
+            2026-10-18(김태수): 초기 생성
+            2026-10-18(김태수): 중복은 INSERT IGNORE 로 건너뛰고 들어간 개수 리턴
         """
         sql = """
-            INSERT INTO coupon_serial_numbers (
+            INSERT IGNORE INTO coupon_serial_numbers (
                 coupon_id,
                 serial_number
-            ) VALUES (
-                %s,
-                %s
-            );
+            ) VALUES (%s, %s)
         """
         with conn.cursor() as cursor:
-            rows = cursor.execute(sql, params)
-            if rows <= 0:
-                raise pymysql.err.InternalError(10101, "DAO_COULD_NOT_CREATE_COUPON_SERIAL_NUMBER")
+            return cursor.executemany(sql, [(coupon_id, serial_number) for serial_number in serial_numbers])
 
     def find_coupon_counts(self, conn, params):
         """
@@ -305,6 +305,37 @@ class CouponDao:
             results = cursor.fetchall()
             return results
 
+    def iter_serials_by_coupon_id(self, conn, coupon_id):
+        """
+        쿠폰 아이디로 시리얼 넘버를 한 줄씩 읽기 (서버 사이드 커서)
+        결과 전체를 메모리에 올리지 않으므로 다 읽을 때까지 커넥션을 다른 쿼리에 쓰면 안 된다.
+
+        Args:
+            conn     : 데이터베이스 커넥션 객체
+            coupon_id: 조회할 쿠폰 아이디
+
+        Returns:
+            시리얼 넘버 딕셔너리 제너레이터
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        sql = """
+            SELECT
+                s.serial_number,
+                s.used_date
+            FROM coupon_serial_numbers AS s
+            WHERE coupon_id = %s;
+        """
+
+        with conn.cursor(pymysql.cursors.SSDictCursor) as cursor:
+            cursor.execute(sql, (coupon_id,))
+            for row in cursor:
+                yield row
+
     def delete_serials(self, conn, coupon_id):
         """
         쿠폰 시리얼 넘버 삭제
@@ -307,22 +307,24 @@ class EventDao:
     def post_event_buttons(self, db, arguments):
         """
         기획전 버튼 등록 - Persistence Layer(model) function
+        버튼 전체를 INSERT 한 번으로 넣고, 넣은 순서대로 아이디를 다시 읽어온다.
         Args:
-            arguments = {
+            arguments = [{
                 'name'     : 기획전 버튼 명,
                 'order'    : 진열 순서,
                 'event_id' : 이벤트 아이디,
                 'is_exist' : 존재 여부
-            }
+            }]
             db = DATABASE Connection Instance
         Returns:
-            ''
+            button_ids : 넣은 순서대로의 버튼 아이디 리스트
 
             err.OperationalError : DB 에러
         Author:
             김태수
         History:
             2020-10-10 : 초기 생성
+            2026-10-18 : 버튼 여러 개를 한 번에 등록하도록 변경
         """
 
         sql = """
@@ -339,38 +341,58 @@ class EventDao:
         %(order)s,
         %(event_id)s,
         %(is_exist)s
-        );
+        )
+        """
+
+        # 새로 만든 기획전이므로 이 기획전의 버튼은 방금 넣은 것뿐이다.
+        # 한 INSERT 문 안에서는 아이디가 넣은 순서대로 증가한다.
+        select_sql = """
+        SELECT
+            id
+        FROM
+            event_buttons
+        WHERE
+            event_id = %(event_id)s
+        ORDER BY
+            id;
         """
 
         with db.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, arguments)
-            result = cursor.lastrowid
+            result = cursor.executemany(sql, arguments)
 
-            if not result:
+            if result != len(arguments):
                 raise err.OperationalError
 
-            return result
+            cursor.execute(select_sql, {'event_id':arguments[0]['event_id']})
+            button_ids = [row['id'] for row in cursor.fetchall()]
+
+            if len(button_ids) != len(arguments):
+                raise err.OperationalError
+
+            return button_ids
 
         raise err.OperationalError
 
     def post_product_events(self, db, arguments):
         """
         기획전 매핑 상품 - Persistence Layer(model) function
+        executemany 로 여러 줄 INSERT 한 번에 넣는다. (개수는 호출하는 쪽에서 나눠서 전달)
         Args:
-            arguments = {
+            arguments = [{
                 'product_id' : 상품 아이디,
                 'order'      : 진열 순서,
                 'button_id   : 버튼 아이디'
-            }
+            }]
             db = DATABASE Connection Instance
         Returns:
-            ''
+            result : 등록된 개수
 
             err.OperationalError : DB 에러
         Author:
             김태수
         History:
             2020-10-10 : 초기 생성
+            2026-10-18 : 상품 여러 개를 한 번에 등록하도록 변경
         """
 
         sql = """
@@ -385,13 +407,13 @@ class EventDao:
         %(product_id)s,
         %(order)s,
         %(button_id)s
-        );
+        )
         """
 
         with db.cursor(pymysql.cursors.DictCursor) as cursor:
-            result = cursor.execute(sql, arguments)
+            result = cursor.executemany(sql, arguments)
 
-            if not result:
+            if result != len(arguments):
                 raise err.OperationalError
 
             return result
@@ -409,7 +431,10 @@ class EventDao:
                 'start_date'   : 시작일자,
                 'end_date'     : 종료일자,
                 'is_exposed'   : 노출 여부,
-                'event_type'   : 기획전 타입
+                'event_type'   : 기획전 타입,
+                'cursor'       : 이전 페이지 마지막 기획전 번호 (None 이면 첫 페이지),
+                'limit'        : 가져올 개수,
+                'is_count_needed' : 전체 건수(total_count)를 함께 계산할지 여부
             }
             db = DATABASE Connection Instance
         Returns:
@@ -424,7 +449,8 @@ class EventDao:
                 'is_exposed'           : 노출여부,
                 'register_date'        : 등록일자,
                 'mapped_product_count' : 매핑 상품 수,
-                'view_count'           : 조회 수
+                'view_count'           : 조회 수,
+                'total_count'          : 전체 조회 건수 (is_count_needed 인 경우)
             }]
 
             err.OperationalError : DB 에러
@@ -432,6 +458,7 @@ class EventDao:
             김태수
         History:
             2020-10-11 : 초기 생성
+            2026-10-18 : 기획전 번호 기준 키셋 페이지네이션, 전체 건수, 날짜 형식을 쿼리에서 처리
         """
 
         sql_1 = """
@@ -441,13 +468,15 @@ class EventDao:
             es.name AS event_status_name,
             et.name AS event_type_name,
             ek.name AS event_kind_name,
-            ed.started_at AS started_at,
-            ed.ended_at AS ended_at,
+            DATE_FORMAT(ed.started_at, '%%Y-%%m-%%d %%H:%%i:%%S') AS started_at,
+            DATE_FORMAT(ed.ended_at, '%%Y-%%m-%%d %%H:%%i:%%S') AS ended_at,
             ed.is_event_exposed AS is_exposed,
-            ed.register_date AS register_date,
+            DATE_FORMAT(ed.register_date, '%%Y-%%m-%%d %%H:%%i:%%S') AS register_date,
             ed.mapped_product_count AS mapped_product_count,
             ed.view_count AS view_count
-        FROM
+        """
+
+        sql_from = """
             events e
         LEFT JOIN
             event_details ed
@@ -468,9 +497,17 @@ class EventDao:
 
         sql_2 = """
         ORDER BY
-            e.id DESC;
+            e.id DESC
+        LIMIT %(limit)s;
         """
 
+        # LIMIT 전에 세므로 조회 조건의 전체 건수와 같다.
+        if arguments['is_count_needed']:
+            sql_1 += ", COUNT(*) OVER() AS total_count"
+
+        sql_1 += """
+        FROM""" + sql_from
+
         # 기획전 명으로 검색
         if arguments['event_name'] != "%\%":
             sql_1 += " AND ed.name LIKE %(event_name)s"
@@ -495,6 +532,10 @@ class EventDao:
         if arguments['event_type']:
             sql_1 += " AND ed.event_type_id IN %(event_type)s"
 
+        # 이전 페이지 마지막 기획전 다음부터
+        if arguments['cursor']:
+            sql_1 += " AND e.id < %(cursor)s"
+
         sql = sql_1 + sql_2
 
         with db.cursor(pymysql.cursors.DictCursor) as cursor:
@@ -542,98 +583,96 @@ class EventDao:
 
         raise err.OperationalError
 
-    def get_event_status(self, db):
+    def update_event_statuses(self, db):
         """
-        기획전 상태 조회 - Persistence Layer(model) function
+        기획전 상태 일괄 변경 - Persistence Layer(model) function
+        시작일자 / 종료일자와 NOW() 를 비교하는 UPDATE 세 번으로 대기(3) / 진행중(1) / 종료(2) 상태를 맞춘다.
+        기획전 수와 상관없이 쿼리 수가 일정하다. (종료된 기획전은 다시 바꾸지 않는다)
         Args:
             db = DATABASE Connection Instance
         Returns:
-            result = [{
-                'event_id'        : 기획전 아이디,
-                'event_status_id' : 기획전 상태 아이디,
-                'started_at'      : 시작일자,
-                'ended_at'        : 종료일자
-            }]
+            result = {
+                'waiting'     : 대기로 바뀐 개수,
+                'in_progress' : 진행중으로 바뀐 개수,
+                'ended'       : 종료로 바뀐 개수
+            }
 
             err.OperationalError : DB 에러
         Author:
             김태수
         History:
-            2020-10-12 : 초기 생성
+            2026-10-18 : 초기 생성 (get_event_status / put_event_status 대체)
         """
 
         sql = """
-        SELECT
-            e.id AS event_id,
-            es.id AS event_status_id,
-            ed.started_at AS started_at,
-            ed.ended_at AS ended_at
-        FROM
-            events e
-        LEFT JOIN
+        UPDATE
             event_details ed
+        INNER JOIN
+            events e
             ON e.id = ed.event_id
-        LEFT JOIN
-            event_statuses es
-            ON ed.event_status_id = es.id
-        LEFT JOIN
-            event_types et
-            ON et.id = ed.event_type_id
-        LEFT JOIN
-            event_kinds ek
-            ON ek.id = ed.event_kind_id
+        SET
+            ed.event_status_id = %(event_status_id)s
         WHERE
             e.is_deleted = 0
-            AND es.id IN (1, 3)
             AND ed.expired_at = '9999-12-31'
-        ORDER BY
-            e.id DESC;
+            AND ed.event_status_id IN %(from_status_ids)s
         """
 
+        # (바뀔 상태, 바뀌기 전 상태, 조건)
+        transitions = (
+            ('waiting',     3, (1,),   'ed.started_at > NOW()'),
+            ('in_progress', 1, (3,),   'ed.started_at <= NOW() AND ed.ended_at >= NOW()'),
+            ('ended',       2, (1, 3), 'ed.ended_at < NOW()')
+        )
+
+        result = {}
+
         with db.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql)
-            result = cursor.fetchall()
+            for name, event_status_id, from_status_ids, condition in transitions:
+                result[name] = cursor.execute(sql + f' AND {condition};', {
+                    'event_status_id' : event_status_id,
+                    'from_status_ids' : from_status_ids
+                })
 
             return result
 
         raise err.OperationalError
 
-    def put_event_status(self, db, arguments):
+    def increase_view_counts(self, db, view_counts):
         """
-        기획전 상태 변경 - Persistence Layer(model) function
+        기획전 조회수 일괄 증가 - Persistence Layer(model) function
+        여러 기획전의 조회수를 UPDATE ... CASE 한 번으로 더한다.
         Args:
-            arguments = {
-                'event_status_id' : 기획전 상태 아이디,
-                'event_id'        : 기획전 아이디
-            }
+            view_counts = [(기획전 아이디, 더할 조회수)]
             db = DATABASE Connection Instance
         Returns:
-            ''
+            result : 변경된 row 수
 
-            ValueError           : 잘못된 인자 입력시 발생
             err.OperationalError : DB 에러
         Author:
             김태수
         History:
-            2020-10-12 : 초기 생성
+            2026-10-18 : 초기 생성
         """
 
         sql = """
         UPDATE
             event_details
         SET
-            event_status_id = %(event_status_id)s
+            view_count = view_count + CASE event_id
+        """ + " WHEN %s THEN %s" * len(view_counts) + """
+            END
         WHERE
-            event_id = %(event_id)s
+            event_id IN %s
             AND expired_at = '9999-12-31';
         """
 
+        arguments = [value for view_count in view_counts for value in view_count]
+        arguments.append([event_id for event_id, count in view_counts])
+
         with db.cursor(pymysql.cursors.DictCursor) as cursor:
             result = cursor.execute(sql, arguments)
 
-            if not result:
-                raise ValueError
-
-            return ''
+            return result
 
         raise err.OperationalError
@@ -1,46 +1,30 @@
+import json
 import pymysql
 
 from pymysql    import err
 from connection import get_connection
 
 class OrderDao:
-    def get_order_data_count(self, db, arguments):
+    def make_order_filter_sql(self, arguments):
         """
-        주문 정보 조회 건수 - Persistence Layer(model) function
+        주문 리스트 / 건수 조회에서 함께 쓰는 FROM, WHERE 절 만들기
         Args:
-            arguments = {
-                'start_date'        : 조회 시작일,
-                'end_date'          : 조회 종료일,
-                'status_id'         : 주문 상태 아이디,
-                'order_number'      : 주문 번호(검색),
-                'detail_number'     : 주문 상세 번호(검색),
-                'user_name'         : 주문자명(검색),
-                'phone_number'      : 핸드폰번호(검색),
-                'seller_name'       : 셀러명(검색),
-                'product_name'      : 상품명(검색),
-                'seller_properties' : 셀러속성(검색),
-                'offset'            : 페이지네이션 시작지점,
-                'limit'             : 전달할 주문 리스트 개수
-            }
-            db = DATABASE Connection Instance
+            arguments = get_order_data 와 같음
         Returns :
-            order_data = {
-                "count" : 전체 조회 건수
-            }
-
-            err.OperationalError : DB 에러 발생 시 반환
+            FROM ~ WHERE 조건까지의 SQL 문자열
         Author :
             김태수
         History:
-            2020-10-13 : 초기 생성
+            2026-10-18 : 초기 생성 (get_order_data, get_order_data_count 에서 분리)
+            2026-10-18 : 상태 변경 내역 대신 현재 상태 테이블(order_detail_current_statuses)로 조회
         """
 
-        sql_1 = """
-        SELECT
-            COUNT(DISTINCT d.id) AS count
+        sql = """
         FROM
-            order_details d
+            order_detail_current_statuses cs
 
+            INNER JOIN order_details d
+                ON d.id = cs.order_detail_id
             LEFT JOIN orders o
                 ON d.order_id = o.id
             LEFT JOIN options i
@@ -55,56 +39,85 @@ class OrderDao:
                 ON pd.id = i.product_id
             LEFT JOIN seller_informations sl
                 ON sl.id = p.seller_id
-            LEFT JOIN order_status_modification_histories osmh
-                ON osmh.order_detail_id = d.id
             LEFT JOIN order_cancel_reasons ocr
                 ON d.order_cancel_reason_id = ocr.id
             LEFT JOIN order_refund_reasons orr
                 ON d.order_refund_reason_id = orr.id
         WHERE
-            osmh.updated_at >= %(start_date)s
-            AND osmh.updated_at <= %(end_date)s
-            AND d.order_detail_statuses_id = %(status_id)s
+            cs.order_status_id = %(status_id)s
+            AND cs.entered_at >= %(start_date)s
+            AND cs.entered_at <= %(end_date)s
             AND sl.seller_property_id IN %(seller_properties)s
-            AND osmh.order_status_id = %(status_id)s
-        """
-        sql_2 = """
-        ORDER BY osmh.updated_at DESC;
         """
 
         # 주문 번호로 검색
         if arguments['order_number'] != "%\%":
-            sql_1 += " AND o.order_number LIKE %(order_number)s"
+            sql += " AND o.order_number LIKE %(order_number)s"
 
         # 주문 상세 번호로 검색
         elif arguments['detail_number'] != "%\%":
-            sql_1 += " AND d.order_detail_number LIKE %(detail_number)s"
+            sql += " AND d.order_detail_number LIKE %(detail_number)s"
 
         # 주문자명으로 검색
         elif arguments['user_name'] != "%\%":
-            sql_1 += " AND d.orderer_name LIKE %(user_name)s"
+            sql += " AND d.orderer_name LIKE %(user_name)s"
 
         # 핸드폰 번호로 검색
         elif arguments['phone_number'] != "%\%":
-            sql_1 += " AND d.phone_number LIKE %(phone_number)s"
+            sql += " AND d.phone_number LIKE %(phone_number)s"
 
         # 셀러명으로 검색
         elif arguments['seller_name'] != "%\%":
-            sql_1 += " AND sl.korean_name LIKE %(seller_name)s"
+            sql += " AND sl.korean_name LIKE %(seller_name)s"
 
         # 상품명으로 검색
         elif arguments['product_name'] != "%\%":
-            sql_1 += " AND pd.name LIKE %(product_name)s"
+            sql += " AND pd.name LIKE %(product_name)s"
 
         # 주문 취소 사유로 검색
         if arguments['order_cancel_reason']:
-            sql_1 += " AND ocr.name = %(order_cancel_reason)s"
+            sql += " AND ocr.name = %(order_cancel_reason)s"
 
         # 환불 요청 사유로 검색
         elif arguments['order_refund_reason']:
-            sql_1 += " AND orr.name = %(order_refund_reason)s"
+            sql += " AND orr.name = %(order_refund_reason)s"
 
-        sql = sql_1 + sql_2
+        return sql
+
+    def get_order_data_count(self, db, arguments):
+        """
+        주문 정보 조회 건수 - Persistence Layer(model) function
+        Args:
+            arguments = {
+                'start_date'        : 조회 시작일,
+                'end_date'          : 조회 종료일,
+                'status_id'         : 주문 상태 아이디,
+                'order_number'      : 주문 번호(검색),
+                'detail_number'     : 주문 상세 번호(검색),
+                'user_name'         : 주문자명(검색),
+                'phone_number'      : 핸드폰번호(검색),
+                'seller_name'       : 셀러명(검색),
+                'product_name'      : 상품명(검색),
+                'seller_properties' : 셀러속성(검색),
+                'offset'            : 페이지네이션 시작지점,
+                'limit'             : 전달할 주문 리스트 개수
+            }
+            db = DATABASE Connection Instance
+        Returns :
+            order_data = {
+                "count" : 전체 조회 건수
+            }
+
+            err.OperationalError : DB 에러 발생 시 반환
+        Author :
+            김태수
+        History:
+            2020-10-13 : 초기 생성
+            2026-10-18 : 조건절을 make_order_filter_sql 로 분리, 불필요한 ORDER BY 제거
+            2026-10-18 : 현재 상태 테이블 기준으로 세도록 변경 (주문 상세당 한 줄)
+        """
+
+        sql = "SELECT COUNT(*) AS count" + self.make_order_filter_sql(arguments)
 
         with db.cursor(pymysql.cursors.DictCursor) as cursor:
             cursor.execute(sql, arguments)
@@ -130,7 +143,11 @@ class OrderDao:
                 'product_name'      : 상품명(검색),
                 'seller_properties' : 셀러속성(검색),
                 'offset'            : 페이지네이션 시작지점,
-                'limit'             : 전달할 주문 리스트 개수
+                'limit'             : 전달할 주문 리스트 개수,
+                'is_cursor_mode'    : 커서 페이지네이션 여부,
+                'cursor_updated_at' : 이전 페이지 마지막 주문의 현재 상태 변경일자 (첫 페이지는 None),
+                'cursor_id'         : 이전 페이지 마지막 주문 상세 아이디 (첫 페이지는 None),
+                'is_count_needed'   : 전체 건수(total_count)를 함께 계산할지 여부
             }
             db = DATABASE Connection Instance
         Returns :
@@ -141,13 +158,16 @@ class OrderDao:
                 "order_detail_number" : 주문상세번호,
                 "order_number"        : 주문 번호,
                 "current_updated_at"  : 현재 상태 업데이트 일자,
+                "payment_complete"    : 결제완료 일시,
+                "shipping_started_at" : 배송시작 일시,
                 "phone_number"        : 핸드폰 번호,
                 "product_name"        : 상품명,
                 "quantity"            : 수량,
                 "seller_name"         : 셀러명,
                 "user_name"           : 주문자명,
                 "order_cancel_reason" : 주문 취소 사유,
-                "order_refund_reason" : 환불 요청 사유
+                "order_refund_reason" : 환불 요청 사유,
+                "total_count"         : 전체 조회 건수 (is_count_needed 인 경우)
             }]
 
             err.OperationalError : DB 에러
@@ -158,6 +178,10 @@ class OrderDao:
             2020-09-28 : 조건 별로 쿼리문 다르게 수정
             2020-09-29 : 결제 일자 기준이 아닌 현재 상태 기준으로 조회하도록 변경
             2020-10-04 : 스키마 변경에 따른 테이블 참조 수정
+            2026-10-18 : (현재 상태 변경일자, 주문 상세 아이디) 커서 페이지네이션 추가
+            2026-10-18 : 윈도우 함수로 전체 건수를 같은 쿼리에서 계산
+            2026-10-18 : 현재 상태 테이블에서 상태 일자를 읽고 GROUP BY 제거
+            2026-10-18 : 커서 조건을 인덱스 범위 검색이 되는 WHERE 조건으로 정리
         """
 
         sql_1 = """
@@ -171,79 +195,43 @@ class OrderDao:
             pd.name AS product_name,
             sl.korean_name AS seller_name,
             d.phone_number AS phone_number,
-            MAX(osmh.updated_at) AS current_updated_at,
+            cs.entered_at AS current_updated_at,
+            cs.payment_completed_at AS payment_complete,
+            cs.shipping_started_at AS shipping_started_at,
             CONCAT(c.name, "/", z.name) AS option_info,
             ocr.name AS order_cancel_reason,
             orr.name AS order_refund_reason
-        FROM
-            order_details d
-
-            LEFT JOIN orders o
-                ON d.order_id = o.id
-            LEFT JOIN options i
-                ON d.option_id = i.id
-            LEFT JOIN colors c
-                ON i.color_id = c.id
-            LEFT JOIN sizes z
-                ON i.size_id = z.id
-            LEFT JOIN products p
-                ON i.product_id = p.id
-            LEFT JOIN product_details pd
-                ON pd.id = i.product_id
-            LEFT JOIN seller_informations sl
-                ON sl.id = p.seller_id
-            LEFT JOIN order_status_modification_histories osmh
-                ON osmh.order_detail_id = d.id
-            LEFT JOIN order_cancel_reasons ocr
-                ON d.order_cancel_reason_id = ocr.id
-            LEFT JOIN order_refund_reasons orr
-                ON d.order_refund_reason_id = orr.id
-        WHERE
-            osmh.updated_at >= %(start_date)s
-            AND osmh.updated_at <= %(end_date)s
-            AND d.order_detail_statuses_id = %(status_id)s
-            AND sl.seller_property_id IN %(seller_properties)s
-            AND osmh.order_status_id = %(status_id)s
         """
-        sql_2 = """
-        GROUP BY d.id
-        ORDER BY osmh.updated_at DESC
-        LIMIT %(limit)s OFFSET %(offset)s;
-        """
-
-        # 주문 번호로 검색
-        if arguments['order_number'] != "%\%":
-            sql_1 += " AND o.order_number LIKE %(order_number)s"
-
-        # 주문 상세 번호로 검색
-        elif arguments['detail_number'] != "%\%":
-            sql_1 += " AND d.order_detail_number LIKE %(detail_number)s"
-
-        # 주문자명으로 검색
-        elif arguments['user_name'] != "%\%":
-            sql_1 += " AND d.orderer_name LIKE %(user_name)s"
-
-        # 핸드폰 번호로 검색
-        elif arguments['phone_number'] != "%\%":
-            sql_1 += " AND d.phone_number LIKE %(phone_number)s"
-
-        # 셀러명으로 검색
-        elif arguments['seller_name'] != "%\%":
-            sql_1 += " AND sl.korean_name LIKE %(seller_name)s"
-
-        # 상품명으로 검색
-        elif arguments['product_name'] != "%\%":
-            sql_1 += " AND pd.name LIKE %(product_name)s"
 
-        # 주문 취소 사유로 검색
-        if arguments['order_cancel_reason']:
-            sql_1 += " AND ocr.name = %(order_cancel_reason)s"
+        # LIMIT 전에 세므로 조회 조건의 전체 건수와 같다.
+        if arguments['is_count_needed']:
+            sql_1 += ", COUNT(*) OVER() AS total_count"
+
+        sql_2 = ""
+
+        # 이전 페이지 마지막 주문 다음부터 (현재 상태 변경일자 최신순, 아이디 역순)
+        # OR 조건만으로는 인덱스 범위 검색을 못 할 수 있으므로, 앞의 entered_at <= 조건으로
+        # (order_status_id, entered_at, order_detail_id) 인덱스를 커서 위치부터 읽게 한다.
+        if arguments['is_cursor_mode'] and arguments['cursor_updated_at']:
+            sql_2 += """
+            AND cs.entered_at <= %(cursor_updated_at)s
+            AND (
+                cs.entered_at < %(cursor_updated_at)s
+                OR
+                (cs.entered_at = %(cursor_updated_at)s AND cs.order_detail_id < %(cursor_id)s)
+            )
+            """
+
+        sql_2 += """
+        ORDER BY cs.entered_at DESC, cs.order_detail_id DESC
+        """
 
-        # 환불 사유로 검색
-        elif arguments['order_refund_reason']:
-            sql_1 += " AND orr.name = %(order_refund_reason)s"
+        if arguments['is_cursor_mode']:
+            sql_2 += " LIMIT %(limit)s;"
+        else:
+            sql_2 += " LIMIT %(limit)s OFFSET %(offset)s;"
 
-        sql = sql_1 + sql_2
+        sql = sql_1 + self.make_order_filter_sql(arguments) + sql_2
 
         with db.cursor(pymysql.cursors.DictCursor) as cursor:
             cursor.execute(sql, arguments)
@@ -253,49 +241,47 @@ class OrderDao:
 
         raise err.OperationalError
 
-    def get_status_date(self, db, argument):
+    def iter_order_data_for_download(self, db, arguments):
         """
-         변경일자 정보 - Persistence Layer(model) function
+        주문 리스트 다운로드용 조회 (서버 사이드 커서) - Persistence Layer(model) function
+        결과를 클라이언트 메모리에 모두 올리지 않고 읽는 만큼만 받아온다.
+        다 읽을 때까지 같은 커넥션으로 다른 쿼리를 실행할 수 없다.
         Args:
-            arguments = {
-                "order_detail_id" : 주문 상세 아이디,
-                "status_id"       : 주문 상태 아이디
-            }
+            arguments = make_order_filter_sql 조건과 같음 (offset, limit 없음)
             db = DATABASE Connection Instance
         Returns :
-            status_date = {
-                "updated_at" : 변경 일자
-            }
-
-            ValueError           : 인자로 잘못된 값이 들어왔을 경우 발생
-            err.OperationalError : DB 에러 발생 시 반환
+            주문 딕셔너리 제너레이터 (결제완료 / 배송시작 일시 포함)
         Author :
             김태수
         History:
-            2020-09-28 : 초기 생성
-            2020-09-29 : 현재 상태 업데이트 일자 > 결제일자 > 변경일자
+            2026-10-18 : 초기 생성
         """
 
         sql = """
         SELECT
-            updated_at
-        FROM
-            order_status_modification_histories
-        WHERE
-            order_detail_id = %(order_detail_id)s
-            AND order_status_id = %(status_id)s;
+            d.id AS id,
+            cs.entered_at AS current_updated_at,
+            cs.payment_completed_at AS payment_complete,
+            cs.shipping_started_at AS shipping_started_at,
+            o.order_number AS order_number,
+            d.order_detail_number AS order_detail_number,
+            sl.korean_name AS seller_name,
+            pd.name AS product_name,
+            CONCAT(c.name, "/", z.name) AS option_info,
+            d.quantity AS quantity,
+            d.orderer_name AS user_name,
+            d.phone_number AS phone_number,
+            o.final_price AS final_price,
+            ocr.name AS order_cancel_reason,
+            orr.name AS order_refund_reason
+        """ + self.make_order_filter_sql(arguments) + """
+        ORDER BY cs.entered_at DESC, cs.order_detail_id DESC;
         """
 
-        with db.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, argument)
-            status_date = cursor.fetchone()
-
-            if not status_date:
-                raise ValueError
-
-            return status_date
-
-        raise err.OperationalError
+        with db.cursor(pymysql.cursors.SSDictCursor) as cursor:
+            cursor.execute(sql, arguments)
+            for row in cursor:
+                yield row
 
     def get_order_status_id(self, db, argument):
         """생
@@ -389,14 +375,14 @@ class OrderDao:
 
         raise err.OperationalError
 
-    def insert_order_status_history(self, db, arguments):
+    def insert_order_status_histories(self, db, histories):
         """
-        주문 상태 변경내역 업데이트 - Persistence Layer(model) function
+        주문 상태 변경내역 일괄 추가 - Persistence Layer(model) function
+        여러 줄을 INSERT 한 번으로 넣는다.
+        현재 상태 테이블(order_detail_current_statuses)과 상태별 건수(order_status_counts)는
+        내역 테이블의 AFTER INSERT 트리거가 갱신한다.
         Args:
-            arguments = {
-                "status_id"       : 상태아이디,
-                "order_detail_id" : 주문 상세 아이디
-            }
+            histories = [(주문 상세 아이디, 변경된 상태 아이디)]
             db = DATABASE Connection Instance
         Returns :
             ''
@@ -404,23 +390,303 @@ class OrderDao:
         Author :
             김태수
         History:
-            2020-09-28 : 초기 생성
+            2020-09-28 : 초기 생성 (insert_order_status_history)
+            2026-10-18 : 같은 트랜잭션에서 현재 상태 테이블(order_detail_current_statuses) 갱신
+            2026-10-18 : 주문 상세마다 넣지 않고 여러 줄을 한 번에 넣도록 변경
+            2026-10-18 : 주문 상태별 건수(order_status_counts) 함께 갱신
+            2026-10-18 : 현재 상태 테이블 갱신을 트리거로 옮김 (쇼핑몰에서 넣는 주문 내역도 반영)
+            2026-10-18 : 상태별 건수 갱신도 트리거로 옮김
         """
 
+        if not histories:
+            return ''
+
+        # NOW() 가 있어 executemany 가 한 문장으로 묶지 못하므로 VALUES 를 직접 만든다.
         sql = """
         INSERT INTO
             order_status_modification_histories (order_detail_id, updated_at, order_status_id)
         VALUES
-            (%(order_detail_id)s, NOW(), %(to_status)s);
+        """ + ", ".join(["(%s, NOW(), %s)"] * len(histories)) + ";"
+
+        with db.cursor(pymysql.cursors.DictCursor) as cursor:
+            result = cursor.execute(sql, [value for history in histories for value in history])
+
+            if result != len(histories):
+                raise err.OperationalError
+
+            return ''
+
+        raise err.OperationalError
+
+    def reconcile_order_status_counts(self, db, arguments):
+        """
+        주문 상태별 건수를 현재 상태 테이블 기준으로 다시 계산 - Persistence Layer(model) function
+        테이블 전체를 지우고 다시 넣지 않고, 기간 안에서 값이 다른 (상태, 셀러 속성, 진입 일자) 줄만 고치고
+        더 이상 없는 줄만 지운다. 트리거가 같은 테이블을 갱신하므로 락은 이 기간의 줄에만 잡는다.
+        Args:
+            arguments = {
+                'start_date' : 시작 일자 (포함),
+                'end_date'   : 끝 일자 (포함하지 않음)
+            }
+            db = DATABASE Connection Instance
+        Returns :
+            고치거나 지운 줄 수 (ON DUPLICATE KEY UPDATE 로 고친 줄은 2 로 센다)
+            err.OperationalError : DB 에러 발생 시 반환
+        Author :
+            김태수
+        History:
+            2026-10-18 : 초기 생성
+            2026-10-18 : 전체 삭제 후 다시 넣던 방식에서 기간 안의 다른 줄만 고치도록 변경
+        """
+
+        # 기간 안의 올바른 건수
+        counts_sql = """
+            SELECT
+                cs.order_status_id,
+                sl.seller_property_id,
+                DATE(cs.entered_at) AS bucket_date,
+                COUNT(*) AS count
+            FROM
+                order_detail_current_statuses cs
+
+                INNER JOIN order_details d
+                    ON d.id = cs.order_detail_id
+                INNER JOIN options i
+                    ON d.option_id = i.id
+                INNER JOIN products p
+                    ON i.product_id = p.id
+                INNER JOIN seller_informations sl
+                    ON sl.id = p.seller_id
+            WHERE
+                cs.entered_at >= %(start_date)s
+                AND cs.entered_at < %(end_date)s
+            GROUP BY
+                cs.order_status_id,
+                sl.seller_property_id,
+                DATE(cs.entered_at)
+        """
+
+        upsert_sql = """
+        INSERT INTO
+            order_status_counts (order_status_id, seller_property_id, bucket_date, count)
+        SELECT
+            c.order_status_id,
+            c.seller_property_id,
+            c.bucket_date,
+            c.count
+        FROM
+            (""" + counts_sql + """) c
+
+            LEFT JOIN order_status_counts oc
+                ON oc.order_status_id = c.order_status_id
+                AND oc.seller_property_id = c.seller_property_id
+                AND oc.bucket_date = c.bucket_date
+        WHERE
+            oc.count IS NULL
+            OR oc.count <> c.count
+        ON DUPLICATE KEY UPDATE
+            count = VALUES(count);
+        """
+
+        delete_sql = """
+        DELETE
+            oc
+        FROM
+            order_status_counts oc
+
+            LEFT JOIN (""" + counts_sql + """) c
+                ON c.order_status_id = oc.order_status_id
+                AND c.seller_property_id = oc.seller_property_id
+                AND c.bucket_date = oc.bucket_date
+        WHERE
+            oc.bucket_date >= %(start_date)s
+            AND oc.bucket_date < %(end_date)s
+            AND c.order_status_id IS NULL;
+        """
+
+        with db.cursor(pymysql.cursors.DictCursor) as cursor:
+            result  = cursor.execute(upsert_sql, arguments)
+            result += cursor.execute(delete_sql, arguments)
+
+            return result
+
+        raise err.OperationalError
+
+    def get_first_order_status_date(self, db):
+        """
+        주문 상태별 건수를 다시 계산할 가장 앞선 일자 - Persistence Layer(model) function
+        Args:
+            db = DATABASE Connection Instance
+        Returns :
+            현재 상태 진입 일자와 상태별 건수 일자 중 가장 앞선 일자 (없으면 오늘)
+        Author :
+            김태수
+        History:
+            2026-10-18 : 초기 생성
+        """
+
+        sql = """
+        SELECT
+            LEAST(
+                COALESCE((SELECT DATE(MIN(entered_at)) FROM order_detail_current_statuses), CURDATE()),
+                COALESCE((SELECT MIN(bucket_date) FROM order_status_counts), CURDATE())
+            ) AS first_date;
+        """
+
+        with db.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute(sql)
+
+            return cursor.fetchone()['first_date']
+
+        raise err.OperationalError
+
+    def get_order_status_counts(self, db, arguments):
+        """
+        주문 상태별 건수 조회 - Persistence Layer(model) function
+        Args:
+            arguments = {
+                'start_date'        : 조회 시작일 (상태 진입 일자),
+                'end_date'          : 조회 종료일 (상태 진입 일자),
+                'seller_properties' : 셀러속성 리스트 (None 이면 전체)
+            }
+            db = DATABASE Connection Instance
+        Returns :
+            order_status_counts = [{
+                'order_status_id'    : 주문 상태 아이디,
+                'seller_property_id' : 셀러 속성 아이디,
+                'bucket_date'        : 상태 진입 일자,
+                'count'              : 건수
+            }]
+
+            err.OperationalError : DB 에러 발생 시 반환
+        Author :
+            김태수
+        History:
+            2026-10-18 : 초기 생성
+        """
+
+        sql = """
+        SELECT
+            order_status_id,
+            seller_property_id,
+            bucket_date,
+            count
+        FROM
+            order_status_counts
+        WHERE
+            bucket_date >= %(start_date)s
+            AND bucket_date <= %(end_date)s
+            AND count <> 0
+        """
+
+        if arguments['seller_properties']:
+            sql += " AND seller_property_id IN %(seller_properties)s"
+
+        with db.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute(sql, arguments)
+            order_status_counts = cursor.fetchall()
+
+            return order_status_counts
+
+        raise err.OperationalError
+
+    def backfill_current_statuses(self, db, arguments):
+        """
+        상태 변경 내역으로 현재 상태 테이블 채우기 - Persistence Layer(model) function
+        이미 있는 줄은 내역 기준으로 다시 맞춘다.
+        Args:
+            arguments = {
+                'start_id' : 이 주문 상세 아이디 초과부터,
+                'end_id'   : 이 주문 상세 아이디 이하까지
+            }
+            db = DATABASE Connection Instance
+        Returns :
+            반영된 줄 수
+
+            err.OperationalError : DB 에러 발생 시 반환
+        Author :
+            김태수
+        History:
+            2026-10-18 : 초기 생성
+        """
+
+        sql = """
+        INSERT INTO
+            order_detail_current_statuses (
+                order_detail_id,
+                order_status_id,
+                entered_at,
+                payment_completed_at,
+                shipping_started_at
+            )
+        SELECT
+            s.order_detail_id,
+            s.order_status_id,
+            s.entered_at,
+            s.payment_completed_at,
+            s.shipping_started_at
+        FROM (
+            SELECT
+                d.id AS order_detail_id,
+                d.order_detail_statuses_id AS order_status_id,
+                (
+                    SELECT MAX(h.updated_at) FROM order_status_modification_histories h
+                    WHERE h.order_detail_id = d.id AND h.order_status_id = d.order_detail_statuses_id
+                ) AS entered_at,
+                (
+                    SELECT MIN(h.updated_at) FROM order_status_modification_histories h
+                    WHERE h.order_detail_id = d.id AND h.order_status_id = 1
+                ) AS payment_completed_at,
+                (
+                    SELECT MIN(h.updated_at) FROM order_status_modification_histories h
+                    WHERE h.order_detail_id = d.id AND h.order_status_id = 3
+                ) AS shipping_started_at
+            FROM
+                order_details d
+            WHERE
+                d.id > %(start_id)s
+                AND d.id <= %(end_id)s
+        ) AS s
+        WHERE
+            s.entered_at IS NOT NULL
+        ON DUPLICATE KEY UPDATE
+            order_status_id      = VALUES(order_status_id),
+            entered_at           = VALUES(entered_at),
+            payment_completed_at = VALUES(payment_completed_at),
+            shipping_started_at  = VALUES(shipping_started_at);
         """
 
         with db.cursor(pymysql.cursors.DictCursor) as cursor:
             result = cursor.execute(sql, arguments)
 
-            if not result:
-                raise
+            return result
 
-            return ''
+        raise err.OperationalError
+
+    def get_max_order_detail_id(self, db):
+        """
+        가장 큰 주문 상세 아이디 - Persistence Layer(model) function
+        Args:
+            db = DATABASE Connection Instance
+        Returns :
+            주문 상세 아이디 (주문이 없으면 0)
+        Author :
+            김태수
+        History:
+            2026-10-18 : 초기 생성
+        """
+
+        sql = """
+        SELECT
+            COALESCE(MAX(id), 0) AS max_id
+        FROM
+            order_details;
+        """
+
+        with db.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute(sql)
+
+            return cursor.fetchone()['max_id']
 
         raise err.OperationalError
 
@@ -456,7 +722,11 @@ class OrderDao:
                 "user_phone_number"     : 주문자휴대폰번호,
                 "order_cancel_reason"   : 주문 취소 사유,
                 "order_refund_reason""  : 환불 요청 사유,
-                "cancel_refund_detail_description" : 취소/환불 상세 사유
+                "cancel_refund_detail_description" : 취소/환불 상세 사유,
+                "order_status_history"  : [{
+                    "date"         : 날짜,
+                    "order_status" : 주문상태
+                }]
             }
 
             ValueError           : 잘못된 인자 전달시 발생
@@ -466,15 +736,16 @@ class OrderDao:
         History:
             2020-09-28 : 초기 생성
             2020-10-04 : 스키마 수정에 따른 참조 테이블명 수정
+            2026-10-18 : 상태 변경 내역을 JSON 으로 함께 조회, 날짜 형식을 SQL 에서 맞춤
         """
 
         sql = """
         SELECT
             d.order_detail_number AS order_detail_number,
             o.order_number AS order_number,
-            o.order_date AS order_date,
+            DATE_FORMAT(o.order_date, '%%Y-%%m-%%d %%H:%%i:%%s') AS order_date,
             o.final_price AS final_price,
-            osmh.updated_at AS payment_complete,
+            DATE_FORMAT(osmh.updated_at, '%%Y-%%m-%%d %%H:%%i:%%s') AS payment_complete,
             d.orderer_phone_number AS user_phone_number,
             p.id AS product_id,
             pd.name AS product_name,
@@ -492,7 +763,21 @@ class OrderDao:
             d.shipping_memo AS shipping_memo,
             ocr.name AS order_cancel_reason,
             orr.name AS order_refund_reason,
-            d.order_refund_reason_description AS cancel_refund_detail_description
+            d.order_refund_reason_description AS cancel_refund_detail_description,
+            (
+                SELECT
+                    JSON_ARRAYAGG(JSON_OBJECT(
+                        'id', h.id,
+                        'date', DATE_FORMAT(h.updated_at, '%%Y-%%m-%%d %%H:%%i:%%s'),
+                        'order_status', os.name
+                    ))
+                FROM
+                    order_status_modification_histories h
+                LEFT JOIN order_statuses os
+                    ON os.id = h.order_status_id
+                WHERE
+                    h.order_detail_id = d.id
+            ) AS order_status_history
         FROM
             order_details d
         LEFT JOIN orders o
@@ -530,52 +815,15 @@ class OrderDao:
             if not order_detail_data:
                 raise ValueError
 
-            return order_detail_data
-
-        raise err.OperationalError
+            # JSON_ARRAYAGG 는 순서를 보장하지 않으므로 내역 아이디(입력 순서)로 정렬한다.
+            order_status_history = json.loads(order_detail_data['order_status_history'] or '[]')
+            order_status_history.sort(key=lambda history: history['id'])
+            for history in order_status_history:
+                del history['id']
 
-    def get_order_status_history(self, db, arguments):
-        """
-        주문 상태 변경 내역 - Persistence Layer(model) function
-        Args:
-            arguments = {
-                'order_detail_id' : 주문상세번호
-            }
-            db = DATABASE Connection Instance
-        Returns :
-            order_status_history = [{
-                "date"         : 날짜,
-                "order_status" : 주문상태
-            }]
+            order_detail_data['order_status_history'] = order_status_history
 
-            ValueError           : 잘못된 인자 전달시 발생
-            err.OperationalError : DB 에러 발생 시 반환
-        Author :
-            김태수
-        History:
-            2020-09-29 : 초기 생성
-        """
-
-        sql = """
-        SELECT
-            osmh.updated_at AS date,
-            os.name AS order_status
-        FROM
-            order_status_modification_histories osmh
-        LEFT JOIN order_statuses os
-            ON os.id = osmh.order_status_id
-        WHERE
-            osmh.order_detail_id = %(order_detail_id)s;
-        """
-
-        with db.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, arguments)
-            order_status_history = cursor.fetchall()
-
-            if not order_status_history:
-                raise ValueError
-
-            return order_status_history
+            return order_detail_data
 
         raise err.OperationalError
 
@@ -661,49 +909,93 @@ class OrderDao:
 
         raise err.OperationalError
 
-    def get_order_current_status(self, db, arguments):
+    def get_order_statuses(self, db, arguments):
         """
-        환불 요청 이전의 상태 조회 - Persistence Layer(model) function
+        주문 상세들의 현재 상태 조회 (상태 변경이 끝날 때까지 잠금) - Persistence Layer(model) function
         Args:
             arguments = {
-                'order_detail_id' : 주문 상세 아이디
+                'order_detail_ids' : 주문 상세 아이디 리스트
             }
             db = DATABASE Connection Instance
         Returns :
-            current_state = {
-                'order_status_id' : 환불 요청 이전의 상태 아이디
-            }
+            order_statuses = [{
+                'id'              : 주문 상세 아이디,
+                'order_status_id' : 현재 상태 아이디
+            }]
 
-            ValueError           : 잘못된 인자 전달시 발생
             err.OperationalError : DB 에러 발생 시 반환
         Author :
             김태수
         History:
-            2020-10-04 : 초기 생성
+            2026-10-18 : 초기 생성
         """
 
         sql = """
         SELECT
-            order_status_id
+            id,
+            order_detail_statuses_id AS order_status_id
         FROM
-            order_status_modification_histories
+            order_details
         WHERE
-            order_detail_id = %(order_detail_id)s
-            AND order_status_id IN (3, 4)
-        ORDER BY
-            id DESC
-        LIMIT
-            1;
+            id IN %(order_detail_ids)s
+        FOR UPDATE;
         """
 
         with db.cursor(pymysql.cursors.DictCursor) as cursor:
             cursor.execute(sql, arguments)
-            current_status = cursor.fetchone()
+            order_statuses = cursor.fetchall()
 
-            if not current_status:
-                raise ValueError
+            return order_statuses
+
+        raise err.OperationalError
+
+    def get_order_previous_statuses(self, db, arguments):
+        """
+        환불 요청 이전의 상태 조회 - Persistence Layer(model) function
+        Args:
+            arguments = {
+                'order_detail_ids' : 주문 상세 아이디 리스트
+            }
+            db = DATABASE Connection Instance
+        Returns :
+            previous_statuses = [{
+                'order_detail_id' : 주문 상세 아이디,
+                'order_status_id' : 환불 요청 이전의 상태 아이디
+            }]
+
+            err.OperationalError : DB 에러 발생 시 반환
+        Author :
+            김태수
+        History:
+            2020-10-04 : 초기 생성 (get_order_current_status)
+            2026-10-18 : 여러 주문 상세를 한 번에 조회하도록 변경
+        """
+
+        sql = """
+        SELECT
+            h.order_detail_id,
+            h.order_status_id
+        FROM
+            order_status_modification_histories h
+            INNER JOIN (
+                SELECT
+                    MAX(id) AS id
+                FROM
+                    order_status_modification_histories
+                WHERE
+                    order_detail_id IN %(order_detail_ids)s
+                    AND order_status_id IN (3, 4)
+                GROUP BY
+                    order_detail_id
+            ) AS last_history
+                ON last_history.id = h.id;
+        """
+
+        with db.cursor(pymysql.cursors.DictCursor) as cursor:
+            cursor.execute(sql, arguments)
+            previous_statuses = cursor.fetchall()
 
-            return current_status
+            return previous_statuses
 
         raise err.OperationalError
 
@@ -1,94 +1,92 @@
+import json
+
 import pymysql
 
+from pymysql.constants import CLIENT
+
 class DAOInsertFailError(Exception):
     def __init__(self, message):
         super().__init__(message)
 
 class ProductDao:
-    def find_first_categories_by_seller_property_id(self, conn, seller_property_id):
+    def find_all_first_categories(self, conn):
         """
-        1차 카테고리를 셀러 속성 아이디로 조회한다.
+        셀러 속성별 1차 카테고리 전체 조회 (기준 데이터 캐시용)
 
         Args:
-            conn              : 데이터베이스 커넥션 객체
-            seller_property_id: 셀러 속성 아이디
+            conn: 데이터베이스 커넥션 객체
 
         Returns:
             results: 1차 카테고리 정보를 담은 딕셔너리 리스트
                 [
                     {
-                        "id"  : 1차 카테고리 아이디,
-                        "name": 1차 카테고리 이름
+                        "seller_property_id": 셀러 속성 아이디,
+                        "id"                : 1차 카테고리 아이디,
+                        "name"              : 1차 카테고리 이름
                     },
                     ...
                 ]
 
         Author:
-            이충희(choonghee.dev@gmail.com)
+            김태수
 
         History:
-            2020-09-22(이충희): 초기 생성
-            2020-09-23(이충희): 데이터베이스 커넥션 부분을 뷰 레벨로 이동시킴
+            2026-10-18(김태수): 초기 생성
         """
         sql = """
         SELECT
-            t2.id, t2.name 
+            t1.seller_property_id, t2.id, t2.name 
         FROM 
             first_category_seller_properties AS t1 
         LEFT JOIN 
             first_categories AS t2 
         ON       
-            t1.first_category_id = t2.id 
-        WHERE 
-            seller_property_id = %s;
+            t1.first_category_id = t2.id;
         """
         with conn.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, (seller_property_id,))
+            cursor.execute(sql)
             results = cursor.fetchall()
             if not results:
                 raise pymysql.err.InternalError(10007, "DAO_COULD_NOT_SELECT_FIRST_CATEGRORIES")
 
         return results
 
-    def find_second_categories_by_first_category_id(self, conn, first_category_id):
+    def find_all_second_categories(self, conn):
         """
-        2차 카테고리를 1차 카테고리 아이디로 조회한다.
+        1차 카테고리별 2차 카테고리 전체 조회 (기준 데이터 캐시용)
 
         Args:
-            conn              : 데이터베이스 커넥션 객체
-            first_category_id : 1차 카테고리 아이디
+            conn: 데이터베이스 커넥션 객체
 
         Returns:
             results: 2차 카테고리 정보를 담은 딕셔너리 리스트
                 [
                     {
-                        "id"  : 2차 카테고리 아이디,
-                        "name": 2차 카테고리 이름
+                        "first_category_id": 1차 카테고리 아이디,
+                        "id"               : 2차 카테고리 아이디,
+                        "name"             : 2차 카테고리 이름
                     },
                     ...
                 ]
 
         Author:
-            이충희(choonghee.dev@gmail.com)
+            김태수
 
         History:
-            2020-09-22(이충희): 초기 생성
-            2020-09-23(이충희): 데이터베이스 커넥션 부분을 뷰 레벨로 이동시킴
+            2026-10-18(김태수): 초기 생성
         """
         sql = """
             SELECT
-                t2.id, t2.name 
+                t1.first_category_id, t2.id, t2.name 
             FROM 
                 first_category_second_categories AS t1 
             LEFT JOIN 
                 second_categories AS t2 
             ON 
-                t1.second_category_id = t2.id 
-            WHERE 
-                first_category_id = %s;
+                t1.second_category_id = t2.id;
             """
         with conn.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, (first_category_id,))
+            cursor.execute(sql)
             results = cursor.fetchall()
             if not results:
                 raise pymysql.err.InternalError(10006, "DAO_COULD_NOT_SELECT_SECOND_CATEGRORIES")
@@ -249,24 +247,26 @@ class ProductDao:
             if rows <= 0:
                 raise pymysql.err.InternalError(10002, "DAO_COULD_NOT_INSERT_PRODUCT_DETAIL")
 
-    def create_product_image(self, conn, url, order, product_id):
+    def create_product_images_bulk(self, conn, images):
         """
-        상품 등록시 이미지 정보를 생성한다.
+        상품 이미지 정보를 한 번에 생성한다.
+        executemany 가 여러 row 를 한 INSERT 문으로 묶어 보낸다.
 
         Args:
-            conn      : 데이터베이스 커넥션 객체
-            url       : S3에 업로드된 이미지 URL
-            order     : 이미지가 보여지는 순서
-            product_id: 상품 아이디
+            conn  : 데이터베이스 커넥션 객체
+            images: (S3에 업로드된 이미지 URL, 이미지가 보여지는 순서, 상품 아이디) 튜플 리스트
 
         Returns:
         
         Author:
-            이충희(choonghee.dev@gmail.com)
+            김태수
 
         History:
-            2020-09-27(이충희): 초기 생성
+            2026-10-18(김태수): 초기 생성
         """
+        if not images:
+            return
+
         sql = """
             INSERT INTO product_images (
                 image_path,
@@ -279,32 +279,30 @@ class ProductDao:
             );
         """
         with conn.cursor() as cursor:
-            rows = cursor.execute(sql, (url, order, product_id,))
-            if rows <= 0:
+            rows = cursor.executemany(sql, images)
+            if rows != len(images):
                 raise pymysql.err.InternalError(10003, "DAO_COULD_NOT_INSERT_PRODUCT_IMAGE")
 
-    def create_option(self, conn, option):
+    def create_options_bulk(self, conn, options):
         """
-        상품 등록시 옵션 정보를 생성한다.
+        상품 옵션 정보를 한 번에 생성한다.
+        executemany 가 여러 row 를 한 INSERT 문으로 묶어 보낸다.
 
         Args:
-            conn  : 데이터베이스 커넥션 객체
-            option: 상품 옵션 정보 딕셔너리
-                {
-                    "stock"     : 재고량,
-                    "color_id"  : 컬러 아이디,
-                    "size_id"   : 사이즈 아이디,
-                    "product_id": 상품 아이디,
-                }
+            conn   : 데이터베이스 커넥션 객체
+            options: 상품 옵션 정보 딕셔너리 리스트 [{stock, color_id, size_id, product_id}]
 
         Returns:
         
         Author:
-            이충희(choonghee.dev@gmail.com)
+            김태수
 
         History:
-            2020-09-27(이충희): 초기 생성
+            2026-10-18(김태수): 초기 생성
         """
+        if not options:
+            return
+
         sql = """
             INSERT INTO options (
                 stock,
@@ -319,91 +317,55 @@ class ProductDao:
             );
         """
         with conn.cursor() as cursor:
-            rows = cursor.execute(sql, option)
-            if rows <= 0:
+            rows = cursor.executemany(sql, options)
+            if rows != len(options):
                 raise pymysql.err.InternalError(10004, "DAO_COULD_NOT_INSERT_PRODUCT_OPTION")
 
-    def find_products(self, conn, params):
+    def make_products_filter_sql(self, params):
         """
-        상품 리스트 조회
+        상품 리스트 / 상품 개수 조회가 함께 쓰는 필터 조건 SQL
 
         Args:
-            conn  : 데이터베이스 커넥션 객체
             params: 상품 정보
 
         Returns:
-            results: 상품 리스트
+            WHERE 절 뒤에 붙일 AND 조건 문자열
 
         Author:
-            이충희(choonghee.dev@gmail.com)
+            김태수
 
         History:
-            2020-10-01(이충희): 초기 생성
-        """
-        sql = """
-            SELECT
-                p.id,
-                DATE_FORMAT(p.register_date, '%%Y-%%m-%%d %%H:%%i:%%S') AS register_date,
-                pi.image_path, 
-                pd.name AS product_name, 
-                p.code, 
-                sp.name AS seller_name, 
-                si.korean_name,
-                pd.sale_price,
-                pd.discount_rate,
-                pd.is_sold,
-                pd.is_displayed
-            FROM 
-                product_details AS pd
-            INNER JOIN products AS p 
-                ON pd.product_id = p.id
-            INNER JOIN product_images AS pi 
-                ON pi.product_id = p.id
-            INNER JOIN sellers AS s 
-                ON s.id = p.seller_id
-            INNER JOIN seller_informations AS si 
-                ON s.id = si.seller_id
-            INNER JOIN seller_properties AS sp 
-                ON sp.id = si.seller_property_id
-            WHERE 
-                pd.expired_at = '9999-12-31 23:59:59'
-            AND 
-	            p.is_deleted = 0
-            AND
-	            s.is_deleted = 0
-            AND
-                si.expired_at = '9999-12-31 23:59:59'
-            AND
-                pi.ordering = 1
-            AND 
-                (
-                    pd.discount_ended_at IS NULL 
-                    OR
-                    (
-                        NOW() BETWEEN pd.discount_started_at AND pd.discount_ended_at
-                    )
-                )
-        """
-        sql2 = """
-            ORDER BY
-                p.register_date DESC
-            LIMIT
-                %(limit)s
-            OFFSET
-                %(offset)s;
+            2026-10-18(김태수): find_products 에서 분리
+            2026-10-18(김태수): n-gram 전문 검색 조건 추가
         """
+        sql = ""
+
         if params['start_date'] and params['end_date']:
             sql += """
                 AND
                     p.register_date BETWEEN %(start_date)s AND %(end_date)s
             """
 
+        # 검색어가 n-gram 토큰 크기 이상이면 전문 검색 인덱스로 후보를 좁히고,
+        # LIKE 로 부분 문자열 일치를 다시 확인한다. 짧은 검색어는 LIKE 만 쓴다.
+        if params.get('seller_name_search'):
+            sql += """
+                AND
+                    MATCH(si.korean_name) AGAINST(%(seller_name_search)s IN BOOLEAN MODE)
+            """
+
         if params['seller_name']:
             sql += """
                 AND 
                     si.korean_name LIKE %(seller_name)s
             """
 
+        if params.get('product_name_search'):
+            sql += """
+                AND
+                    MATCH(pd.name) AGAINST(%(product_name_search)s IN BOOLEAN MODE)
+            """
+
         if params['product_name']:
             sql += """
                 AND
@@ -454,14 +416,206 @@ class ProductDao:
                     pd.discount_rate > 0
             """
 
+        return sql
+
+    def make_find_products_sql(self, params):
+        """
+        상품 리스트 조회 SQL
+
+        Args:
+            params: 상품 정보
+
+        Returns:
+            상품 리스트 조회 SQL 문자열
+
+        Author:
+            이충희(choonghee.dev@gmail.com)
+
+        History:
+            2020-10-01(이충희): 초기 생성
+            2026-10-18(김태수): 커서 페이지네이션 조건 추가
+            2026-10-18(김태수): find_products 에서 분리
+        """
+        sql = """
+            SELECT
+                p.id,
+                DATE_FORMAT(p.register_date, '%%Y-%%m-%%d %%H:%%i:%%S') AS register_date,
+                pi.image_path, 
+                pd.name AS product_name, 
+                p.code, 
+                sp.name AS seller_name, 
+                si.korean_name,
+                pd.sale_price,
+                pd.discount_rate,
+                pd.is_sold,
+                pd.is_displayed
+            FROM 
+                product_details AS pd
+            INNER JOIN products AS p 
+                ON pd.product_id = p.id
+            INNER JOIN product_images AS pi 
+                ON pi.product_id = p.id
+            INNER JOIN sellers AS s 
+                ON s.id = p.seller_id
+            INNER JOIN seller_informations AS si 
+                ON s.id = si.seller_id
+            INNER JOIN seller_properties AS sp 
+                ON sp.id = si.seller_property_id
+            WHERE 
+                pd.expired_at = '9999-12-31 23:59:59'
+            AND 
+	            p.is_deleted = 0
+            AND
+	            s.is_deleted = 0
+            AND
+                si.expired_at = '9999-12-31 23:59:59'
+            AND
+                pi.ordering = 1
+            AND 
+                (
+                    pd.discount_ended_at IS NULL 
+                    OR
+                    (
+                        NOW() BETWEEN pd.discount_started_at AND pd.discount_ended_at
+                    )
+                )
+        """
+        # 같은 등록일 안에서도 순서가 고정되도록 아이디를 함께 정렬한다.
+        if params['is_cursor_mode']:
+            # 이전 페이지 마지막 상품 다음부터 - 앞 페이지 row를 읽고 버리지 않는다.
+            sql2 = """
+                ORDER BY
+                    p.register_date DESC, p.id DESC
+                LIMIT
+                    %(limit)s;
+            """
+        else:
+            sql2 = """
+                ORDER BY
+                    p.register_date DESC, p.id DESC
+                LIMIT
+                    %(limit)s
+                OFFSET
+                    %(offset)s;
+            """
+
+        if params['cursor_register_date']:
+            sql += """
+                AND (
+                    p.register_date < %(cursor_register_date)s
+                    OR
+                    (p.register_date = %(cursor_register_date)s AND p.id < %(cursor_id)s)
+                )
+            """
+
+        sql += self.make_products_filter_sql(params)
         sql += sql2
+        return sql
+
+    def make_count_products_sql(self, params):
+        """
+        상품 개수 조회 SQL
+        리스트와 같은 필터를 쓰되, 개수에 영향이 없는 product_images 조인과
+        DATE_FORMAT 등 컬럼 가공은 하지 않는다. (대표 이미지는 상품 등록 시 필수)
+
+        params['count_limit'] 이 있으면 그 개수까지만 센다.
+
+        Args:
+            params: 상품 정보
+
+        Returns:
+            상품 개수 조회 SQL 문자열
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        sql = """
+            SELECT
+                1
+            FROM 
+                product_details AS pd
+            INNER JOIN products AS p 
+                ON pd.product_id = p.id
+            INNER JOIN sellers AS s 
+                ON s.id = p.seller_id
+            INNER JOIN seller_informations AS si 
+                ON s.id = si.seller_id
+            INNER JOIN seller_properties AS sp 
+                ON sp.id = si.seller_property_id
+            WHERE 
+                pd.expired_at = '9999-12-31 23:59:59'
+            AND 
+	            p.is_deleted = 0
+            AND
+	            s.is_deleted = 0
+            AND
+                si.expired_at = '9999-12-31 23:59:59'
+            AND 
+                (
+                    pd.discount_ended_at IS NULL 
+                    OR
+                    (
+                        NOW() BETWEEN pd.discount_started_at AND pd.discount_ended_at
+                    )
+                )
+        """
+        sql += self.make_products_filter_sql(params)
+
+        if params.get('count_limit'):
+            sql += """
+                LIMIT
+                    %(count_limit)s
+            """
+
+        return """
+            SELECT
+                COUNT(*) AS total_count
+            FROM
+                (
+        """ + sql + """
+                ) AS filtered_products;
+        """
+
+    def find_products_with_count(self, conn, params):
+        """
+        상품 리스트와 필터 조건의 전체 개수 조회
+        커넥션이 multi statements 를 허용하면 두 쿼리를 한 번에 보낸다.
+
+        Args:
+            conn  : 데이터베이스 커넥션 객체
+            params: 상품 정보
+
+        Returns:
+            (상품 리스트, 전체 개수)
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        sql       = self.make_find_products_sql(params)
+        count_sql = self.make_count_products_sql(params)
 
         with conn.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, params)
-            results = cursor.fetchall()
-            if not results:
+            if conn.client_flag & CLIENT.MULTI_STATEMENTS:
+                cursor.execute(sql + count_sql, params)
+                results = cursor.fetchall()
+                cursor.nextset()
+                total_count = cursor.fetchone()['total_count']
+            else:
+                cursor.execute(sql, params)
+                results = cursor.fetchall()
+                cursor.execute(count_sql, params)
+                total_count = cursor.fetchone()['total_count']
+
+            # 커서 모드에서 빈 페이지는 마지막 페이지를 지났다는 뜻이다.
+            if not results and not params['is_cursor_mode']:
                 raise pymysql.err.InternalError(10008, "DAO_COULD_NOT_LIST_PRODUCTS")
-        return results
+        return results, total_count
 
     def find_product_by_code(self, conn, code):
         """
@@ -473,12 +627,15 @@ class ProductDao:
 
         Returns:
             result: 상품 상세 정보
+                images : 상품 이미지 리스트 [{id, image_path, ordering}]
+                options: 상품 옵션 리스트 [{id, stock, product_id, color_id, size_id, c.id, name, s.id, s.name}]
 
         Author:
             이충희(choonghee.dev@gmail.com)
 
         History:
             2020-10-02(이충희): 초기 생성
+            2026-10-18(김태수): 이미지 / 옵션을 한 쿼리로 함께 조회
         """
         sql = """
             SELECT 
@@ -503,7 +660,33 @@ class ProductDao:
                 DATE_FORMAT(pd.discount_ended_at, '%%Y-%%m-%%d %%H:%%i:%%S') AS discount_ended_at,
                 pd.minimum_sale_amount,
                 pd.maximum_sale_amount,
-                pd.country_of_origin_id
+                pd.country_of_origin_id,
+                (
+                    SELECT
+                        JSON_ARRAYAGG(JSON_OBJECT(
+                            'id', pi.id, 'image_path', pi.image_path, 'ordering', pi.ordering
+                        ))
+                    FROM
+                        product_images AS pi
+                    WHERE
+                        pi.product_id = p.id
+                ) AS images,
+                (
+                    SELECT
+                        JSON_ARRAYAGG(JSON_OBJECT(
+                            'id', o.id, 'stock', o.stock, 'product_id', o.product_id,
+                            'color_id', o.color_id, 'size_id', o.size_id,
+                            'c.id', c.id, 'name', c.name, 's.id', s.id, 's.name', s.name
+                        ))
+                    FROM
+                        options AS o
+                    INNER JOIN
+                        colors AS c ON o.color_id = c.id
+                    INNER JOIN
+                        sizes AS s ON o.size_id = s.id
+                    WHERE
+                        o.product_id = p.id
+                ) AS options
             FROM
                 products AS p
             INNER JOIN
@@ -527,78 +710,16 @@ class ProductDao:
             result = cursor.fetchone()
             if not result or not result['product_id']:
                 raise pymysql.err.InternalError(10009, "DAO_COULD_NOT_FIND_PRODUCT")
-        return result
-
-    def find_product_images(self, conn, product_id):
-        """
-        상품 이미지 조회
-
-        Args:
-            conn      : 데이터베이스 커넥션 객체
-            product_id: 상품 번호
-
-        Returns:
-            result: 상품 이미지 정보
-            
-        Author:
-            이충희(choonghee.dev@gmail.com)
 
-        History:
-            2020-10-03(이충희): 초기 생성
-        """
-        sql = """
-            SELECT
-                pi.id, pi.image_path, pi.ordering
-            FROM
-                product_images AS pi
-            WHERE
-                pi.product_id = %s ;
-        """ 
-
-        with conn.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, (product_id,))
-            result = cursor.fetchall()
-            if not result:
-                raise pymysql.err.InternalError(10010, "DAO_COULD_NOT_FIND_PRODUCT_IMAGES")
+        # 옵션 키는 SELECT * 조인 결과를 DictCursor 가 만든 이름('c.id', 's.name')과 맞춘다.
+        result['images']  = json.loads(result['images']) if result['images'] else None
+        result['options'] = json.loads(result['options']) if result['options'] else None
+        if not result['images']:
+            raise pymysql.err.InternalError(10010, "DAO_COULD_NOT_FIND_PRODUCT_IMAGES")
+        if not result['options']:
+            raise pymysql.err.InternalError(10011, "DAO_COULD_NOT_FIND_PRODUCT_OPTIONS")
         return result
 
-    def find_product_options(self, conn, product_id):
-        """
-        상품 옵션 조회
-
-        Args:
-            conn      : 데이터베이스 커넥션 객체
-            product_id: 상품 번호
-
-        Returns:
-            result: 상품이 가진 옵션 정보
-            
-        Author:
-            이충희(choonghee.dev@gmail.com)
-
-        History:
-            2020-10-04(이충희): 초기 생성
-        """
-        sql = """
-            SELECT 
-                *
-            FROM
-                options AS o
-            INNER JOIN
-                colors AS c ON o.color_id = c.id
-            INNER JOIN
-                sizes AS s ON o.size_id = s.id
-            WHERE
-                product_id = %s;
-        """
-
-        with conn.cursor(pymysql.cursors.DictCursor) as cursor:
-            cursor.execute(sql, (product_id,))
-            results = cursor.fetchall()
-            if not results:
-                raise pymysql.err.InternalError(10011, "DAO_COULD_NOT_FIND_PRODUCT_OPTIONS")
-        return results
-    
     def find_all_countries(self, conn):
         """
         상품 제조국 리스트 조회
@@ -690,23 +811,23 @@ class ProductDao:
                 raise pymysql.err.InternalError(10012, "DAO_COULD_NOT_FIND_SIZES")
         return results
 
-    def find_products_by_dates(self, conn, start_date, end_date):
+    def make_products_download_sql(self, product_ids=None):
         """
-        날짜 조건으로 상품 리스트 조회
+        엑셀 다운로드용 상품 리스트 조회 SQL
+        product_ids 가 있으면 선택 상품, 없으면 날짜 조건(시작, 종료 두 개의 %s)으로 조회한다.
 
         Args:
-            conn      : 데이터베이스 커넥션 객체
-            start_date: 조건 시작 날짜
-            end_date  : 조건 끝 날쩌ㅏ
+            product_ids: 상품 아이디들
 
         Returns:
-            result: 상품 리스트
-            
+            상품 리스트 조회 SQL 문자열
+
         Author:
             이충희(choonghee.dev@gmail.com)
 
         History:
             2020-10-06(이충희): 초기 생성
+            2026-10-18(김태수): find_products_by_dates / find_products_by_ids 에서 분리
         """
         sql = """
             SELECT 
@@ -735,8 +856,6 @@ class ProductDao:
             INNER JOIN
                 seller_properties AS sp ON si.seller_property_id = sp.id
             WHERE
-                p.register_date BETWEEN %s AND %s
-            AND
                 p.is_deleted = 0
             AND
                 si.expired_at = '9999-12-31 23:59:59'
@@ -746,10 +865,44 @@ class ProductDao:
                 pd.expired_at = '9999-12-31 23:59:59'
             AND
                 pi.ordering = 1
+        """
+        if product_ids:
+            sql += """
+            AND
+                p.id IN ({})
+            """.format(', '.join(['%s'] * len(product_ids)))
+        else:
+            sql += """
+            AND
+                p.register_date BETWEEN %s AND %s
+            """
+
+        sql += """
             ORDER BY
                 p.register_date
             DESC;
         """
+        return sql
+
+    def find_products_by_dates(self, conn, start_date, end_date):
+        """
+        날짜 조건으로 상품 리스트 조회
+
+        Args:
+            conn      : 데이터베이스 커넥션 객체
+            start_date: 조건 시작 날짜
+            end_date  : 조건 끝 날쩌ㅏ
+
+        Returns:
+            result: 상품 리스트
+            
+        Author:
+            이충희(choonghee.dev@gmail.com)
+
+        History:
+            2020-10-06(이충희): 초기 생성
+        """
+        sql = self.make_products_download_sql()
 
         with conn.cursor(pymysql.cursors.DictCursor) as cursor:
             cursor.execute(sql, (start_date, end_date,))
@@ -775,61 +928,8 @@ class ProductDao:
         History:
             2020-10-06(이충희): 초기 생성
         """
-        sql = """
-            SELECT 
-                DATE_FORMAT(p.register_date, '%%Y-%%m-%%d %%H:%%i:%%S') AS register_date,
-                pi.image_path,
-                pd.name AS product_name,
-                p.code,
-                p.id,
-                sp.name AS seller_property_name,
-                si.korean_name AS seller_name,
-                pd.sale_price,
-                pd.sale_price - (pd.discount_rate * 0.01 * pd.sale_price) AS discounted_price,
-                pd.is_sold,
-                pd.is_displayed,
-                pd.discount_rate
-            FROM
-                products AS p
-            INNER JOIN
-                product_details AS pd ON p.id = pd.product_id
-            INNER JOIN
-                product_images AS pi ON p.id = pi.product_id
-            INNER JOIN
-                sellers AS s ON p.seller_id = s.id
-            INNER JOIN
-                seller_informations AS si ON s.id = si.seller_id
-            INNER JOIN
-                seller_properties AS sp ON si.seller_property_id = sp.id
-            WHERE
-                p.is_deleted = 0
-            AND
-                si.expired_at = '9999-12-31 23:59:59'
-            AND
-                s.is_deleted = 0
-            AND
-                pd.expired_at = '9999-12-31 23:59:59'
-            AND
-                pi.ordering = 1
-            AND (
-        """
-        for idx, _id in enumerate(product_ids):
-            if idx == 0:
-                sql += """
-                    p.id = %s
-                """
-            else:
-                sql += """
-                    OR
-                        p.id = %s
-                """
-        sql += """)
-            ORDER BY
-                p.register_date
-            DESC;
-        """
+        sql = self.make_products_download_sql(product_ids)
 
-        # raise pymysql.err.InternalError(10008, "DAO_COULD_NOT_LIST_PRODUCTS")
         with conn.cursor(pymysql.cursors.DictCursor) as cursor:
             cursor.execute(sql, product_ids)
             results = cursor.fetchall()
@@ -837,6 +937,35 @@ class ProductDao:
                 raise pymysql.err.InternalError(10008, "DAO_COULD_NOT_LIST_PRODUCTS")
         return results
 
+    def iter_products_for_download(self, conn, start_date=None, end_date=None, product_ids=None):
+        """
+        엑셀 다운로드용 상품 리스트를 한 줄씩 조회 (서버 사이드 커서)
+        결과를 클라이언트 메모리에 모두 올리지 않고 읽는 만큼만 받아온다.
+        다 읽을 때까지 같은 커넥션으로 다른 쿼리를 실행할 수 없다.
+
+        Args:
+            conn       : 데이터베이스 커넥션 객체
+            start_date : 조건 시작 날짜
+            end_date   : 조건 끝 날짜
+            product_ids: 상품 아이디들 (있으면 날짜 조건 대신 사용)
+
+        Returns:
+            상품 딕셔너리 제너레이터
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        sql  = self.make_products_download_sql(product_ids)
+        args = product_ids if product_ids else (start_date, end_date,)
+
+        with conn.cursor(pymysql.cursors.SSDictCursor) as cursor:
+            cursor.execute(sql, args)
+            for row in cursor:
+                yield row
+
     def update_product(self, conn, product):
         """
         상품 업데이트
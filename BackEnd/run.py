@@ -1,5 +1,9 @@
 from flask_script import Manager
 from app import create_app
+from connection import create_connection
+from model import OrderDao, EventDao
+from service import OrderService, EventService
+from utils.search_benchmark import benchmark_product_search
 
 app     = create_app()
 manager = Manager(app)
@@ -9,5 +13,59 @@ def run():
     app.debug = True
     app.run(host='0.0.0.0')
 
+@manager.command
+def bench_product_search(rows=1000000, repeat=5):
+    """상품명 LIKE 검색과 n-gram 전문 검색 속도 비교"""
+    conn = create_connection()
+    try:
+        results = benchmark_product_search(conn, rows=rows, repeat=repeat)
+    finally:
+        conn.close()
+
+    print(f'rows: {rows}')
+    for result in results:
+        print(
+            f"{result['term']:<12} count: {result['count']:>8}  "
+            f"LIKE: {result['like_seconds'] * 1000:9.1f}ms  "
+            f"NGRAM: {result['ngram_seconds'] * 1000:9.1f}ms"
+        )
+
+@manager.command
+def backfill_order_statuses(batch_size=1000):
+    """주문 상태 변경 내역으로 주문 현재 상태 테이블(order_detail_current_statuses) 채우기"""
+    conn = create_connection()
+    try:
+        order_service = OrderService(OrderDao(), app.config)
+        total = order_service.backfill_current_statuses(conn, batch_size=int(batch_size))
+    finally:
+        conn.close()
+
+    print(f'backfilled: {total}')
+
+@manager.command
+def reconcile_order_status_counts():
+    """주문 상태별 건수(order_status_counts)를 현재 상태 테이블 기준으로 최근 기간만 다시 계산 (cron 등으로 주기 실행)"""
+    conn = create_connection()
+    try:
+        order_service = OrderService(OrderDao(), app.config)
+        result = order_service.reconcile_order_status_counts(conn)
+    finally:
+        conn.close()
+
+    print(f'reconciled: {result}')
+
+@manager.command
+def update_event_statuses():
+    """기획전 상태(대기 / 진행중 / 종료)를 시작일자 / 종료일자 기준으로 일괄 변경 (cron 등으로 주기 실행)"""
+    conn = create_connection()
+    try:
+        event_service = EventService(EventDao(), app.config)
+        result = event_service.put_event_status(conn)
+        conn.commit()
+    finally:
+        conn.close()
+
+    print(f'changed: {result}')
+
 if __name__ == '__main__':
     manager.run()
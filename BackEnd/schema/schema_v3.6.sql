@@ -175,6 +175,13 @@ ALTER TABLE seller_informations
 ALTER TABLE seller_informations
     ADD CONSTRAINT FK_seller_informations_sellers_id_sellers_id FOREIGN KEY (seller_id)
         REFERENCES sellers (id) ON DELETE RESTRICT ON UPDATE RESTRICT;
+-- 셀러 한글명 검색 (n-gram 전문 검색)
+-- 기본 불용어(a, i, is, on ...)가 들어간 n-gram 토큰은 인덱스에서 빠져 영문 검색이 LIKE 보다 적게 찾으므로
+-- 불용어 없이 만든다. (이미 만든 인덱스는 DROP INDEX 후 다시 만든다)
+SET SESSION innodb_ft_enable_stopword = OFF;
+ALTER TABLE seller_informations
+    ADD FULLTEXT INDEX FT_seller_informations_korean_name (korean_name) WITH PARSER ngram;
+SET SESSION innodb_ft_enable_stopword = ON;
 -- 셀러 담당자
 CREATE TABLE seller_managers
 (
@@ -305,6 +312,10 @@ ALTER TABLE products
     ADD CONSTRAINT FK_products_seller_id FOREIGN KEY (seller_id)
         REFERENCES sellers (id) ON DELETE RESTRICT ON UPDATE RESTRICT;
 
+-- 상품 리스트 커서 페이지네이션 (등록일 최신순, 아이디)
+ALTER TABLE products
+    ADD INDEX IDX_products_register_date_id (register_date, id);
+
 -- 상품 상세
 CREATE TABLE product_details
 (
@@ -344,6 +355,13 @@ ALTER TABLE product_details
     ADD CONSTRAINT FK_product_detail_modifier_id FOREIGN KEY (modifier_id)
         REFERENCES sellers (id) ON DELETE RESTRICT ON UPDATE RESTRICT;
 
+-- 상품명 검색 (n-gram 전문 검색, ngram_token_size 기본값 2)
+-- 셀러 한글명 인덱스와 같은 이유로 불용어 없이 만든다.
+SET SESSION innodb_ft_enable_stopword = OFF;
+ALTER TABLE product_details
+    ADD FULLTEXT INDEX FT_product_details_name (name) WITH PARSER ngram;
+SET SESSION innodb_ft_enable_stopword = ON;
+
 -- 상품 이미지 테이블
 CREATE TABLE product_images
 (
@@ -812,4 +830,153 @@ ALTER TABLE order_status_modification_histories
 
 ALTER TABLE order_status_modification_histories
     ADD CONSTRAINT FK_order_status_id FOREIGN KEY (order_status_id)
-        REFERENCES order_statuses (id) ON DELETE RESTRICT ON UPDATE RESTRICT;
\ No newline at end of file
+        REFERENCES order_statuses (id) ON DELETE RESTRICT ON UPDATE RESTRICT;
+
+-- 주문 상세별 상태 변경 일자 조회 (결제완료, 배송시작 일자)
+ALTER TABLE order_status_modification_histories
+    ADD INDEX IDX_osmh_order_detail_status (order_detail_id, order_status_id, updated_at);
+
+-- order_detail_current_statuses Table Create SQL
+-- 주문 상세의 현재 상태 (order_status_modification_histories 에서 유지되는 조회용 테이블)
+CREATE TABLE order_detail_current_statuses
+(
+    `order_detail_id`       INT         NOT NULL,
+    `order_status_id`       INT         NOT NULL,
+    `entered_at`            DATETIME    NOT NULL,
+    `payment_completed_at`  DATETIME    NULL,
+    `shipping_started_at`   DATETIME    NULL,
+    PRIMARY KEY (order_detail_id)
+);
+
+ALTER TABLE order_detail_current_statuses COMMENT '주문 상세 현재 상태';
+
+ALTER TABLE order_detail_current_statuses
+    ADD CONSTRAINT FK_order_detail_current_statuses_order_detail_id FOREIGN KEY (order_detail_id)
+        REFERENCES order_details (id) ON DELETE RESTRICT ON UPDATE RESTRICT;
+
+ALTER TABLE order_detail_current_statuses
+    ADD CONSTRAINT FK_order_detail_current_statuses_order_status_id FOREIGN KEY (order_status_id)
+        REFERENCES order_statuses (id) ON DELETE RESTRICT ON UPDATE RESTRICT;
+
+-- 상태별 주문 리스트 (현재 상태 진입 일자 최신순, 주문 상세 아이디)
+ALTER TABLE order_detail_current_statuses
+    ADD INDEX IDX_order_detail_current_statuses_status_entered_at (order_status_id, entered_at, order_detail_id);
+
+-- order_status_counts Table Create SQL
+-- 주문 현재 상태별 건수 (상태, 셀러 속성, 상태 진입 일자별), 상태 변경 시 함께 갱신
+CREATE TABLE order_status_counts
+(
+    `order_status_id`     INT     NOT NULL,
+    `seller_property_id`  INT     NOT NULL,
+    `bucket_date`         DATE    NOT NULL,
+    `count`               INT     NOT NULL    DEFAULT 0,
+    PRIMARY KEY (order_status_id, seller_property_id, bucket_date)
+);
+
+ALTER TABLE order_status_counts COMMENT '주문 상태별 건수';
+
+-- 기간으로 조회 (대시보드)
+ALTER TABLE order_status_counts
+    ADD INDEX IDX_order_status_counts_bucket_date (bucket_date);
+
+-- 시리얼 넘버는 쿠폰 전체에서 중복되지 않도록 (대량 생성 시 중복이면 다시 만든다)
+-- 운영 DB 에 적용하기 전에 이미 중복된 시리얼 넘버가 있는지 확인한다.
+-- 결과가 있으면 ALTER 가 실패하므로, 사용되지 않은 쪽 시리얼 넘버를 새로 발급하거나 지운 뒤에 적용한다.
+SELECT serial_number, COUNT(*) AS duplicate_count, GROUP_CONCAT(id) AS ids
+FROM coupon_serial_numbers
+GROUP BY serial_number
+HAVING COUNT(*) > 1;
+
+ALTER TABLE coupon_serial_numbers
+    ADD UNIQUE INDEX UQ_coupon_serial_numbers_serial_number (serial_number);
+
+-- 기획전 상태 일괄 변경 (최신 이력, 상태, 시작일자 / 종료일자)
+ALTER TABLE event_details
+    ADD INDEX IDX_event_details_status_window (expired_at, event_status_id, started_at, ended_at);
+
+-- 주문 상태 변경 내역이 들어올 때마다 현재 상태 테이블과 상태별 건수(order_status_counts)를 맞춘다.
+-- 관리자 상태 변경뿐 아니라 주문 시(결제완료, 상태 1) 쇼핑몰이 넣는 내역도 반영된다.
+-- 현재 상태 줄이 없던 주문(트리거 전에 들어온 주문)은 결제완료 / 배송시작 일자를 내역에서 찾아 채운다.
+-- (트리거를 만든 뒤 이전 주문은 backfill_order_statuses 로 한 번 채운다. 건수도 함께 다시 계산된다)
+DROP TRIGGER IF EXISTS TR_order_status_modification_histories_after_insert;
+
+DELIMITER $$
+CREATE TRIGGER TR_order_status_modification_histories_after_insert
+AFTER INSERT ON order_status_modification_histories
+FOR EACH ROW
+BEGIN
+    -- 컬럼 이름과 겹치지 않도록 지역 변수는 v_ 를 붙인다.
+    DECLARE v_has_current_status    TINYINT;
+    DECLARE v_payment_completed_at  DATETIME;
+    DECLARE v_shipping_started_at   DATETIME;
+    DECLARE v_old_status_id         INT;
+    DECLARE v_old_entered_at        DATETIME;
+    DECLARE v_seller_property_id    INT;
+    -- 현재 상태 줄이 없는 주문 (처음 들어온 내역)
+    DECLARE CONTINUE HANDLER FOR NOT FOUND SET v_old_status_id = NULL;
+
+    SELECT order_status_id, entered_at
+    INTO v_old_status_id, v_old_entered_at
+    FROM order_detail_current_statuses
+    WHERE order_detail_id = NEW.order_detail_id
+    FOR UPDATE;
+
+    SET v_has_current_status = v_old_status_id IS NOT NULL;
+
+    SET v_seller_property_id = (
+        SELECT sl.seller_property_id
+        FROM order_details d
+        INNER JOIN options i ON d.option_id = i.id
+        INNER JOIN products p ON i.product_id = p.id
+        INNER JOIN seller_informations sl ON sl.id = p.seller_id
+        WHERE d.id = NEW.order_detail_id
+    );
+
+    IF v_has_current_status THEN
+        SET v_payment_completed_at = IF(NEW.order_status_id = 1, NEW.updated_at, NULL);
+        SET v_shipping_started_at  = IF(NEW.order_status_id = 3, NEW.updated_at, NULL);
+    ELSE
+        SET v_payment_completed_at = (
+            SELECT MIN(h.updated_at) FROM order_status_modification_histories h
+            WHERE h.order_detail_id = NEW.order_detail_id AND h.order_status_id = 1
+        );
+        SET v_shipping_started_at = (
+            SELECT MIN(h.updated_at) FROM order_status_modification_histories h
+            WHERE h.order_detail_id = NEW.order_detail_id AND h.order_status_id = 3
+        );
+    END IF;
+
+    -- 결제완료 / 배송시작 일자는 처음 들어간 일자를 유지한다.
+    INSERT INTO order_detail_current_statuses (
+        order_detail_id,
+        order_status_id,
+        entered_at,
+        payment_completed_at,
+        shipping_started_at
+    ) VALUES (
+        NEW.order_detail_id,
+        NEW.order_status_id,
+        NEW.updated_at,
+        v_payment_completed_at,
+        v_shipping_started_at
+    )
+    ON DUPLICATE KEY UPDATE
+        order_status_id      = VALUES(order_status_id),
+        entered_at           = VALUES(entered_at),
+        payment_completed_at = COALESCE(order_detail_current_statuses.payment_completed_at, VALUES(payment_completed_at)),
+        shipping_started_at  = COALESCE(order_detail_current_statuses.shipping_started_at, VALUES(shipping_started_at));
+
+    -- 상태별 건수: 이전 상태(진입 일자)에서 빼고 새 상태(진입 일자)에 더한다.
+    IF v_seller_property_id IS NOT NULL THEN
+        IF v_has_current_status THEN
+            INSERT INTO order_status_counts (order_status_id, seller_property_id, bucket_date, count)
+            VALUES (v_old_status_id, v_seller_property_id, DATE(v_old_entered_at), -1)
+            ON DUPLICATE KEY UPDATE order_status_counts.count = order_status_counts.count - 1;
+        END IF;
+
+        INSERT INTO order_status_counts (order_status_id, seller_property_id, bucket_date, count)
+        VALUES (NEW.order_status_id, v_seller_property_id, DATE(NEW.updated_at), 1)
+        ON DUPLICATE KEY UPDATE order_status_counts.count = order_status_counts.count + 1;
+    END IF;
+END$$
+DELIMITER ;
@@ -4,6 +4,8 @@ from .order_service   import OrderService
 from .user_service    import UserService
 from .coupon_service  import CouponService
 from .event_service   import EventService
+from .event_view_count_service import EventViewCountService
+from .export_service  import ExportService
 
 __all__ = [
     ProductService,
@@ -11,5 +13,7 @@ __all__ = [
     OrderService,
     UserService,
     CouponService,
-    EventService
+    EventService,
+    EventViewCountService,
+    ExportService
 ]
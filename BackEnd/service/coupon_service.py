@@ -1,37 +1,96 @@
 import csv
 import datetime
+import itertools
 import string
-import random
+import secrets
 import uuid
 
+import pymysql
+
+from utils.export import iter_csv, count_rows, CSV_MIMETYPE
+
+# 시리얼 넘버 글자 수 ('-' 제외)
+SERIAL_NUMBER_LENGTH   = 14
+# 난수 바이트 -> 영문 대소문자(52자) 변환표
+# 256 은 52 로 나누어 떨어지지 않으므로, 치우침이 없도록 208(52 * 4) 이상의 바이트는 버린다.
+SERIAL_NUMBER_TABLE    = bytes(string.ascii_letters.encode('ascii')[b % 52] if b < 208 else 0 for b in range(256))
+SERIAL_NUMBER_REJECTED = bytes(range(208, 256))
+
+# MySQL 유니크 키 중복 에러 코드
+DUPLICATE_ENTRY = 1062
+
 class CouponService:
     def __init__(self, coupon_dao, config):
         self.coupon_dao = coupon_dao
         self.config     = config
 
-    def generate_serial_numbers(self):
+    def generate_serial_numbers(self, count):
         """
-        시리얼 넘버 생성
+        시리얼 넘버 여러 개 생성
+        secrets 난수 바이트를 한 번에 만들어 영문 대소문자로 바꾸고, 만든 것끼리는 중복을 없앤다.
 
         Args:
+            count: 만들 개수
 
         Returns:
-            serial_number: 시리얼 넘버
+            serial_numbers: 'xxxxx-xxxxx-xxxx' 형식의 서로 다른 시리얼 넘버 리스트
 
         Author:
             이충희(choonghee.dev@gmail.com)
 
         History:
             2020-10-09(이충희): 초기 생성
+            2026-10-18(김태수): 한 번에 여러 개를 만들도록 변경, random 대신 secrets 사용
         """
-        serial_number = ""
+        serial_numbers = set()
 
-        for i in range(0, 14):
-            serial_number += random.choice(string.ascii_letters)
-            if i == 4 or i == 9:
-                serial_number += '-'
-        
-        return serial_number
+        while len(serial_numbers) < count:
+            needed  = count - len(serial_numbers)
+            # 버려지는 바이트(208 이상)를 감안해서 넉넉하게 만든다.
+            letters = secrets.token_bytes(needed * SERIAL_NUMBER_LENGTH * 5 // 4 + 64)
+            letters = letters.translate(SERIAL_NUMBER_TABLE, SERIAL_NUMBER_REJECTED).decode('ascii')
+
+            for i in range(0, len(letters) - SERIAL_NUMBER_LENGTH + 1, SERIAL_NUMBER_LENGTH):
+                serial_numbers.add(f'{letters[i:i+5]}-{letters[i+5:i+10]}-{letters[i+10:i+14]}')
+                if len(serial_numbers) == count:
+                    break
+
+        return list(serial_numbers)
+
+    def create_serial_numbers(self, conn, coupon_id, count):
+        """
+        시리얼 넘버를 batch 단위로 만들어 넣기
+        batch 마다 여러 줄 INSERT 로 넣고, 이미 있는 시리얼 넘버와 겹쳐서 빠진 개수만큼만 새로 만들어 채운다.
+        들어간 개수로만 판단하므로 executemany 가 batch 를 여러 문장으로 나눠 보내도 더 많이 들어가지 않는다.
+
+        Args:
+            conn     : 데이터베이스 커넥션 객체
+            coupon_id: 쿠폰 아이디
+            count    : 만들 시리얼 넘버 개수
+
+        Returns:
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+            2026-10-18(김태수): 중복 확인 조회 대신 들어간 개수를 보고 모자란 만큼만 다시 넣도록 변경
+        """
+        batch_size  = self.config.get('COUPON_SERIAL_BATCH_SIZE', 5000)
+        max_retries = self.config.get('COUPON_SERIAL_MAX_RETRIES', 5)
+
+        for start in range(0, count, batch_size):
+            remaining = min(batch_size, count - start)
+
+            for retry in range(max_retries + 1):
+                serial_numbers = self.generate_serial_numbers(remaining)
+                remaining     -= self.coupon_dao.create_serial_numbers(conn, coupon_id, serial_numbers)
+
+                if remaining == 0:
+                    break
+            else:
+                raise pymysql.err.IntegrityError(DUPLICATE_ENTRY, "COUPON_SERIAL_NUMBER_DUPLICATED")
 
     def make_coupon(self, conn, coupon_data):
         """
@@ -48,6 +107,7 @@ class CouponService:
 
         History:
             2020-10-09(이충희): 초기 생성
+            2026-10-18(김태수): 시리얼 넘버를 batch 단위로 한 번에 넣도록 변경
         """
         ISSUE_TYPE_SERIAL_NUMBER = 3 # 발급 유형 시리얼 넘버     
 
@@ -59,9 +119,7 @@ class CouponService:
             if not coupon_data['limit_count']:
                 raise TypeError("COUPON_LIMIT_COUNT_CANNOT_BE_NULL")
             
-            for i in range(0, coupon_data['limit_count']):
-                serial_number = self.generate_serial_numbers()
-                self.coupon_dao.create_serial_number(conn, (coupon_id, serial_number,))
+            self.create_serial_numbers(conn, coupon_id, coupon_data['limit_count'])
 
     def get_coupons(self, conn, params):
         """
@@ -165,6 +223,60 @@ class CouponService:
         download_filename = self.make_download_filename(coupon_id)
         return tmp_filename, download_filename
 
+    def stream_serials(self, conn, coupon_id, report=None):
+        """
+        시리얼 넘버 csv 파일을 임시 파일 없이 조각 단위로 만들기
+        서버 사이드 커서로 한 줄씩 읽어 바로 csv 로 쓰므로 시리얼 넘버 수와 상관없이 메모리 사용량이 일정하다.
+
+        Args:
+            conn     : 데이터베이스 커넥션 객체 (응답이 끝날 때까지 사용)
+            coupon_id: 쿠폰 아이디
+            report   : 진행 상황(쓴 시리얼 수)을 받을 함수
+
+        Returns:
+            chunks, mimetype, 유저에게 보여지는 파일 이름
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        serials = self.coupon_dao.iter_serials_by_coupon_id(conn, coupon_id)
+
+        # 응답을 시작하기 전에 시리얼 넘버가 없는 쿠폰을 걸러낼 수 있도록 첫 줄만 먼저 읽는다.
+        first = next(serials, None)
+        if not first:
+            raise TypeError(f'NO_SERIALS_FOR_COUPON_{coupon_id}')
+
+        rows = (
+            [idx+1, row['serial_number'], row['used_date'] if row['used_date'] else '-']
+            for idx, row in enumerate(itertools.chain([first], serials))
+        )
+        chunks = iter_csv(['번호', '시리얼번호', '사용일시'], count_rows(rows, report))
+        return chunks, CSV_MIMETYPE, self.make_download_filename(coupon_id)
+
+    def export_serials(self, conn, params, report):
+        """
+        시리얼 넘버 내보내기 작업 (ExportService 에 'coupon_serials' 로 등록)
+
+        Args:
+            conn  : 데이터베이스 커넥션 객체
+            params: {"coupon_id"}
+            report: 진행 상황(쓴 시리얼 수)을 받을 함수
+
+        Returns:
+            chunks, mimetype, 유저에게 보여지는 파일 이름
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+            2026-10-18(김태수): 서버 사이드 커서로 읽는 stream_serials 사용
+        """
+        return self.stream_serials(conn, params['coupon_id'], report)
+
     def remove_coupon(self, conn, coupon_id):
         """
         쿠폰 제거
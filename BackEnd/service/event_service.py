@@ -1,4 +1,5 @@
 import boto3
+import time
 
 from datetime import datetime
 
@@ -65,6 +66,7 @@ class EventService:
             김태수
         History:
             2020-10-07 : 초기 생성
+            2026-10-18 : 버튼 / 매핑 상품을 한 번에 등록하도록 변경
         """
 
         arguments['event_id'] = self.event_dao.post_event(db)
@@ -113,25 +115,29 @@ class EventService:
         else:
             is_exist = 0
 
-        count = 0
-
-        # 버튼에 따라 할당된 상품을 중간테이블에 등록
-        for button in arguments['button_product']:
-            button_id = self.event_dao.post_event_buttons(
+        # 버튼을 한 번에 등록하고, 버튼에 따라 할당된 상품을 중간테이블에 batch 단위로 등록
+        button_ids = []
+        if arguments['button_product']:
+            button_ids = self.event_dao.post_event_buttons(
                 db,
-                {'name'     : button['name'],
-                 'order'    : button['order'],
-                 'event_id' : arguments['event_id'],
-                 'is_exist' : is_exist})
+                [{'name'     : button['name'],
+                  'order'    : button['order'],
+                  'event_id' : arguments['event_id'],
+                  'is_exist' : is_exist} for button in arguments['button_product']])
+
+        product_events = [
+            {'product_id' : product_id,
+             'order'      : index + 1,
+             'button_id'  : button_id}
+            for button, button_id in zip(arguments['button_product'], button_ids)
+            for index, product_id in enumerate(button['product_ids'])
+        ]
 
-            for index, product_id in enumerate(button['product_ids']):
-                self.event_dao.post_product_events(
-                    db,
-                    {'product_id' : product_id,
-                     'order'      : index + 1,
-                     'button_id'  : button_id})
+        batch_size = self.config.get('EVENT_PRODUCT_BATCH_SIZE', 1000)
+        for start in range(0, len(product_events), batch_size):
+            self.event_dao.post_product_events(db, product_events[start:start + batch_size])
 
-                count += 1
+        count = len(product_events)
 
         arguments['mapped_product_count'] = count
 
@@ -153,38 +159,57 @@ class EventService:
                 'start_date'   : 등록일자 검색 시작일자,
                 'end_date'     : 등록일자 검색 종료일자,
                 'is_exposed'   : 노출여부,
-                'event_type'   : 기획전 타입
+                'event_type'   : 기획전 타입,
+                'cursor'       : 이전 페이지 응답의 next_cursor (None 이면 첫 페이지),
+                'limit'        : 가져올 개수
             }
             db = DATABASE Connection Instance
         Returns :
-            event_list = [{
-                'event_number'         : 기획전 번호,
-                'event_name'           : 기획전 명,
-                'event_status_name'    : 기획전 상태 명,
-                'event_type_name'      : 기획전 타입 명,
-                'event_kind_name'      : 기획전 종류 명,
-                'started_at'           : 시작일자,
-                'ended_at'             : 종료일자,
-                'is_exposed'           : 노출여부,
-                'register_date'        : 등록일자,
-                'mapped_product_count' : 매핑 상품 수,
-                'view_count'           : 조회 수
-            }]
+            result = {
+                'count'       : 전체 조회 건수 (첫 페이지에서만, 이후 페이지는 None),
+                'next_cursor' : 다음 페이지 커서 (마지막 페이지면 None),
+                'event_list'  : [{
+                    'event_number'         : 기획전 번호,
+                    'event_name'           : 기획전 명,
+                    'event_status_name'    : 기획전 상태 명,
+                    'event_type_name'      : 기획전 타입 명,
+                    'event_kind_name'      : 기획전 종류 명,
+                    'started_at'           : 시작일자,
+                    'ended_at'             : 종료일자,
+                    'is_exposed'           : 노출여부,
+                    'register_date'        : 등록일자,
+                    'mapped_product_count' : 매핑 상품 수,
+                    'view_count'           : 조회 수
+                }]
+            }
         Author :
             김태수
         History:
             2020-10-07 : 초기 생성
+            2026-10-18 : 기획전 번호 기준 커서 페이지네이션, 전체 건수 추가. 날짜 형식은 쿼리에서 맞춘다.
         """
 
+        # 다음 페이지들은 첫 페이지에서 받은 건수를 그대로 쓰므로 다시 세지 않는다.
+        arguments['is_count_needed'] = not arguments['cursor']
+
         event_list = self.event_dao.get_event_list(db, arguments)
 
-        # 날짜 형식 맞추는 반복문
+        count = None
+        if arguments['is_count_needed']:
+            count = event_list[0]['total_count'] if event_list else 0
+
         for event in event_list:
-            event['started_at']    = event['started_at'].isoformat(' ')
-            event['ended_at']      = event['ended_at'].isoformat(' ')
-            event['register_date'] = event['register_date'].isoformat(' ')
+            event.pop('total_count', None)
 
-        return event_list
+        next_cursor = None
+        if len(event_list) == arguments['limit']:
+            next_cursor = event_list[-1]['event_number']
+
+        return {
+            'count'       : count,
+            'next_cursor' : next_cursor,
+            'event_list'  : event_list
+        }
 
     def delete_event(self, db, arguments):
         """
@@ -211,34 +236,24 @@ class EventService:
         Args:
             db = DATABASE Connection Instance
         Returns :
-            count : 상태 변경된 개수
+            result = {
+                'waiting'     : 대기로 바뀐 개수,
+                'in_progress' : 진행중으로 바뀐 개수,
+                'ended'       : 종료로 바뀐 개수,
+                'count'       : 상태 변경된 개수,
+                'duration_ms' : 걸린 시간(ms)
+            }
         Author :
             김태수
         History:
             2020-10-07 : 초기 생성
+            2026-10-18 : 기획전마다 UPDATE 하던 것을 상태별 UPDATE 세 번으로 변경, 실행 결과 반환
         """
-        event_statuses = self.event_dao.get_event_status(db)
-
-        count = 0
-
-        # 상태가 올바른 상태인지 확인하는 반복문
-        for event_status in event_statuses:
-            # 대기중인 상태
-            if datetime.fromisoformat(str(event_status['started_at'])) > datetime.today():
-                if event_status['event_status_id'] != 3:
-                    self.event_dao.put_event_status(db, {'event_status_id':3, 'event_id':event_status['event_id']})
-                    count += 1
-
-            # 진행중인 상태
-            elif datetime.fromisoformat(str(event_status['started_at'])) <= datetime.today() and datetime.fromisoformat(str(event_status['ended_at'])) >= datetime.today():
-                if event_status['event_status_id'] != 1:
-                    self.event_dao.put_event_status(db, {'event_status_id':1, 'event_id':event_status['event_id']})
-                    count += 1
-
-            # 종류인 상태
-            else:
-                if event_status['event_status_id'] != 2:
-                    self.event_dao.put_event_status(db, {'event_status_id':2, 'event_id':event_status['event_id']})
-                    count += 1
-
-        return count
+        started = time.monotonic()
+
+        result = self.event_dao.update_event_statuses(db)
+
+        result['count']       = result['waiting'] + result['in_progress'] + result['ended']
+        result['duration_ms'] = round((time.monotonic() - started) * 1000, 1)
+
+        return result
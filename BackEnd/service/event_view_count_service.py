@@ -0,0 +1,158 @@
+import atexit
+import os
+import threading
+import traceback
+
+from collections import defaultdict
+
+from connection import get_pool
+
+class EventViewCountService:
+    def __init__(self, event_dao, config):
+        """
+        기획전 조회수 write-behind 카운터 - Business Layer(service) class
+        조회할 때마다 DB 에 쓰지 않고 프로세스 메모리에 기획전별로 모았다가,
+        주기적으로 (그리고 종료할 때) UPDATE 한 번으로 반영한다.
+        Args:
+            event_dao = EventDao
+            config    = 앱 설정
+                EVENT_VIEW_COUNT_FLUSH_INTERVAL : 반영 주기(초)
+                EVENT_VIEW_COUNT_MAX_PENDING    : 모인 기획전 수가 이 값을 넘으면 주기 전에 반영
+                EVENT_VIEW_COUNT_BATCH_SIZE     : UPDATE 한 번에 반영할 기획전 수
+        Author :
+            김태수
+        History:
+            2026-10-18 : 초기 생성
+        """
+        self.event_dao      = event_dao
+        self.config         = config
+        self.flush_interval = config.get('EVENT_VIEW_COUNT_FLUSH_INTERVAL', 5)
+        self.max_pending    = config.get('EVENT_VIEW_COUNT_MAX_PENDING', 10000)
+        self.batch_size     = config.get('EVENT_VIEW_COUNT_BATCH_SIZE', 500)
+
+        # 기획전 아이디 -> 아직 반영하지 않은 조회수
+        self.pending = defaultdict(int)
+        self.lock    = threading.Lock()
+
+        # 반영 스레드는 처음 조회수가 들어올 때 프로세스(gunicorn 워커)마다 띄운다.
+        self.flusher     = None
+        self.flusher_pid = None
+        self.wakeup      = threading.Event()
+        self.stopped     = threading.Event()
+
+        atexit.register(self.close)
+
+    def increase_view_count(self, event_id, count=1):
+        """
+        기획전 조회수 증가 (메모리에만 더하고 바로 리턴) - Business Layer(service) function
+        Args:
+            event_id : 기획전 아이디
+            count    : 더할 조회수
+        Returns :
+            ''
+        Author :
+            김태수
+        History:
+            2026-10-18 : 초기 생성
+        """
+        self.start_flusher()
+
+        with self.lock:
+            self.pending[event_id] += count
+            is_full = len(self.pending) >= self.max_pending
+
+        if is_full:
+            self.wakeup.set()
+
+        return ''
+
+    def start_flusher(self):
+        if self.flusher_pid == os.getpid():
+            return
+
+        with self.lock:
+            if self.flusher_pid == os.getpid():
+                return
+
+            # fork 전에 모인 값은 부모 프로세스가 반영하므로 버린다.
+            self.pending.clear()
+            self.wakeup.clear()
+            self.stopped.clear()
+
+            self.flusher = threading.Thread(target=self.run_flusher, name='event-view-count', daemon=True)
+            self.flusher.start()
+            self.flusher_pid = os.getpid()
+
+    def run_flusher(self):
+        while not self.stopped.is_set():
+            self.wakeup.wait(self.flush_interval)
+            self.wakeup.clear()
+
+            try:
+                self.flush()
+            except Exception:
+                traceback.print_exc()
+
+    def flush(self):
+        """
+        모인 조회수를 DB 에 반영 - Business Layer(service) function
+        반영에 실패하면 다음 반영 때 다시 시도하도록 되돌려 놓는다.
+        Returns :
+            count : 반영한 기획전 수
+        Author :
+            김태수
+        History:
+            2026-10-18 : 초기 생성
+        """
+        with self.lock:
+            if not self.pending:
+                return 0
+
+            pending      = self.pending
+            self.pending = defaultdict(int)
+
+        view_counts = list(pending.items())
+
+        db = None
+        try:
+            db = get_pool().acquire()
+
+            for start in range(0, len(view_counts), self.batch_size):
+                self.event_dao.increase_view_counts(db, view_counts[start:start + self.batch_size])
+
+            db.commit()
+
+        except Exception:
+            if db:
+                db.rollback()
+
+            with self.lock:
+                for event_id, count in view_counts:
+                    self.pending[event_id] += count
+            raise
+
+        finally:
+            if db:
+                db.close()
+
+        return len(view_counts)
+
+    def close(self):
+        """
+        반영 스레드를 멈추고 남은 조회수를 반영 (프로세스 종료 시) - Business Layer(service) function
+        Author :
+            김태수
+        History:
+            2026-10-18 : 초기 생성
+        """
+        if self.flusher_pid != os.getpid():
+            return
+
+        self.stopped.set()
+        self.wakeup.set()
+        self.flusher.join(self.flush_interval)
+
+        try:
+            self.flush()
+        except Exception:
+            traceback.print_exc()
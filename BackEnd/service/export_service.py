@@ -0,0 +1,285 @@
+import os
+import time
+import traceback
+import uuid
+
+from concurrent.futures import ThreadPoolExecutor
+
+from connection import get_pool
+from exceptions import ExportJobNotFoundError, ExportJobLimitError, ExportJobNotReadyError, ValidationError
+from utils.job_backend import JOB_PENDING, JOB_RUNNING, JOB_DONE, JOB_FAILED
+
+def is_process_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # 다른 사용자의 프로세스지만 살아 있다.
+        return True
+    return True
+
+class ExportService:
+    def __init__(self, job_backend, config):
+        """
+        파일 내보내기(엑셀 / CSV) 백그라운드 작업 서비스
+        요청 스레드에서는 작업만 등록하고, 파일은 프로세스 안의 워커 스레드가 만든다.
+
+        Args:
+            job_backend: 작업 저장소 (utils.job_backend)
+            config     : 앱 설정
+                EXPORT_DIRECTORY          : 결과 파일 경로
+                EXPORT_WORKERS            : 워커 스레드 수
+                EXPORT_MAX_JOBS_PER_SELLER: 셀러당 동시에 진행할 수 있는 작업 수
+                EXPORT_RESULT_TTL         : 결과 파일 보관 시간(초)
+                EXPORT_MAX_RUNTIME        : 이 시간이 지나도 끝나지 않은 작업은 정리(초)
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        self.job_backend         = job_backend
+        self.config              = config
+        self.directory           = config.get('EXPORT_DIRECTORY', 'temp/exports/')
+        self.max_jobs_per_seller = config.get('EXPORT_MAX_JOBS_PER_SELLER', 2)
+        self.result_ttl          = config.get('EXPORT_RESULT_TTL', 3600)
+        self.max_runtime         = config.get('EXPORT_MAX_RUNTIME', 3600)
+        self.executor            = ThreadPoolExecutor(
+            max_workers        = config.get('EXPORT_WORKERS', 2),
+            thread_name_prefix = 'export'
+        )
+        # 작업 종류 -> 파일 만드는 함수
+        self.renderers = dict()
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    def register(self, kind, renderer):
+        """
+        작업 종류 등록
+
+        Args:
+            kind    : 작업 종류 이름 (예: 'products')
+            renderer: renderer(conn, params, report) -> (bytes 조각 iterable, mimetype, 다운로드 파일 이름)
+                      report(처리한 row 수) 로 진행 상황을 알린다.
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        self.renderers[kind] = renderer
+
+    def submit_export(self, seller_id, kind, params):
+        """
+        내보내기 작업 등록
+
+        Args:
+            seller_id: 요청한 셀러 아이디
+            kind     : 작업 종류
+            params   : 작업 파라미터 (JSON 으로 저장 가능한 딕셔너리)
+
+        Returns:
+            등록된 작업 딕셔너리
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+            2026-10-18(김태수): 죽은 워커의 작업은 동시 작업 수에서 빼도록 실패 처리
+        """
+        if kind not in self.renderers:
+            raise ValidationError(f"INVALID_EXPORT_TYPE_{kind}")
+
+        self.purge_expired_exports()
+        self.fail_orphaned_exports(seller_id)
+
+        now = time.time()
+        job = {
+            'job_id'     : uuid.uuid4().hex,
+            'seller_id'  : seller_id,
+            'kind'       : kind,
+            'params'     : params,
+            'status'     : JOB_PENDING,
+            'progress'   : 0,
+            'filename'   : None,
+            'mimetype'   : None,
+            'path'       : None,
+            'error'      : None,
+            'created_at' : now,
+            'finished_at': None,
+            'expires_at' : now + self.max_runtime,
+            # 작업을 실행할 워커 스레드가 있는 프로세스 (죽으면 작업을 실패 처리한다)
+            'worker_pid' : os.getpid()
+        }
+
+        if not self.job_backend.create(job, self.max_jobs_per_seller):
+            raise ExportJobLimitError("TOO_MANY_EXPORT_JOBS")
+
+        self.executor.submit(self.run_export, job['job_id'])
+        return job
+
+    def run_export(self, job_id):
+        """
+        내보내기 작업 실행 (워커 스레드)
+        파일을 .part 로 쓰고, 다 쓰면 이름을 바꿔 완료 처리한다.
+
+        Args:
+            job_id: 작업 아이디
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        job = self.job_backend.get(job_id)
+        if not job:
+            return
+
+        self.job_backend.update(job_id, status=JOB_RUNNING)
+
+        path = os.path.join(self.directory, job_id)
+        conn = None
+        try:
+            conn   = get_pool().acquire()
+            report = lambda count: self.job_backend.update(job_id, progress=count)
+            chunks, mimetype, filename = self.renderers[job['kind']](conn, job['params'], report)
+
+            with open(path + '.part', 'wb') as f:
+                for chunk in chunks:
+                    f.write(chunk)
+            os.replace(path + '.part', path)
+
+            # 실행 중에 정리(만료)된 작업이면 파일도 남기지 않는다.
+            if not self.job_backend.get(job_id):
+                self.remove_file(path)
+                return
+
+            now = time.time()
+            self.job_backend.update(
+                job_id,
+                status      = JOB_DONE,
+                filename    = filename,
+                mimetype    = mimetype,
+                path        = path,
+                finished_at = now,
+                expires_at  = now + self.result_ttl
+            )
+        except Exception as e:
+            traceback.print_exc()
+            self.remove_file(path + '.part')
+
+            now = time.time()
+            self.job_backend.update(
+                job_id,
+                status      = JOB_FAILED,
+                error       = str(e.args[-1]) if e.args else type(e).__name__,
+                finished_at = now,
+                expires_at  = now + self.result_ttl
+            )
+        finally:
+            if conn:
+                conn.close()
+
+    def get_export(self, seller_id, job_id):
+        """
+        내보내기 작업 상태 조회. 다른 셀러의 작업은 없는 것으로 본다.
+
+        Args:
+            seller_id: 요청한 셀러 아이디
+            job_id   : 작업 아이디
+
+        Returns:
+            작업 딕셔너리
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+            2026-10-18(김태수): 죽은 워커의 작업은 실패로 보이도록 변경
+        """
+        self.purge_expired_exports()
+        self.fail_orphaned_exports(seller_id)
+
+        job = self.job_backend.get(job_id)
+        if not job or job['seller_id'] != seller_id:
+            raise ExportJobNotFoundError("EXPORT_JOB_NOT_FOUND")
+        return job
+
+    def get_export_file(self, seller_id, job_id):
+        """
+        완료된 내보내기 작업의 파일 정보 조회
+
+        Args:
+            seller_id: 요청한 셀러 아이디
+            job_id   : 작업 아이디
+
+        Returns:
+            작업 딕셔너리 (path, filename, mimetype 포함)
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        job = self.get_export(seller_id, job_id)
+        if job['status'] != JOB_DONE:
+            raise ExportJobNotReadyError(f"EXPORT_JOB_{job['status']}")
+        return job
+
+    def fail_orphaned_exports(self, seller_id):
+        """
+        워커 프로세스가 죽어 끝날 수 없는 셀러의 작업을 실패 처리
+        EXPORT_MAX_RUNTIME 이 지날 때까지 동시 작업 수를 차지하지 않도록 한다.
+        (작업 저장소는 같은 서버의 프로세스끼리 공유하므로 pid 로 확인할 수 있다)
+
+        Args:
+            seller_id: 셀러 아이디
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        for job in self.job_backend.find_active(seller_id):
+            if not job['worker_pid'] or is_process_alive(job['worker_pid']):
+                continue
+
+            self.remove_file(os.path.join(self.directory, job['job_id']) + '.part')
+
+            now = time.time()
+            self.job_backend.update(
+                job['job_id'],
+                status      = JOB_FAILED,
+                error       = 'EXPORT_WORKER_DIED',
+                finished_at = now,
+                expires_at  = now + self.result_ttl
+            )
+
+    def purge_expired_exports(self):
+        """
+        보관 시간이 지난 작업과 결과 파일 삭제
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        for job in self.job_backend.find_expired(time.time()):
+            self.remove_file(os.path.join(self.directory, job['job_id']))
+            self.remove_file(os.path.join(self.directory, job['job_id']) + '.part')
+            self.job_backend.delete(job['job_id'])
+
+    def remove_file(self, path):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
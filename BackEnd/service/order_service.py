@@ -1,9 +1,41 @@
-from datetime import datetime
+import base64, binascii, json
+
+from datetime import date, datetime, timedelta
+
+from utils.cache  import TTLCache
+from utils.export import iter_csv, iter_xlsx, count_rows, CSV_MIMETYPE, XLSX_MIMETYPE
+
+# 환불 요청 취소 (환불 요청 이전 상태로 되돌림)
+REFUND_REQUEST_CANCEL = 0
+
+# 현재 상태 -> 바꿀 수 있는 상태
+# 1: 결제완료, 2: 상품준비, 3: 배송중, 4: 배송완료, 5: 구매확정, 6: 주문취소완료, 7: 환불요청, 8: 환불완료
+ORDER_STATUS_TRANSITIONS = {
+    1 : (2, 6),
+    2 : (3, 6),
+    3 : (4, 7),
+    4 : (5, 7),
+    7 : (8, REFUND_REQUEST_CANCEL)
+}
+
+ORDER_EXCEL_HEADER = [
+    '결제일자', '배송시작일', '현재상태 변경일', '주문번호', '주문상세번호', '셀러명', '상품명', '옵션정보',
+    '수량', '주문자명', '핸드폰번호', '결제금액', '주문취소사유', '환불요청사유'
+]
+
 class OrderService:
     def __init__(self, order_dao, config):
         self.order_dao = order_dao
         self.config    = config
 
+        # 주문 상세 페이지 캐시 (키: 주문 상세 아이디), ORDER_DETAIL_CACHE_TTL 이 0 이면 사용하지 않는다.
+        # 프로세스마다 따로 가지므로 다른 프로세스에서 바뀐 내용은 TTL 이 지나야 보인다.
+        detail_cache_ttl  = config.get('ORDER_DETAIL_CACHE_TTL', 5)
+        self.detail_cache = TTLCache(
+            maxsize = config.get('ORDER_DETAIL_CACHE_SIZE', 1024),
+            ttl     = detail_cache_ttl
+        ) if detail_cache_ttl else None
+
     def get_order_data(self, db, arguments):
         """
         주문정보 - Business Layer(service) function
@@ -22,10 +54,13 @@ class OrderService:
                 'offset'              : 페이지네이션 시작지점,
                 'limit'               : 전달할 주문 리스트 개수
                 'order_cancel_reason' : 주문 취소 사유,
-                'order_refund_reason' : 환불 요청 사유
+                'order_refund_reason' : 환불 요청 사유,
+                'cursor'              : 커서 (None 이면 offset 페이지네이션, 빈 문자열이면 커서 모드 첫 페이지)
             }
             db = DATABASE Connection Instance
         Returns :
+            count       : 전체 조회 건수 (커서 모드 두 번째 페이지부터는 None),
+            next_cursor : 다음 페이지 커서 (커서 모드, 마지막 페이지면 None),
             order_data = [{
                 "final_price"         : 결제금액,
                 "id"                  : 주문상세 아이디,
@@ -45,24 +80,49 @@ class OrderService:
         History:
             2020-09-28 : 초기 생성
             2020-09-29 : 결제 일자 기준이 아닌 현재 상태 기준으로 조회하도록 변경
+            2026-10-18 : 결제완료 / 배송시작 일자를 주문마다 조회하지 않고 페이지 단위로 한 번에 조회
+            2026-10-18 : 커서 페이지네이션 추가, 전체 건수를 리스트 조회에서 함께 계산
+            2026-10-18 : 결제완료 / 배송시작 일자를 현재 상태 테이블에서 함께 조회
         """
 
+        cursor = arguments.get('cursor')
+
+        arguments['is_cursor_mode']    = cursor is not None
+        arguments['cursor_updated_at'] = None
+        arguments['cursor_id']         = None
+        if cursor:
+            arguments['cursor_updated_at'], arguments['cursor_id'] = self.parse_order_cursor(cursor)
+
+        # 커서 모드의 다음 페이지들은 첫 페이지에서 받은 건수를 그대로 쓰므로 다시 세지 않는다.
+        arguments['is_count_needed'] = not arguments['cursor_updated_at']
+
         order_data = self.order_dao.get_order_data(db, arguments)
-        count      = self.order_dao.get_order_data_count(db, arguments)['count']
+
+        count = None
+        if arguments['is_count_needed']:
+            if order_data:
+                count = order_data[0]['total_count']
+            elif not arguments['is_cursor_mode'] and arguments['offset'] > 0:
+                # 마지막 페이지를 지난 경우에만 따로 센다.
+                count = self.order_dao.get_order_data_count(db, arguments)['count']
+            else:
+                count = 0
+
+        for order_datum in order_data:
+            order_datum.pop('total_count', None)
+
+        # 배송시작일이 필요한 경우 (배송완료 상태 조회)
+        is_shipping_needed = int(arguments['status_id']) == 7
 
         # 날짜 형식 맞춰주기 위한 반복문
+        # 결제완료 / 배송시작 일자는 현재 상태 테이블에서 리스트와 함께 조회된다.
         for order_datum in order_data:
-            # 배송시작일이 필요한 경우
-            if arguments['status_id'] == 7:
-                order_datum['shipping_started_at'] = self.order_dao.get_status_date(db, {
-                        'order_detail_id': order_datum['id'],
-                        'status_id'      : 3
-                    })['updated_at'].strftime('%Y-%m-%d %H:%M:%S')
-
-            order_datum['payment_complete'] = self.order_dao.get_status_date(db, {
-                'order_detail_id' : order_datum['id'],
-                'status_id'       : 1
-                })['updated_at'].strftime('%Y-%m-%d %H:%M:%S')
+            shipping_started_at = order_datum.pop('shipping_started_at')
+            if is_shipping_needed:
+                order_datum['shipping_started_at'] = shipping_started_at.strftime('%Y-%m-%d %H:%M:%S') if shipping_started_at else None
+
+            if order_datum['payment_complete']:
+                order_datum['payment_complete'] = order_datum['payment_complete'].strftime('%Y-%m-%d %H:%M:%S')
 
             order_datum['current_updated_at'] = order_datum['current_updated_at'].strftime('%Y-%m-%d %H:%M:%S')
 
@@ -71,63 +131,339 @@ class OrderService:
             'order_data' : order_data
         }
 
+        if arguments['is_cursor_mode']:
+            result['next_cursor'] = None
+            if len(order_data) == arguments['limit']:
+                result['next_cursor'] = self.make_order_cursor(order_data[-1])
+
         return result
 
+    def make_order_excel_row(self, order_datum):
+        """
+        주문 하나를 엑셀 한 줄로 만들기 - Business Layer(service) function
+        Args:
+            order_datum = 주문 딕셔너리 (iter_order_data_for_download)
+        Returns :
+            ORDER_EXCEL_HEADER 순서의 값 리스트
+        Author :
+            김태수
+        History:
+            2026-10-18 : 초기 생성
+        """
+
+        return [
+            order_datum['payment_complete'],
+            order_datum['shipping_started_at'],
+            order_datum['current_updated_at'],
+            order_datum['order_number'],
+            order_datum['order_detail_number'],
+            order_datum['seller_name'],
+            order_datum['product_name'],
+            order_datum['option_info'],
+            order_datum['quantity'],
+            order_datum['user_name'],
+            order_datum['phone_number'],
+            order_datum['final_price'],
+            order_datum['order_cancel_reason'],
+            order_datum['order_refund_reason']
+        ]
+
+    def stream_order_file(self, db, file_format, arguments, report=None):
+        """
+        주문 리스트 파일을 임시 파일 없이 조각 단위로 만들기 - Business Layer(service) function
+        서버 사이드 커서로 한 줄씩 읽어 바로 xlsx / csv 로 쓰므로 주문 수와 상관없이 메모리 사용량이 일정하다.
+        Args:
+            db          = DATABASE Connection Instance (응답이 끝날 때까지 사용)
+            file_format = 'xlsx' 또는 'csv'
+            arguments   = 주문 리스트 조회 조건 (offset, limit 없음)
+            report      = 진행 상황(쓴 주문 수)을 받을 함수
+        Returns :
+            chunks, mimetype, filename_for_user
+        Author :
+            김태수
+        History:
+            2026-10-18 : 초기 생성
+        """
+
+        order_data = self.order_dao.iter_order_data_for_download(db, arguments)
+        rows       = count_rows((self.make_order_excel_row(order_datum) for order_datum in order_data), report)
+        name       = "주문리스트_브랜디"
+
+        if file_format == "csv":
+            return iter_csv(ORDER_EXCEL_HEADER, rows), CSV_MIMETYPE, f"{name}.csv"
+
+        return iter_xlsx(ORDER_EXCEL_HEADER, rows), XLSX_MIMETYPE, f"{name}.xlsx"
+
+    def make_order_cursor(self, order_datum):
+        """
+        주문 리스트 커서 만들기 - Business Layer(service) function
+        Args:
+            order_datum = 페이지의 마지막 주문 (current_updated_at, id 포함)
+        Returns :
+            (현재 상태 변경일자, 주문 상세 아이디)를 담은 base64 문자열
+        Author :
+            김태수
+        History:
+            2026-10-18 : 초기 생성
+        """
+
+        data = json.dumps({'updated_at': order_datum['current_updated_at'], 'id': order_datum['id']})
+        return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii')
+
+    def parse_order_cursor(self, cursor):
+        """
+        주문 리스트 커서 읽기 - Business Layer(service) function
+        Args:
+            cursor = make_order_cursor 로 만든 문자열
+        Returns :
+            (현재 상태 변경일자, 주문 상세 아이디)
+
+            ValueError : 잘못된 커서
+        Author :
+            김태수
+        History:
+            2026-10-18 : 초기 생성
+        """
+
+        try:
+            decoded    = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+            updated_at = decoded['updated_at']
+            detail_id  = decoded['id']
+
+            datetime.strptime(updated_at, '%Y-%m-%d %H:%M:%S')
+        except (KeyError, TypeError, UnicodeEncodeError, binascii.Error):
+            raise ValueError('INVALID_CURSOR')
+
+        if not isinstance(detail_id, int) or detail_id < 1:
+            raise ValueError('INVALID_CURSOR')
+
+        return updated_at, detail_id
+
+    def backfill_current_statuses(self, db, batch_size=1000):
+        """
+        상태 변경 내역으로 현재 상태 테이블 채우기 - Business Layer(service) function
+        주문 상세 아이디 구간(batch_size)마다 커밋해서 긴 트랜잭션 / 락을 만들지 않는다.
+        Args:
+            db         = DATABASE Connection Instance
+            batch_size = 한 번에 처리할 주문 상세 아이디 구간 크기
+        Returns :
+            반영된 줄 수
+        Author :
+            김태수
+        History:
+            2026-10-18 : 초기 생성
+            2026-10-18 : 채운 뒤 주문 상태별 건수 다시 계산
+        """
+
+        max_id = self.order_dao.get_max_order_detail_id(db)
+        total  = 0
+
+        for start_id in range(0, max_id, batch_size):
+            total += self.order_dao.backfill_current_statuses(db, {
+                'start_id' : start_id,
+                'end_id'   : start_id + batch_size
+            })
+            db.commit()
+
+        # 채운 현재 상태 기준으로 상태별 건수도 처음부터 다시 맞춘다.
+        self.reconcile_order_status_counts(db, start_date=self.order_dao.get_first_order_status_date(db))
+
+        return total
+
+    def reconcile_order_status_counts(self, db, start_date=None, end_date=None):
+        """
+        주문 상태별 건수 다시 계산 (주기 작업) - Business Layer(service) function
+        상태 변경마다 증감하는 건수가 현재 상태 테이블과 어긋났을 때 바로잡는다.
+        트리거가 같은 테이블을 갱신하므로 ORDER_STATUS_COUNT_RECONCILE_DAYS 일씩 나눠서 커밋한다.
+        Args:
+            db         = DATABASE Connection Instance
+            start_date = 시작 일자 (없으면 최근 ORDER_STATUS_COUNT_RECONCILE_DAYS 일)
+            end_date   = 끝 일자, 포함하지 않음 (없으면 내일)
+        Returns :
+            고치거나 지운 줄 수
+        Author :
+            김태수
+        History:
+            2026-10-18 : 초기 생성
+            2026-10-18 : 전체 대신 기간을 나눠서 다시 계산
+        """
+
+        window_days = timedelta(days=self.config.get('ORDER_STATUS_COUNT_RECONCILE_DAYS', 7))
+
+        if not end_date:
+            end_date = date.today() + timedelta(days=1)
+
+        if not start_date:
+            start_date = end_date - window_days
+
+        total = 0
+
+        while start_date < end_date:
+            window_end_date = min(start_date + window_days, end_date)
+
+            total += self.order_dao.reconcile_order_status_counts(db, {
+                'start_date' : start_date,
+                'end_date'   : window_end_date
+            })
+            db.commit()
+
+            start_date = window_end_date
+
+        return total
+
+    def get_order_summary(self, db, arguments):
+        """
+        주문 상태별 건수 (대시보드) - Business Layer(service) function
+        Args:
+            arguments = {
+                'start_date'        : 조회 시작일,
+                'end_date'          : 조회 종료일,
+                'seller_properties' : 셀러속성 리스트 (None 이면 전체)
+            }
+            db = DATABASE Connection Instance
+        Returns :
+            {
+                'statuses'           : [{'order_status_id', 'count'}],
+                'seller_properties'  : [{'order_status_id', 'seller_property_id', 'count'}],
+                'dates'              : [{'order_status_id', 'date', 'count'}]
+            }
+        Author :
+            김태수
+        History:
+            2026-10-18 : 초기 생성
+        """
+
+        order_status_counts = self.order_dao.get_order_status_counts(db, arguments)
+
+        statuses          = {}
+        seller_properties = {}
+        dates             = {}
+
+        for row in order_status_counts:
+            status_id = row['order_status_id']
+            date      = row['bucket_date'].strftime('%Y-%m-%d')
+
+            statuses[status_id] = statuses.get(status_id, 0) + row['count']
+
+            property_key = (status_id, row['seller_property_id'])
+            seller_properties[property_key] = seller_properties.get(property_key, 0) + row['count']
+
+            date_key = (status_id, date)
+            dates[date_key] = dates.get(date_key, 0) + row['count']
+
+        return {
+            'statuses' : [
+                {'order_status_id': status_id, 'count': count}
+                for status_id, count in sorted(statuses.items())
+            ],
+            'seller_properties' : [
+                {'order_status_id': status_id, 'seller_property_id': seller_property_id, 'count': count}
+                for (status_id, seller_property_id), count in sorted(seller_properties.items())
+            ],
+            'dates' : [
+                {'order_status_id': status_id, 'date': date, 'count': count}
+                for (status_id, date), count in sorted(dates.items())
+            ]
+        }
+
     def update_order_status(self, db, arguments):
         """
         주문 상태 변경 - Business Layer(service) function
+        대상 주문의 현재 상태를 한 번에 읽어 변경 가능 여부를 메모리에서 확인하고,
+        변경 가능한 주문만 UPDATE 한 번(환불 요청 취소는 이전 상태별로 한 번씩), 내역 INSERT 한 번으로 반영한다.
         Args:
             arguments = {
-                'order_detail_id'     : 주문 상세 아이디,
-                'to_status'           : 변경하고자 하는 주문상태 아이디,
+                'order_detail_id'     : 주문 상세 아이디 리스트,
+                'to_status'           : 변경하고자 하는 주문상태 아이디 (0 은 환불 요청 취소),
                 'order_cancel_reason' : 주문 취소 사유,
                 'order_refund_reason' : 주문 환불 사유
             }
             db = DATABASE Connection Instance
         Returns :
-            ''
+            results = [{
+                'order_detail_id' : 주문 상세 아이디,
+                'result'          : SUCCESS | ORDER_NOT_FOUND | INVALID_STATUS_TRANSITION
+            }]
         Author :
             김태수
         History:
             2020-09-28 : 초기 생성
             2020-10-04 : 환불 요청 취소 반영
+            2026-10-18 : 상태 변경 가능 여부 확인, 여러 주문을 한 번에 변경하고 주문별 결과 반환
+            2026-10-18 : 변경할 상태 아이디를 int 로 변환 (변환할 수 없으면 ValueError)
+            2026-10-18 : 상세 페이지 캐시 비우기를 커밋 뒤 view 에서 하도록 이동
         """
 
-        # 환불 요청 취소일 경우는 이전 상태를 조회해서 변경하기 위한 조건문
-        if arguments['to_status'] == 0:
-            for order_detail_id in arguments['order_detail_id']:
-                argument = {
-                    'order_detail_id'        : [order_detail_id],
-                    'to_status'              : self.order_dao.get_order_current_status(db, {'order_detail_id':order_detail_id})['order_status_id'],
-                    'order_refund_reason_id' : None,
-                    'order_cancel_reason_id' : None
-                }
-                self.order_dao.update_order_status(db, argument)
-                self.order_dao.insert_order_status_history(db, argument)
+        order_detail_ids = list(dict.fromkeys(arguments['order_detail_id']))
 
-            return ''
+        # JSON / 폼에서 문자열("2")로 들어와도 상태 아이디(int)로 비교한다.
+        try:
+            to_status = int(arguments['to_status'])
+        except (TypeError, ValueError):
+            raise ValueError
 
-        arguments['order_cancel_reason_id'] = None
-        arguments['order_refund_reason_id'] = None
+        current_statuses = {
+            order_status['id'] : order_status['order_status_id']
+            for order_status in self.order_dao.get_order_statuses(db, {'order_detail_ids': order_detail_ids})
+        } if order_detail_ids else {}
 
-        if arguments['order_cancel_reason']:
-            arguments['order_cancel_reason_id'] = self.order_dao.get_cancel_reason_id(db, {"order_cancel_reason":arguments['order_cancel_reason']})['id']
-            arguments['order_refund_reason_id'] = None
+        results = {}
+        targets = {}
 
-        elif arguments['order_refund_reason']:
-            arguments['order_refund_reason_id'] = self.order_dao.get_refund_reason_id(db, {"order_refund_reason":arguments['order_refund_reason']})['id']
-            arguments['order_cancel_reason_id'] = None
+        for order_detail_id in order_detail_ids:
+            current_status = current_statuses.get(order_detail_id)
 
-        self.order_dao.update_order_status(db, arguments)
+            if current_status is None:
+                results[order_detail_id] = 'ORDER_NOT_FOUND'
+            elif to_status not in ORDER_STATUS_TRANSITIONS.get(current_status, ()):
+                results[order_detail_id] = 'INVALID_STATUS_TRANSITION'
+            else:
+                results[order_detail_id] = 'SUCCESS'
+                targets[order_detail_id] = to_status
 
-        for order_detail_id in arguments['order_detail_id']:
-            argument = {
-                'order_detail_id' : order_detail_id,
-                'to_status'       : arguments['to_status']
+        # 환불 요청 취소일 경우는 이전 상태(배송중 / 배송완료)로 되돌린다.
+        if to_status == REFUND_REQUEST_CANCEL and targets:
+            previous_statuses = {
+                previous_status['order_detail_id'] : previous_status['order_status_id']
+                for previous_status in self.order_dao.get_order_previous_statuses(db, {'order_detail_ids': list(targets)})
             }
-            self.order_dao.insert_order_status_history(db, argument)
 
-        return ''
+            for order_detail_id in list(targets):
+                if order_detail_id in previous_statuses:
+                    targets[order_detail_id] = previous_statuses[order_detail_id]
+                else:
+                    results[order_detail_id] = 'INVALID_STATUS_TRANSITION'
+                    del targets[order_detail_id]
+
+        order_cancel_reason_id = None
+        order_refund_reason_id = None
+
+        if targets and to_status != REFUND_REQUEST_CANCEL:
+            if arguments['order_cancel_reason']:
+                order_cancel_reason_id = self.order_dao.get_cancel_reason_id(db, {"order_cancel_reason":arguments['order_cancel_reason']})['id']
+
+            elif arguments['order_refund_reason']:
+                order_refund_reason_id = self.order_dao.get_refund_reason_id(db, {"order_refund_reason":arguments['order_refund_reason']})['id']
+
+        # 바꿀 상태가 같은 주문끼리 한 번에 변경
+        status_groups = {}
+        for order_detail_id, status in targets.items():
+            status_groups.setdefault(status, []).append(order_detail_id)
+
+        for status, group in status_groups.items():
+            self.order_dao.update_order_status(db, {
+                'order_detail_id'        : group,
+                'to_status'              : status,
+                'order_cancel_reason_id' : order_cancel_reason_id,
+                'order_refund_reason_id' : order_refund_reason_id
+            })
+
+        self.order_dao.insert_order_status_histories(db, list(targets.items()))
+
+        return [
+            {'order_detail_id': order_detail_id, 'result': result}
+            for order_detail_id, result in results.items()
+        ]
 
     def get_order_detail(self, db, arguments):
         """
@@ -169,22 +505,43 @@ class OrderService:
             김태수
         History:
             2020-09-29 : 초기 생성
+            2026-10-18 : 상태 변경 내역을 한 쿼리로 함께 조회, 짧은 TTL 캐시 적용
         """
 
-        order_detail_data = self.order_dao.get_order_detail_data(db, arguments)
-
-        order_detail_data['payment_complete'] = order_detail_data['payment_complete'].strftime('%Y-%m-%d %H:%M:%S')
-        order_detail_data['order_date']       = order_detail_data['order_date'].strftime('%Y-%m-%d %H:%M:%S')
+        order_detail_id = int(arguments['order_detail_id'])
 
-        order_status_history = self.order_dao.get_order_status_history(db, arguments)
+        if self.detail_cache:
+            order_detail_data = self.detail_cache.get(order_detail_id)
+            if order_detail_data:
+                return order_detail_data
 
-        for status in order_status_history:
-            status['date'] = status['date'].strftime('%Y-%m-%d %H:%M:%S')
+        # 날짜 형식과 상태 변경 내역은 쿼리에서 만들어 온다.
+        order_detail_data = self.order_dao.get_order_detail_data(db, {'order_detail_id': order_detail_id})
 
-        order_detail_data.update({'order_status_history' : order_status_history})
+        if self.detail_cache:
+            self.detail_cache.set(order_detail_id, order_detail_data)
 
         return order_detail_data
 
+    def invalidate_order_detail(self, order_detail_ids):
+        """
+        주문 상세 페이지 캐시 비우기 - Business Layer(service) function
+        트랜잭션이 커밋되기 전에 비우면 동시에 들어온 조회가 이전 값을 다시 캐시에 넣으므로
+        반드시 커밋한 뒤에 호출한다.
+        Args:
+            order_detail_ids = 주문 상세 아이디 리스트
+        Author :
+            김태수
+        History:
+            2026-10-18 : 초기 생성
+        """
+
+        if not self.detail_cache:
+            return
+
+        for order_detail_id in order_detail_ids:
+            self.detail_cache.invalidate(int(order_detail_id))
+
     def put_address(self, db, arguments):
         """
         배송지 정보 수정 - Business layer(service) function
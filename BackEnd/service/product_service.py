@@ -1,32 +1,55 @@
 import boto3
 import uuid
+import json
+import base64
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
 
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from pyexcel_xls import save_data
 from werkzeug.utils import secure_filename
 
+import pymysql
+
 from exceptions import NonPrimaryImageError, NonImageFilenameError, ValidationError
+from utils.cache import ReferenceDataCache
+from utils.export import iter_csv, iter_xlsx, count_rows, CSV_MIMETYPE, XLSX_MIMETYPE
+
+PRODUCTS_EXCEL_HEADER = ['등록일', '대표이미지', '상품명', '상품코드', '상품번호', '셀러속성', '셀러명', '판매가', '할인가', '판매여부', '진열여부', '할인여부']
 
 class ProductService:
     def __init__(self, product_dao, config):
         self.product_dao = product_dao
         self.config      = config
-        self.s3          = boto3.client(
+
+        # 이미지 여러 장을 동시에 올리기 위한 설정. 클라이언트는 스레드끼리 공유한다.
+        self.s3_upload_workers = config.get('S3_UPLOAD_WORKERS', 5)
+        self.s3                = boto3.client(
             "s3",
             aws_access_key_id     = config['S3_ACCESS_KEY'],
-            aws_secret_access_key = config['S3_SECRET_KEY']
+            aws_secret_access_key = config['S3_SECRET_KEY'],
+            config                = Config(max_pool_connections = max(10, self.s3_upload_workers))
+        )
+        # 파일 단위로 병렬 업로드하므로 파일 하나는 한 스레드로 올린다.
+        self.s3_transfer_config = TransferConfig(use_threads = False)
+        # 상품 등록 / 수정 화면의 선택 목록 (국가, 색상, 사이즈, 카테고리)
+        self.reference_cache = ReferenceDataCache(
+            self.load_reference_data,
+            refresh_interval = config.get('REFERENCE_CACHE_REFRESH_INTERVAL', 3600),
+            retry_interval   = config.get('REFERENCE_CACHE_RETRY_INTERVAL', 60)
         )
 
-    def find_first_categories_by_seller_property_id(self, conn, seller_property_id):
+    def find_first_categories_by_seller_property_id(self, seller_property_id):
         """
         1차 카테고리를 셀러 속성 아이디로 조회하기 위한 서비스 레이어
 
         Args:
-            conn              : 데이터베이스 커넥션 객체
             seller_property_id: 셀러 속성 아이디
 
         Returns:
+            (results, etag)
             results: 1차 카테고리 정보를 담은 딕셔너리 리스트
                 [
                     {
@@ -41,18 +64,22 @@ class ProductService:
 
         History:
             2020-09-22(이충희): 초기 생성
+            2026-10-18(김태수): 기준 데이터 캐시에서 조회
         """
-        return self.product_dao.find_first_categories_by_seller_property_id(conn, seller_property_id)
+        cached = self.reference_cache.get('first_categories', seller_property_id)
+        if not cached:
+            raise pymysql.err.InternalError(10007, "DAO_COULD_NOT_SELECT_FIRST_CATEGRORIES")
+        return cached
 
-    def find_second_categories_by_first_category_id(self, conn, first_category_id):
+    def find_second_categories_by_first_category_id(self, first_category_id):
         """
         2차 카테고리를 1차 카테고리 아이디로 조회하기 위한 서비스 레이어
 
         Args:
-            conn             : 데이터베이스 커넥션 객체
             first_category_id: 1차 카테고리 아이디
 
         Returns:
+            (results, etag)
             results: 2차 카테고리 정보를 담은 딕셔너리 리스트
                 [
                     {
@@ -67,8 +94,54 @@ class ProductService:
 
         History:
             2020-09-22(이충희): 초기 생성
+            2026-10-18(김태수): 기준 데이터 캐시에서 조회
+        """
+        cached = self.reference_cache.get('second_categories', first_category_id)
+        if not cached:
+            raise pymysql.err.InternalError(10006, "DAO_COULD_NOT_SELECT_SECOND_CATEGRORIES")
+        return cached
+
+    def load_reference_data(self, conn):
+        """
+        기준 데이터 캐시에 넣을 데이터를 한 번에 읽는다.
+
+        Args:
+            conn: 데이터베이스 커넥션 객체
+
+        Returns:
+            {
+                "countries"        : 제조국 리스트,
+                "colors"           : 컬러 리스트,
+                "sizes"            : 사이즈 리스트,
+                "first_categories" : {셀러 속성 아이디: 1차 카테고리 리스트},
+                "second_categories": {1차 카테고리 아이디: 2차 카테고리 리스트}
+            }
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
         """
-        return self.product_dao.find_second_categories_by_first_category_id(conn, first_category_id)
+        first_categories = dict()
+        for row in self.product_dao.find_all_first_categories(conn):
+            first_categories.setdefault(row['seller_property_id'], []).append(
+                {"id": row['id'], "name": row['name']}
+            )
+
+        second_categories = dict()
+        for row in self.product_dao.find_all_second_categories(conn):
+            second_categories.setdefault(row['first_category_id'], []).append(
+                {"id": row['id'], "name": row['name']}
+            )
+
+        return {
+            "countries"        : self.product_dao.find_all_countries(conn),
+            "colors"           : self.product_dao.find_all_colors(conn),
+            "sizes"            : self.product_dao.find_all_sizes(conn),
+            "first_categories" : first_categories,
+            "second_categories": second_categories
+        }
 
     def upload_image_to_s3(self, image, filename):
         """
@@ -90,11 +163,74 @@ class ProductService:
         self.s3.upload_fileobj(
             image,
             self.config['S3_BUCKET'],
-            filename
+            filename,
+            Config = self.s3_transfer_config
         )
 
         return f"{self.config['S3_BUCKET_URL']}{filename}"
 
+    def upload_images_to_s3(self, images, filenames):
+        """
+        S3에 이미지 여러 장을 동시에 업로드
+        하나라도 실패하면 이미 올라간 이미지는 지우고 예외를 다시 발생시킨다.
+
+        Args:
+            images   : 이미지 파일 리스트
+            filenames: 이미지 파일 이름 리스트 (images 와 같은 순서)
+
+        Returns:
+            urls: S3에 업로드된 파일 경로 리스트 (images 와 같은 순서)
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        if not images:
+            return []
+
+        workers = min(len(images), self.s3_upload_workers)
+        with ThreadPoolExecutor(max_workers = workers) as executor:
+            futures = [
+                executor.submit(self.upload_image_to_s3, image, filename)
+                for image, filename in zip(images, filenames)
+            ]
+
+        # with 블록을 나오면 모든 업로드가 끝나 있다.
+        errors = [future.exception() for future in futures if future.exception()]
+        if errors:
+            uploaded = [
+                filename for future, filename in zip(futures, filenames) if not future.exception()
+            ]
+            self.delete_images_from_s3(uploaded)
+            raise errors[0]
+
+        return [future.result() for future in futures]
+
+    def delete_images_from_s3(self, filenames):
+        """
+        S3 이미지 한 번에 삭제 (등록 실패 시 남은 이미지 정리용)
+
+        Args:
+            filenames: 삭제할 이미지 파일 이름(키) 리스트
+
+        Returns:
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        if not filenames:
+            return
+
+        self.s3.delete_objects(
+            Bucket = self.config['S3_BUCKET'],
+            Delete = {"Objects": [{"Key": filename} for filename in filenames], "Quiet": True}
+        )
+
 
     def search_sellers(self, conn, search_term, limit):
         """
@@ -125,38 +261,26 @@ class ProductService:
         """
         return self.dao.find_sellers_by_search_term(conn, search_term, limit)
 
-    def add_product(self, conn, images, body):
+    def upload_product_images(self, images):
         """
-        상품 등록을 위한 서비스 레이어
-        1. JSON 및 이미지 파일 유효성 검사
-        2. 상품 추가
-        3. 상품 상세 추가
-        4. 옵션 추가
-        5. S3 이미지 업로드 및 상품 이미지 DB에 추가
+        상품 등록 전에 이미지 검사 후 S3에 동시 업로드
+        데이터베이스 트랜잭션을 시작하기 전에 호출해서, 업로드하는 동안 커넥션과 row lock 을 잡고 있지 않는다.
 
         Args:
-            conn  : 데이터베이스 커넥션 객체
-            images: 상품 이미지 파일들
-            body  : 상품 정보를 담고 있는 json 바디
+            images: 상품 이미지 파일들 (첫 번째는 대표 이미지)
 
         Returns:
+            code     : 상품 코드 (이미지 파일 이름 앞에 붙인다)
+            filenames: S3에 올린 이미지 파일 이름(키) 리스트 (등록 실패 시 삭제용)
+            urls     : S3에 업로드된 파일 경로 리스트
 
         Author:
-            이충희(choonghee.dev@gmail.com)
+            김태수
 
         History:
-            2020-09-27(이충희): 초기 생성
-            2020-09-29(이충희): 커스텀 에러 처리 추가
+            2026-10-18(김태수): add_product 에서 분리
         """
-        product            = body['product']
-        product_detail     = body['detail']
-        options            = body['options']
-        first_category_id  = product['first_category_id']
-        second_category_id = product['second_category_id']
-        product_detail['modifier_id'] = product['seller_id']
-        
         # 상품 코드는 유니크 해야하기 때문에 uuid 식별자 사용
-
         code = str(uuid.uuid4())
 
         filenames = []
@@ -175,9 +299,46 @@ class ProductService:
 
         images = [ image for image in images if image != None ]
 
-        # 1. 상품 추가
+        urls = self.upload_images_to_s3(images, filenames)
+
+        return code, filenames, urls
+
+    def add_product(self, conn, body, code, urls):
+        """
+        상품 등록을 위한 서비스 레이어
+        이미지는 upload_product_images 로 먼저 올리고, 여기서는 데이터베이스에만 쓴다.
+        1. 상품 추가
+        2. 상품 상세 추가
+        3. 옵션 추가
+        4. 상품 이미지 DB에 추가
+
+        Args:
+            conn: 데이터베이스 커넥션 객체
+            body: 상품 정보를 담고 있는 json 바디
+            code: 상품 코드 (upload_product_images 에서 만든 값)
+            urls: S3에 업로드된 이미지 경로 리스트
+
+        Returns:
+
+        Author:
+            이충희(choonghee.dev@gmail.com)
+
+        History:
+            2020-09-27(이충희): 초기 생성
+            2020-09-29(이충희): 커스텀 에러 처리 추가
+            2026-10-18(김태수): 옵션 / 이미지 한 번에 추가
+            2026-10-18(김태수): 이미지 검사 / 업로드를 upload_product_images 로 분리 (정리는 뷰에서)
+        """
+        product            = body['product']
+        product_detail     = body['detail']
+        options            = body['options']
+        first_category_id  = product['first_category_id']
+        second_category_id = product['second_category_id']
+        product_detail['modifier_id'] = product['seller_id']
+
         categories_id  = self.product_dao.find_categories_id(conn, first_category_id, second_category_id)
 
+        # 1. 상품 추가
         product['categories_id'] = categories_id['id']
         product['code']          = code
         product_id = self.product_dao.create_product(conn, product)
@@ -186,15 +347,14 @@ class ProductService:
         product_detail['product_id'] = product_id
         self.product_dao.create_product_detail(conn, product_detail)
 
-        # 3. 옵션 추가
+        # 3. 옵션 추가 (한 번에)
         for option in options:
             option['product_id'] = product_id
-            self.product_dao.create_option(conn, option)
+        self.product_dao.create_options_bulk(conn, options)
 
-        # 4. 이미지 S3 업로드 + 이미지 테이블 URL 추가
-        for i, image in enumerate(images):
-            url = self.upload_image_to_s3(image, filenames[i])
-            self.product_dao.create_product_image(conn, url, i+1, product_id)
+        # 4. 이미지 테이블 URL 추가 (한 번에)
+        product_images = [(url, i+1, product_id) for i, url in enumerate(urls)]
+        self.product_dao.create_product_images_bulk(conn, product_images)
 
     def get_products_list(
         self, 
@@ -210,10 +370,12 @@ class ProductService:
         seller_property_ids,
         is_sold,
         is_displayed,
-        is_discounted
+        is_discounted,
+        cursor = None
     ):
         """
         상품 리스트 조회 서비스 레이어
+        cursor 가 None 이 아니면 (등록일, 아이디) 기준 커서 페이지네이션으로 조회한다.
 
         Args:
             conn: 데이터베이스 커넥션 객체
@@ -229,9 +391,18 @@ class ProductService:
             is_sold: 판매 여부
             is_displayed: 조회 여부
             is_discounted: 할인 여부
+            cursor: 커서 모드일 때 이전 페이지 마지막 상품의 (등록일, 아이디), 첫 페이지는 ()
 
         Returns:
-            results: 
+            {
+                "total_count"   : 필터 조건의 전체 상품 개수,
+                "is_exact_count": 전체 개수가 정확한지 여부
+                                  (PRODUCTS_EXACT_COUNT_LIMIT 를 넘으면 False, total_count 는 그 기준값),
+                "next_cursor"   : 다음 페이지 커서 | None (커서 모드일 때만),
+                "products"      : results
+            }
+
+            results:
             [
                 {
                     "code"         : 상품코드
@@ -254,15 +425,23 @@ class ProductService:
 
         History:
             2020-09-30(이충희): 초기 생성
+            2026-10-18(김태수): 커서 페이지네이션 모드 추가
+            2026-10-18(김태수): 전체 개수 추가
+            2026-10-18(김태수): 상품명 / 셀러명 n-gram 전문 검색 적용
         """
         # SQL 파라미터를 딕셔너리로 제공하기 위해 만든다.
         params = dict()
         params['limit']        = limit
         params['offset']       = offset
+        params['is_cursor_mode']       = cursor is not None
+        params['cursor_register_date'] = cursor[0] if cursor else None
+        params['cursor_id']            = cursor[1] if cursor else None
         params['start_date']   = start_date
         params['end_date']     = end_date
         params['seller_name']  = '%' + seller_name + '%' if seller_name else None
         params['product_name'] = '%' + product_name + '%' if product_name else None
+        params['seller_name_search']  = self.make_ngram_search_term(seller_name)
+        params['product_name_search'] = self.make_ngram_search_term(product_name)
         params['product_id']   = product_id
         params['product_code'] = product_code
 
@@ -273,7 +452,75 @@ class ProductService:
         params['is_sold']       = is_sold
         params['is_displayed']  = is_displayed
         params['is_discounted'] = is_discounted
-        return self.product_dao.find_products(conn, params)
+
+        # 기준값보다 많으면 기준값 + 1 개까지만 세고 근사치로 알려준다.
+        exact_count_limit     = self.config.get('PRODUCTS_EXACT_COUNT_LIMIT', 10000)
+        params['count_limit'] = exact_count_limit + 1 if exact_count_limit else None
+
+        results, total_count = self.product_dao.find_products_with_count(conn, params)
+
+        is_exact_count = not exact_count_limit or total_count <= exact_count_limit
+        if not is_exact_count:
+            total_count = exact_count_limit
+
+        products = {
+            "total_count"   : total_count,
+            "is_exact_count": is_exact_count,
+            "products"      : results
+        }
+
+        if params['is_cursor_mode']:
+            # limit 만큼 채워졌을 때만 다음 페이지가 있을 수 있다.
+            products['next_cursor'] = self.make_products_cursor(results[-1]) if len(results) == limit else None
+
+        return products
+
+    def make_ngram_search_term(self, keyword):
+        """
+        n-gram 전문 검색(MATCH ... AGAINST) 검색어 만들기
+        검색어가 n-gram 토큰 크기보다 짧으면 인덱스로 찾을 수 없으므로 None 을 리턴하고,
+        DAO 는 LIKE 검색만 한다.
+
+        Args:
+            keyword: 사용자가 입력한 검색어
+
+        Returns:
+            불린 모드 구문 검색어 ('"검색어"') 또는 None
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        if not keyword:
+            return None
+
+        # 구문 검색의 따옴표와 겹치지 않도록 제거한다.
+        keyword = keyword.replace('"', ' ').strip()
+        if len(keyword) < self.config.get('NGRAM_TOKEN_SIZE', 2):
+            return None
+
+        return f'"{keyword}"'
+
+    def make_products_cursor(self, product):
+        """
+        상품 리스트 커서 만들기
+
+        Args:
+            product: 페이지의 마지막 상품 (register_date, id 포함)
+
+        Returns:
+            (등록일, 아이디)를 담은 base64 문자열
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        data = json.dumps({"register_date": product['register_date'], "id": product['id']})
+        return base64.urlsafe_b64encode(data.encode('utf-8')).decode('ascii')
 
     def get_product_by_code(self, conn, code):
         """
@@ -294,24 +541,19 @@ class ProductService:
 
         History:
             2020-09-30(이충희): 초기 생성
+            2026-10-18(김태수): 이미지 / 옵션까지 한 번에 조회
         """
-        # 1 to Many일 때 조인?
-        product_dict = self.product_dao.find_product_by_code(conn, code)
-        images_dict  = self.product_dao.find_product_images(conn, product_dict['product_id'])
-        options_dict = self.product_dao.find_product_options(conn, product_dict['product_id'])
-
-        product_dict["images"]  = images_dict
-        product_dict["options"] = options_dict
-        return product_dict
+        # 상품 / 이미지 / 옵션을 한 쿼리로 가져온다. (images, options 포함)
+        return self.product_dao.find_product_by_code(conn, code)
 
-    def get_countries(self, conn):
+    def get_countries(self):
         """
         제조국 리스트 조회
 
         Args:
-            conn: 데이터베이스 커넥션 객체
 
         Returns:
+            (리스트, etag)
             제조국 리스트
             [
                 {
@@ -325,17 +567,18 @@ class ProductService:
 
         History:
             2020-10-02(이충희): 초기 생성
+            2026-10-18(김태수): 기준 데이터 캐시에서 조회
         """
-        return self.product_dao.find_all_countries(conn)
+        return self.reference_cache.get('countries')
 
-    def get_colors(self, conn):
+    def get_colors(self):
         """
         컬러 리스트 조회
 
         Args:
-            conn: 데이터베이스 커넥션 객체
 
         Returns:
+            (리스트, etag)
             컬러 리스트
             [
                 {
@@ -350,17 +593,18 @@ class ProductService:
 
         History:
             2020-10-02(이충희): 초기 생성
+            2026-10-18(김태수): 기준 데이터 캐시에서 조회
         """
-        return self.product_dao.find_all_colors(conn)
+        return self.reference_cache.get('colors')
 
-    def get_sizes(self, conn):
+    def get_sizes(self):
         """
         사이즈 리스트 조회
 
         Args:
-            conn: 데이터베이스 커넥션 객체
 
         Returns:
+            (리스트, etag)
             사이즈 리스트
             [
                 {
@@ -375,8 +619,9 @@ class ProductService:
 
         History:
             2020-10-02(이충희)
+            2026-10-18(김태수): 기준 데이터 캐시에서 조회
         """
-        return self.product_dao.find_all_sizes(conn)
+        return self.reference_cache.get('sizes')
 
     def make_excel_file(self, directory, filename, results):
         """
@@ -396,25 +641,13 @@ class ProductService:
 
         History:
             2020-10-03(이충희)
+            2026-10-18(김태수): 한 줄 만들기를 make_excel_row 로 분리
         """
  
-        data = [['등록일', '대표이미지', '상품명', '상품코드', '상품번호', '셀러속성', '셀러명', '판매가', '할인가', '판매여부', '진열여부', '할인여부']]
+        data = [PRODUCTS_EXCEL_HEADER]
         for idx, item in enumerate(results):
             # 두 번째 줄 부터 데이터 넣기
-            data.append([
-                item['register_date'],
-                item['image_path'],
-                item['product_name'],
-                item['code'],
-                item['id'],
-                item['seller_property_name'],
-                item['seller_name'],
-                item['sale_price'],
-                int(item['discounted_price']),
-                item['is_sold'],
-                item['is_displayed'],
-                1 if item['discount_rate'] > 0 else 0
-            ])
+            data.append(self.make_excel_row(item))
 
         # now_date = datetime.datetime.now().strftime("%Y%m%d")
         # filename = now_date + "_" + filename
@@ -422,6 +655,100 @@ class ProductService:
         
         return directory, filename
 
+    def make_excel_row(self, item):
+        """
+        상품 하나를 엑셀 한 줄로 만들기
+
+        Args:
+            item: 상품 딕셔너리
+
+        Returns:
+            PRODUCTS_EXCEL_HEADER 순서의 값 리스트
+
+        Author:
+            이충희(choonghee.dev@gmail.com)
+
+        History:
+            2020-10-03(이충희)
+            2026-10-18(김태수): make_excel_file 에서 분리
+        """
+        return [
+            item['register_date'],
+            item['image_path'],
+            item['product_name'],
+            item['code'],
+            item['id'],
+            item['seller_property_name'],
+            item['seller_name'],
+            item['sale_price'],
+            int(item['discounted_price']),
+            item['is_sold'],
+            item['is_displayed'],
+            1 if item['discount_rate'] > 0 else 0
+        ]
+
+    def stream_products_file(self, conn, file_format, start_date=None, end_date=None, product_ids=None, report=None):
+        """
+        상품 리스트 파일을 임시 파일 없이 조각 단위로 만들기
+        서버 사이드 커서로 한 줄씩 읽어 바로 xlsx / csv 로 쓰므로 상품 수와 상관없이 메모리 사용량이 일정하다.
+
+        Args:
+            conn       : 데이터베이스 커넥션 객체 (응답이 끝날 때까지 사용)
+            file_format: 'xlsx' 또는 'csv'
+            start_date : 조건 시작 날짜
+            end_date   : 조건 종료 날짜
+            product_ids: 선택한 상품 아이디 리스트 (있으면 날짜 조건 대신 사용)
+            report     : 진행 상황(쓴 상품 수)을 받을 함수
+
+        Returns:
+            chunks           : 파일 내용 bytes 제너레이터
+            mimetype         : 파일 mimetype
+            filename_for_user: 다운로드 파일 이름
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        items = self.product_dao.iter_products_for_download(conn, start_date, end_date, product_ids)
+        rows  = count_rows((self.make_excel_row(item) for item in items), report)
+        name  = "선택상품엑셀다운로드_브랜디" if product_ids else "전체상품엑셀다운로드_브랜디"
+
+        if file_format == "csv":
+            return iter_csv(PRODUCTS_EXCEL_HEADER, rows), CSV_MIMETYPE, f"{name}.csv"
+
+        return iter_xlsx(PRODUCTS_EXCEL_HEADER, rows), XLSX_MIMETYPE, f"{name}.xlsx"
+
+    def export_products(self, conn, params, report):
+        """
+        상품 리스트 내보내기 작업 (ExportService 에 'products' 로 등록)
+
+        Args:
+            conn  : 데이터베이스 커넥션 객체
+            params: {"format", "start_date", "end_date", "product_ids"}
+            report: 진행 상황(쓴 상품 수)을 받을 함수
+
+        Returns:
+            chunks, mimetype, filename_for_user
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        product_ids = tuple(params['product_ids']) if params.get('product_ids') else None
+
+        return self.stream_products_file(
+            conn,
+            params.get('format', 'xlsx'),
+            params.get('start_date'),
+            params.get('end_date'),
+            product_ids,
+            report
+        )
+
     def make_excel_all(self, conn, start_date, end_date):
         """
         모든 상품 엑셀 파일 만들기
@@ -485,6 +812,7 @@ class ProductService:
 
         History:
             2020-10-04(이충희)
+            2026-10-18(김태수): 업로드 이미지 한 번에 추가
         """
 
         # 상품 아이디 꼭 필요. 어떤 상품을 수정할지 알아야하니까.
@@ -595,6 +923,7 @@ class ProductService:
                 self.product_dao.update_option(conn, option)
 
         # 4. 이미지 S3 업로드 + 이미지 테이블 URL 추가
+        product_images = []
         for i, image in enumerate(images):
 
             # NONE이면 이 뒤로는 이미지 수정하지 않음
@@ -631,11 +960,14 @@ class ProductService:
                     )
                     self.product_dao.delete_product_image(conn, product_id, i+1)
                     url = self.upload_image_to_s3(image['image'], image['filename'])
-                    self.product_dao.create_product_image(conn, url, i+1, product_id)
+                    product_images.append((url, i+1, product_id))
                 else:
                     # 없으면 그냥 업로드
                     url = self.upload_image_to_s3(image['image'], image['filename'])
-                    self.product_dao.create_product_image(conn, url, i+1, product_id)
+                    product_images.append((url, i+1, product_id))
+
+        # 업로드한 이미지는 마지막에 한 번에 추가
+        self.product_dao.create_product_images_bulk(conn, product_images)
 
     def get_product_history(self, conn, product_id):
         """
@@ -7,6 +7,12 @@ from flask_paginate import Pagination, get_page_args
 from pyexcel_xls    import save_data
 from werkzeug.utils import secure_filename
 
+from utils.cache    import seller_cache
+from utils.export   import iter_xlsx, count_rows, XLSX_MIMETYPE
+
+# 셀러 리스트 엑셀 상단 컬럼명
+SELLER_EXCEL_HEADER = ['번호','셀러아이디','영문이름','한글이름', '담당자이름','셀러상태','담당자연락처','담당자이메일','셀러속성','상품개수','등록일시']
+
 class SellerService:
     def __init__(self, dao, config):
         self.dao    = dao 
@@ -278,6 +284,7 @@ class SellerService:
                              -> 하나의 셀러 테이블을 sellers와 seller_informations으로 나누고 로직 변경
             2020.10.07(이지연)  : 회원가입할 시 셀러 계정아이디, 셀러 cs_phone, manager_phone unique처리 추가
             2020.10.08(이지연)  : 피드백 반영 팀원들과 형식 맞춰 수정
+            2026.10.18(김태수)  : 로그인 셀러 캐시 무효화 추가
         """
 
         #수정자가 자신이거나 mater인지 검사
@@ -375,6 +382,9 @@ class SellerService:
             manager['seller_id'] = updated_info['seller_id']
             self.dao.insert_manager(manager,conn)
 
+        # 로그인 데코레이터가 캐시한 셀러 정보(계정, cs 전화번호, 마스터 여부 등) 무효화
+        seller_cache.invalidate(updated_info['seller_id'])
+
         return "수정 완료" if results > 0 else "수정 실패"
 
     # s3에 이미지 파일 업로드
@@ -475,26 +485,23 @@ class SellerService:
         return results
 
     #엑셀 다운로드
-    def make_excel_file(self, conn, search_info):
+    def make_excel_rows(self, conn, search_info):
         """
-        엑셀 다운로드 파일 엔드포인트
+        셀러 리스트 엑셀 내용 만들기
 
         Args: 
-            search_info : 검색 결과 정보를 담을 리스트
+            search_info : 검색 조건
 
         Retruns:
-            400, {'message': 'UNSUCCESS'} 
+            SELLER_EXCEL_HEADER 순서의 값 리스트들
 
         Authors:
             wldus9503@gmail.com(이지연)
         
-        History:(
+        History:
             2020.10.09(이지연) : 초기 설정
-            2020.10.11(이지연) : user_id 중복 발생으로 인한 에러 수정
+            2026.10.18(김태수) : make_excel_file 에서 분리
         """
-        
-        results = {}
-
         if search_info is None:
             raise Exception("INVALID_PARAMETER")
 
@@ -509,12 +516,10 @@ class SellerService:
                 temp.append(result['id']) #temp에 id값 넣기
                 seller_list.append(result) #반환용 seller_list에 검색결과 row하나씩 넣기
 
-        #엑셀 상단 컬럼명
-        data = [['번호','셀러아이디','영문이름','한글이름', '담당자이름','셀러상태','담당자연락처','담당자이메일','셀러속성','상품개수','등록일시']]
-
-        #중복 제거한 seller_list를 순선대로 data에 리스트 형으로 append
+        #중복 제거한 seller_list를 순선대로 리스트 형으로 append
+        rows = []
         for i, item in enumerate(seller_list):
-            data.append([
+            rows.append([
                 item['id'],
                 item['seller_account'],
                 item['english_name'],
@@ -527,6 +532,50 @@ class SellerService:
                 item['registered_product_count'],
                 item['register_date']
             ])
+        return rows
+
+    def export_sellers(self, conn, search_info, report):
+        """
+        셀러 리스트 내보내기 작업 (ExportService 에 'sellers' 로 등록)
+
+        Args: 
+            conn        : 데이터베이스 커넥션 객체
+            search_info : 검색 조건
+            report      : 진행 상황(쓴 셀러 수)을 받을 함수
+
+        Retruns:
+            chunks, mimetype, filename_for_user
+
+        Authors:
+            김태수
+        
+        History:
+            2026.10.18(김태수) : 초기 생성
+        """
+        rows = count_rows(self.make_excel_rows(conn, search_info), report)
+        return iter_xlsx(SELLER_EXCEL_HEADER, rows), XLSX_MIMETYPE, "셀러리스트엑셀_브랜디.xlsx"
+
+    def make_excel_file(self, conn, search_info):
+        """
+        엑셀 다운로드 파일 엔드포인트
+
+        Args: 
+            search_info : 검색 결과 정보를 담을 리스트
+
+        Retruns:
+            400, {'message': 'UNSUCCESS'} 
+
+        Authors:
+            wldus9503@gmail.com(이지연)
+        
+        History:(
+            2020.10.09(이지연) : 초기 설정
+            2020.10.11(이지연) : user_id 중복 발생으로 인한 에러 수정
+            2026.10.18(김태수) : 엑셀 내용 만들기를 make_excel_rows 로 분리
+        """
+        
+        #엑셀 상단 컬럼명 + 중복 제거한 셀러 리스트
+        data = [SELLER_EXCEL_HEADER] + self.make_excel_rows(conn, search_info)
         
         #data라는 엑셀에 넣을 데이터를 만들어낸 후
         #directory는 "temp/" 라는 폴더로 지정
@@ -0,0 +1,241 @@
+import hashlib
+import json
+import threading
+import time
+import traceback
+
+from collections import OrderedDict
+
+import config, connection
+
+class TTLCache:
+    def __init__(self, maxsize=1024, ttl=60, timer=time.monotonic):
+        """
+        프로세스 내 TTL + LRU 캐시
+
+        Args:
+            maxsize: 최대 저장 개수, 넘치면 가장 오래 사용하지 않은 항목부터 제거
+            ttl    : 항목 유효 시간(초)
+            timer  : 현재 시각 함수 (테스트용)
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        self.maxsize = maxsize
+        self.ttl     = ttl
+        self.hits    = 0
+        self.misses  = 0
+
+        self._timer = timer
+        self._data  = OrderedDict() # key -> (만료시각, 값)
+        self._lock  = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        캐시 조회. 없거나 만료됐으면 default 를 리턴한다.
+
+        Args:
+            key    : 캐시 키
+            default: 캐시에 없을 때 리턴할 값
+
+        Returns:
+            캐시된 값 또는 default
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        with self._lock:
+            item = self._data.get(key)
+
+            if item is not None and item[0] > self._timer():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return item[1]
+
+            if item is not None:
+                del self._data[key]
+
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        """
+        캐시 저장
+
+        Args:
+            key  : 캐시 키
+            value: 저장할 값
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        with self._lock:
+            self._data[key] = (self._timer() + self.ttl, value)
+            self._data.move_to_end(key)
+
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits'   : self.hits,
+                'misses' : self.misses,
+                'size'   : len(self._data),
+                'maxsize': self.maxsize,
+                'ttl'    : self.ttl
+            }
+
+class ReferenceDataCache:
+    def __init__(self, loader, refresh_interval=3600, retry_interval=60, timer=time.monotonic):
+        """
+        거의 바뀌지 않는 기준 데이터(국가, 색상, 사이즈, 카테고리) 캐시
+        한 번에 모두 읽어 두고, refresh_interval 이 지나면 다음 조회 때 다시 읽는다.
+        다시 읽는 동안 다른 요청은 기다리지 않고 이전 데이터를 읽는다.
+
+        Args:
+            loader          : conn 을 받아 {이름: 리스트 | {키: 리스트}} 를 리턴하는 함수
+            refresh_interval: 다시 읽는 주기(초)
+            retry_interval  : 다시 읽기에 실패했을 때 이전 데이터를 쓰다가 재시도하는 간격(초)
+            timer           : 현재 시각 함수 (테스트용)
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+            2026-10-18(김태수): 락 밖에서 다시 읽고, 실패하면 이전 데이터 유지
+        """
+        self.loader           = loader
+        self.refresh_interval = refresh_interval
+        self.retry_interval   = retry_interval
+        self.version          = 0 # 내용이 바뀔 때마다 1씩 증가
+
+        self._timer        = timer
+        self._entries      = {} # (이름, 키) -> (데이터, etag)
+        self._loaded_at    = None
+        self._lock         = threading.Lock() # _entries, _loaded_at, version 교체용
+        self._refresh_lock = threading.Lock() # 한 번에 한 스레드만 다시 읽는다
+
+    def get(self, name, key=None):
+        """
+        기준 데이터 조회. 처음이거나 주기가 지났으면 먼저 다시 읽는다.
+
+        Args:
+            name: 데이터 이름 (예: 'colors', 'first_categories')
+            key : 이름 아래 키 (예: 셀러 속성 아이디), 없으면 None
+
+        Returns:
+            (데이터, etag) 또는 None
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+            2026-10-18(김태수): 다시 읽는 동안 다른 스레드는 이전 데이터를 읽도록 변경
+        """
+        if self._loaded_at is None:
+            # 처음에는 돌려줄 데이터가 없으므로 읽을 때까지 기다린다. (실패하면 예외)
+            with self._refresh_lock:
+                if self._loaded_at is None:
+                    self._load()
+
+        elif self._is_stale() and self._refresh_lock.acquire(blocking=False):
+            # 다른 스레드가 이미 다시 읽는 중이면 기다리지 않고 이전 데이터를 쓴다.
+            try:
+                if self._is_stale():
+                    self._reload()
+            finally:
+                self._refresh_lock.release()
+
+        with self._lock:
+            return self._entries.get((name, key))
+
+    def refresh(self):
+        """
+        주기와 상관없이 지금 다시 읽는다. (기준 데이터를 바꾼 뒤 호출)
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        with self._refresh_lock:
+            self._load()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'version'         : self.version,
+                'size'            : len(self._entries),
+                'refresh_interval': self.refresh_interval
+            }
+
+    def _is_stale(self):
+        with self._lock:
+            return self._loaded_at is None or self._timer() - self._loaded_at >= self.refresh_interval
+
+    def _reload(self):
+        try:
+            self._load()
+        except Exception:
+            # 이전 데이터를 그대로 쓰고, retry_interval 뒤에 다시 읽는다.
+            traceback.print_exc()
+            with self._lock:
+                self._loaded_at = self._timer() - self.refresh_interval + self.retry_interval
+
+    def _load(self):
+        # 락 밖에서 읽으므로 읽는 동안에도 다른 스레드는 이전 데이터를 조회할 수 있다.
+        # 요청 중이면 요청 범위 커넥션, 아니면 풀 커넥션을 쓴다. (close 는 반환)
+        conn = connection.get_connection()
+        try:
+            tables = self.loader(conn)
+        finally:
+            conn.close()
+
+        entries = dict()
+        for name, data in tables.items():
+            if isinstance(data, dict):
+                for key, rows in data.items():
+                    entries[(name, key)] = (rows, self.make_etag(rows))
+            else:
+                entries[(name, None)] = (data, self.make_etag(data))
+
+        with self._lock:
+            if entries != self._entries:
+                self.version += 1
+
+            self._entries   = entries
+            self._loaded_at = self._timer()
+
+    @staticmethod
+    def make_etag(data):
+        # 내용만으로 만들기 때문에 프로세스가 달라도 같은 데이터면 같은 etag 가 나온다.
+        body = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(body.encode('utf-8')).hexdigest()[:32]
+
+# 로그인 데코레이터의 셀러 확인 결과 캐시 (키: seller_id)
+# 셀러 정보가 바뀌면 SellerService 에서 invalidate 한다.
+seller_cache = TTLCache(
+    maxsize = getattr(config, 'SELLER_CACHE_SIZE', 1024),
+    ttl     = getattr(config, 'SELLER_CACHE_TTL', 60)
+)
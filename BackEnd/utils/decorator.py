@@ -5,11 +5,39 @@ from functools        import wraps
 from flask            import request,Response,jsonify
 from model.seller_dao import SellerDao
 from connection       import get_connection
+from utils.cache      import seller_cache
 
 import traceback
 
 import config,connection
 
+def find_login_seller(seller_id):
+    """
+    로그인 데코레이터용 셀러 조회
+    캐시에 있으면 DB를 거치지 않고, 없으면 조회 후 캐시에 저장한다.
+
+    Args:
+        seller_id: 토큰의 셀러 아이디
+
+    Returns:
+        셀러 정보 딕셔너리 (캐시 원본이 바뀌지 않도록 복사본)
+
+    Author:
+        김태수
+
+    History:
+        2026.10.18(김태수) : 초기 생성
+    """
+    result = seller_cache.get(seller_id)
+
+    if result is None:
+        # 요청 범위 커넥션 - 뷰와 같은 커넥션을 쓰고 요청이 끝나면 반환된다.
+        conn   = connection.get_connection()
+        result = SellerDao().decorator_find_seller(conn, seller_id)
+        seller_cache.set(seller_id, result)
+
+    return dict(result)
+
 def login_decorator(f):
     """
         decorator API
@@ -27,6 +55,8 @@ def login_decorator(f):
                 2020.09.29(이지연) : 클래스 Validation_order 추가, DB ORDER기능 위한것
                 2020.10.05(이지연) : 데코레이터 수정
                 2020.10.07(이지연) : 데코레이터 수정 -> 로그인시 데코레이터 계정로그인에서 pk로 payloaad불러오기
+                2026.10.18(김태수) : 뷰와 요청 범위 커넥션을 공유하도록 수정
+                2026.10.18(김태수) : 셀러 조회 결과 캐시 적용
     """
     @wraps(f)
     def wrapper(self, *args, **kwargs):
@@ -37,10 +67,8 @@ def login_decorator(f):
                 payload         = jwt.decode(access_token, config.SECRET_KEY, algorithm = config.ALGORITHM)
                 #seller_id 즉 sellers테이블의 pk를 payload로 불러오기
                 seller_id  = payload['seller_id']
-                conn       = connection.get_connection()
-                # seller_id의 value값과 db에 연결에서 실제 있는지 확인하기 위한 용도
-                result = SellerDao().decorator_find_seller(conn, seller_id)
-                conn.close() #db 연결 종료
+                # seller_id의 value값과 db에 연결에서 실제 있는지 확인하기 위한 용도 (캐시 우선)
+                result = find_login_seller(seller_id)
                 if result:
                     #request의 seller_id 라는 속성에는 seller_id값을 넣어주도록합니다
                     request.seller_id = seller_id
@@ -76,6 +104,8 @@ def login_decorator2(f):
                 2020.09.29(이지연) : 클래스 Validation_order 추가, DB ORDER기능 위한것
                 2020.10.05(이지연) : 데코레이터 수정
                 2020.10.07(이지연) : 데코레이터 수정 -> 로그인시 데코레이터 계정로그인에서 pk로 payloaad불러오기
+                2026.10.18(김태수) : 뷰와 요청 범위 커넥션을 공유하도록 수정
+                2026.10.18(김태수) : 셀러 조회 결과 캐시 적용
     """
 
     @wraps(f)
@@ -90,14 +120,10 @@ def login_decorator2(f):
                 
                 #seller_id 즉 sellers테이블의 pk를 payload로 불러오기
                 seller_id  = payload['seller_id']
-                conn       = connection.get_connection()
-
                 kwargs['seller_id'] = seller_id
 
-                # seller_id의 value값과 db에 연결에서 실제 있는지 확인하기 위한 용도
-                result = SellerDao().decorator_find_seller(conn, seller_id)
-
-                conn.close() #db 연결 종료
+                # seller_id의 value값과 db에 연결에서 실제 있는지 확인하기 위한 용도 (캐시 우선)
+                result = find_login_seller(seller_id)
 
                 if result:
                     #request의 seller_id 라는 속성에는 seller_id값을 넣어주도록합니다
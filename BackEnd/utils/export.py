@@ -0,0 +1,240 @@
+import csv
+import io
+import re
+import zipfile
+import zlib
+
+from decimal      import Decimal
+from urllib.parse import quote
+from xml.sax.saxutils import escape
+
+# 몇 줄마다 응답으로 내보낼지
+CHUNK_ROWS = 500
+
+CSV_MIMETYPE  = 'text/csv; charset=utf-8'
+XLSX_MIMETYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+# XML 1.0 에 넣을 수 없는 제어 문자
+ILLEGAL_XML_CHARS = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '</Types>'
+)
+
+XLSX_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/>'
+    '</Relationships>'
+)
+
+XLSX_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets><sheet name="data" sheetId="1" r:id="rId1"/></sheets>'
+    '</workbook>'
+)
+
+XLSX_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet1.xml"/>'
+    '</Relationships>'
+)
+
+XLSX_SHEET_START = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+
+XLSX_SHEET_END = '</sheetData></worksheet>'
+
+class ChunkBuffer(io.RawIOBase):
+    """
+    쓰인 바이트를 모아 두었다가 pop 으로 꺼내는 쓰기 전용 스트림.
+    seek 를 지원하지 않으므로 zipfile 이 data descriptor 방식으로 순서대로만 쓴다.
+    """
+    def __init__(self):
+        self.chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def pop(self):
+        data = b''.join(self.chunks)
+        self.chunks.clear()
+        return data
+
+def iter_csv(header, rows):
+    """
+    CSV 파일을 조각(bytes) 단위로 만들어 내보낸다.
+    엑셀에서 한글이 깨지지 않도록 UTF-8 BOM 을 붙인다.
+
+    Args:
+        header: 첫 줄 컬럼 이름 리스트
+        rows  : 한 줄씩 값 리스트를 내보내는 iterable
+
+    Returns:
+        bytes 제너레이터
+
+    Author:
+        김태수
+
+    History:
+        2026-10-18(김태수): 초기 생성
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    buffer.write('\ufeff')
+    writer.writerow(header)
+
+    for count, row in enumerate(rows, 1):
+        writer.writerow(row)
+
+        if count % CHUNK_ROWS == 0:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield buffer.getvalue().encode('utf-8')
+
+def count_rows(rows, report=None):
+    """
+    rows 를 그대로 내보내면서 CHUNK_ROWS 줄마다, 그리고 마지막에 report(지금까지 줄 수)를 호출한다.
+
+    Args:
+        rows  : row iterable
+        report: 진행 상황을 받을 함수, None 이면 그대로 내보낸다
+
+    Returns:
+        row 제너레이터
+
+    Author:
+        김태수
+
+    History:
+        2026-10-18(김태수): 초기 생성
+    """
+    count = 0
+    for count, row in enumerate(rows, 1):
+        yield row
+
+        if report and count % CHUNK_ROWS == 0:
+            report(count)
+
+    if report:
+        report(count)
+
+def make_xlsx_cell(value):
+    if value is None:
+        return '<c/>'
+
+    # 불린은 int 의 하위 클래스이므로 숫자보다 먼저 확인한다.
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        return f'<c><v>{value}</v></c>'
+
+    text = escape(ILLEGAL_XML_CHARS.sub('', str(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+def make_xlsx_row(row):
+    return '<row>' + ''.join(make_xlsx_cell(value) for value in row) + '</row>'
+
+def iter_xlsx(header, rows):
+    """
+    XLSX 파일을 조각(bytes) 단위로 만들어 내보낸다.
+    시트 XML 을 압축하면서 바로 내보내므로 임시 파일이나 전체 데이터를 메모리에 두지 않는다.
+    (문자열은 공유 문자열 테이블 없이 inline 으로 넣는다)
+
+    Args:
+        header: 첫 줄 컬럼 이름 리스트
+        rows  : 한 줄씩 값 리스트를 내보내는 iterable
+
+    Returns:
+        bytes 제너레이터
+
+    Author:
+        김태수
+
+    History:
+        2026-10-18(김태수): 초기 생성
+        2026-10-18(김태수): 시트를 ZIP64 로 써서 2 GiB 넘는 파일도 내보내도록 수정
+    """
+    buffer = ChunkBuffer()
+
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as xlsx:
+        xlsx.writestr('[Content_Types].xml', XLSX_CONTENT_TYPES)
+        xlsx.writestr('_rels/.rels', XLSX_RELS)
+        xlsx.writestr('xl/workbook.xml', XLSX_WORKBOOK)
+        xlsx.writestr('xl/_rels/workbook.xml.rels', XLSX_WORKBOOK_RELS)
+
+        # 응답 스트림은 되돌아가서 헤더를 고칠 수 없으므로 시트가 2 GiB 를 넘어도 되도록
+        # 처음부터 ZIP64 헤더로 쓴다.
+        with xlsx.open('xl/worksheets/sheet1.xml', 'w', force_zip64=True) as sheet:
+            sheet.write((XLSX_SHEET_START + make_xlsx_row(header)).encode('utf-8'))
+
+            for count, row in enumerate(rows, 1):
+                sheet.write(make_xlsx_row(row).encode('utf-8'))
+
+                if count % CHUNK_ROWS == 0:
+                    yield buffer.pop()
+
+            sheet.write(XLSX_SHEET_END.encode('utf-8'))
+
+    yield buffer.pop()
+
+def iter_gzip(chunks, level=6):
+    """
+    bytes 조각들을 gzip 으로 압축하면서 내보낸다. (Content-Encoding: gzip 응답용)
+
+    Args:
+        chunks: bytes iterable
+        level : 압축 레벨
+
+    Returns:
+        bytes 제너레이터
+
+    Author:
+        김태수
+
+    History:
+        2026-10-18(김태수): 초기 생성
+    """
+    # wbits 16 + 15: zlib 대신 gzip 헤더 / 트레일러를 붙인다.
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+
+    yield compressor.flush()
+
+def make_attachment_header(filename):
+    """
+    한글 파일 이름도 깨지지 않는 Content-Disposition 헤더 값 (RFC 5987)
+
+    Author:
+        김태수
+
+    History:
+        2026-10-18(김태수): 초기 생성
+    """
+    return f"attachment; filename*=UTF-8''{quote(filename)}"
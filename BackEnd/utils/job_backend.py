@@ -0,0 +1,283 @@
+import json
+import os
+import sqlite3
+import threading
+
+# 작업 상태
+JOB_PENDING = 'PENDING'
+JOB_RUNNING = 'RUNNING'
+JOB_DONE    = 'DONE'
+JOB_FAILED  = 'FAILED'
+
+ACTIVE_STATUSES = (JOB_PENDING, JOB_RUNNING)
+
+JOB_FIELDS = (
+    'job_id',
+    'seller_id',
+    'kind',
+    'params',
+    'status',
+    'progress',
+    'filename',
+    'mimetype',
+    'path',
+    'error',
+    'created_at',
+    'finished_at',
+    'expires_at',
+    'worker_pid'
+)
+
+class MemoryJobBackend:
+    def __init__(self):
+        """
+        프로세스 안에서만 보이는 작업 저장소 (테스트, 단일 프로세스용)
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def create(self, job, max_active=None):
+        """
+        작업 저장. 셀러의 진행 중인 작업이 max_active 개 이상이면 저장하지 않는다.
+
+        Args:
+            job       : 작업 딕셔너리 (JOB_FIELDS)
+            max_active: 셀러당 동시에 진행할 수 있는 작업 수, None 이면 제한 없음
+
+        Returns:
+            저장했으면 True
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        with self._lock:
+            if max_active:
+                active = [
+                    saved for saved in self._jobs.values()
+                    if saved['seller_id'] == job['seller_id'] and saved['status'] in ACTIVE_STATUSES
+                ]
+                if len(active) >= max_active:
+                    return False
+
+            self._jobs[job['job_id']] = dict(job)
+            return True
+
+    def update(self, job_id, **fields):
+        with self._lock:
+            if job_id in self._jobs:
+                self._jobs[job_id].update(fields)
+
+    def get(self, job_id):
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def find_expired(self, now):
+        with self._lock:
+            return [dict(job) for job in self._jobs.values() if job['expires_at'] <= now]
+
+    def find_active(self, seller_id):
+        with self._lock:
+            return [
+                dict(job) for job in self._jobs.values()
+                if job['seller_id'] == seller_id and job['status'] in ACTIVE_STATUSES
+            ]
+
+    def delete(self, job_id):
+        with self._lock:
+            self._jobs.pop(job_id, None)
+
+class SQLiteJobBackend:
+    def __init__(self, path):
+        """
+        SQLite 파일 작업 저장소
+        같은 서버의 여러 워커 프로세스가 작업 상태와 셀러별 동시 작업 수를 함께 본다.
+
+        Args:
+            path: SQLite 파일 경로
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        self.path = path
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        db = self._connect()
+        try:
+            db.execute("""
+                CREATE TABLE IF NOT EXISTS export_jobs (
+                    job_id      TEXT    PRIMARY KEY,
+                    seller_id   INTEGER,
+                    kind        TEXT    NOT NULL,
+                    params      TEXT    NOT NULL,
+                    status      TEXT    NOT NULL,
+                    progress    INTEGER NOT NULL DEFAULT 0,
+                    filename    TEXT,
+                    mimetype    TEXT,
+                    path        TEXT,
+                    error       TEXT,
+                    created_at  REAL    NOT NULL,
+                    finished_at REAL,
+                    expires_at  REAL    NOT NULL,
+                    worker_pid  INTEGER
+                )
+            """)
+            db.execute("CREATE INDEX IF NOT EXISTS idx_export_jobs_seller_status ON export_jobs (seller_id, status)")
+
+            # worker_pid 가 없던 때 만든 파일
+            columns = [row['name'] for row in db.execute("PRAGMA table_info(export_jobs)")]
+            if 'worker_pid' not in columns:
+                db.execute("ALTER TABLE export_jobs ADD COLUMN worker_pid INTEGER")
+        finally:
+            db.close()
+
+    def _connect(self):
+        # 프로세스 / 스레드마다 짧게 열고 닫는다.
+        db = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+        db.row_factory = sqlite3.Row
+        return db
+
+    def _to_job(self, row):
+        job = dict(row)
+        job['params'] = json.loads(job['params'])
+        return job
+
+    def create(self, job, max_active=None):
+        """
+        작업 저장. 셀러의 진행 중인 작업이 max_active 개 이상이면 저장하지 않는다.
+        개수 확인과 저장을 한 쓰기 트랜잭션(BEGIN IMMEDIATE)으로 묶어 프로세스끼리도 제한을 지킨다.
+
+        Args:
+            job       : 작업 딕셔너리 (JOB_FIELDS)
+            max_active: 셀러당 동시에 진행할 수 있는 작업 수, None 이면 제한 없음
+
+        Returns:
+            저장했으면 True
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        row = dict(job, params=json.dumps(job['params']))
+
+        db = self._connect()
+        try:
+            db.execute("BEGIN IMMEDIATE")
+
+            if max_active:
+                active = db.execute(
+                    "SELECT COUNT(*) FROM export_jobs WHERE seller_id IS ? AND status IN (?, ?)",
+                    (job['seller_id'],) + ACTIVE_STATUSES
+                ).fetchone()[0]
+                if active >= max_active:
+                    db.execute("ROLLBACK")
+                    return False
+
+            db.execute(
+                "INSERT INTO export_jobs ({}) VALUES ({})".format(
+                    ', '.join(JOB_FIELDS), ', '.join(f':{field}' for field in JOB_FIELDS)
+                ),
+                row
+            )
+            db.execute("COMMIT")
+            return True
+        except Exception:
+            if db.in_transaction:
+                db.execute("ROLLBACK")
+            raise
+        finally:
+            db.close()
+
+    def update(self, job_id, **fields):
+        if 'params' in fields:
+            fields['params'] = json.dumps(fields['params'])
+
+        db = self._connect()
+        try:
+            db.execute(
+                "UPDATE export_jobs SET {} WHERE job_id = :job_id".format(
+                    ', '.join(f'{field} = :{field}' for field in fields)
+                ),
+                dict(fields, job_id=job_id)
+            )
+        finally:
+            db.close()
+
+    def get(self, job_id):
+        db = self._connect()
+        try:
+            row = db.execute("SELECT * FROM export_jobs WHERE job_id = ?", (job_id,)).fetchone()
+            return self._to_job(row) if row else None
+        finally:
+            db.close()
+
+    def find_expired(self, now):
+        db = self._connect()
+        try:
+            rows = db.execute("SELECT * FROM export_jobs WHERE expires_at <= ?", (now,)).fetchall()
+            return [self._to_job(row) for row in rows]
+        finally:
+            db.close()
+
+    def find_active(self, seller_id):
+        db = self._connect()
+        try:
+            rows = db.execute(
+                "SELECT * FROM export_jobs WHERE seller_id IS ? AND status IN (?, ?)",
+                (seller_id,) + ACTIVE_STATUSES
+            ).fetchall()
+            return [self._to_job(row) for row in rows]
+        finally:
+            db.close()
+
+    def delete(self, job_id):
+        db = self._connect()
+        try:
+            db.execute("DELETE FROM export_jobs WHERE job_id = ?", (job_id,))
+        finally:
+            db.close()
+
+def create_job_backend(config):
+    """
+    설정(EXPORT_JOB_BACKEND)에 맞는 작업 저장소 만들기
+
+    Args:
+        config: 앱 설정
+            EXPORT_JOB_BACKEND    : 'sqlite'(기본) 또는 'memory'
+            EXPORT_JOB_SQLITE_PATH: SQLite 파일 경로
+
+    Returns:
+        작업 저장소 객체
+
+    Author:
+        김태수
+
+    History:
+        2026-10-18(김태수): 초기 생성
+    """
+    backend = config.get('EXPORT_JOB_BACKEND', 'sqlite')
+
+    if backend == 'memory':
+        return MemoryJobBackend()
+
+    if backend == 'sqlite':
+        return SQLiteJobBackend(config.get('EXPORT_JOB_SQLITE_PATH', 'temp/export_jobs.sqlite3'))
+
+    raise ValueError(f'UNKNOWN_EXPORT_JOB_BACKEND_{backend}')
@@ -0,0 +1,150 @@
+import random
+import time
+
+BENCH_TABLE = 'bench_product_names'
+
+# 상품명처럼 보이는 이름을 만들기 위한 단어들
+NAME_PREFIXES = ['데일리', '베이직', '오버핏', '슬림', '빈티지', '린넨', '니트', '체크', '플리츠', '스트라이프', 'Daily', 'Slim fit']
+NAME_ITEMS    = ['원피스', '셔츠', '블라우스', '슬랙스', '가디건', '자켓', '스커트', '청바지', '맨투맨', '코트', 'Onepiece', 'Shirts']
+NAME_COLORS   = ['블랙', '화이트', '베이지', '네이비', '그레이', '카키', '핑크', '소라']
+
+def make_product_names(count, rng):
+    """
+    벤치마크용 상품명 만들기
+
+    Args:
+        count: 만들 개수
+        rng  : random.Random 객체
+
+    Returns:
+        상품명 리스트
+
+    Author:
+        김태수
+
+    History:
+        2026-10-18(김태수): 초기 생성
+    """
+    return [
+        f'{rng.choice(NAME_PREFIXES)} {rng.choice(NAME_ITEMS)} {rng.choice(NAME_COLORS)} {rng.randint(1, 99999)}'
+        for _ in range(count)
+    ]
+
+def seed_bench_table(conn, rows, batch_size=10000, seed=0):
+    """
+    벤치마크 테이블을 만들고 rows 개의 상품명을 넣는다.
+    인덱스는 데이터를 모두 넣은 뒤 한 번에 만든다.
+
+    Args:
+        conn      : 데이터베이스 커넥션 객체
+        rows      : 넣을 상품 개수
+        batch_size: 한 번에 넣을 개수
+        seed      : 상품명 난수 시드
+
+    Author:
+        김태수
+
+    History:
+        2026-10-18(김태수): 초기 생성
+    """
+    rng = random.Random(seed)
+
+    with conn.cursor() as cursor:
+        cursor.execute(f'DROP TABLE IF EXISTS {BENCH_TABLE}')
+        cursor.execute(f"""
+            CREATE TABLE {BENCH_TABLE}
+            (
+                `id`    INT            NOT NULL    AUTO_INCREMENT,
+                `name`  VARCHAR(64)    NOT NULL,
+                PRIMARY KEY (id)
+            )
+        """)
+
+        for start in range(0, rows, batch_size):
+            names = make_product_names(min(batch_size, rows - start), rng)
+            cursor.executemany(f'INSERT INTO {BENCH_TABLE} (name) VALUES (%s)', names)
+            conn.commit()
+
+        # 실제 인덱스(schema)와 같이 불용어 없이 만든다.
+        cursor.execute('SET SESSION innodb_ft_enable_stopword = OFF')
+        cursor.execute(f"""
+            ALTER TABLE {BENCH_TABLE}
+                ADD FULLTEXT INDEX FT_{BENCH_TABLE}_name (name) WITH PARSER ngram
+        """)
+        cursor.execute('SET SESSION innodb_ft_enable_stopword = ON')
+
+def time_query(conn, sql, args, repeat):
+    """
+    쿼리를 repeat 번 실행해 가장 빠른 시간과 결과 개수를 리턴한다.
+
+    Author:
+        김태수
+
+    History:
+        2026-10-18(김태수): 초기 생성
+    """
+    best = None
+    with conn.cursor() as cursor:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            cursor.execute(sql, args)
+            count   = cursor.fetchone()[0]
+            elapsed = time.perf_counter() - started
+            best    = elapsed if best is None else min(best, elapsed)
+    return best, count
+
+def benchmark_product_search(conn, rows=1000000, terms=('원피스', '블랙', '오버핏 셔츠', 'Onepiece', 'Slim fit'), repeat=5, keep=False):
+    """
+    상품명 검색 벤치마크
+    앞에 %가 붙은 LIKE 검색과 n-gram 전문 검색(+ LIKE 재확인)을 같은 데이터로 비교한다.
+    실제 테이블은 건드리지 않고 bench_product_names 테이블을 만들어 쓴다.
+
+    Args:
+        conn  : 데이터베이스 커넥션 객체
+        rows  : 상품 개수
+        terms : 검색어 목록 (영문 검색어는 불용어(on, it 등)가 들어간 n-gram 토큰을 확인하기 위함)
+        repeat: 검색어별 반복 횟수 (가장 빠른 시간을 쓴다)
+        keep  : True 면 끝난 뒤 벤치마크 테이블을 지우지 않는다
+
+    Returns:
+        [{"term", "like_seconds", "ngram_seconds", "count"}, ...]
+
+    Author:
+        김태수
+
+    History:
+        2026-10-18(김태수): 초기 생성
+        2026-10-18(김태수): 영문 검색어 추가
+    """
+    seed_bench_table(conn, rows)
+
+    like_sql  = f'SELECT COUNT(*) FROM {BENCH_TABLE} WHERE name LIKE %(like)s'
+    ngram_sql = f"""
+        SELECT COUNT(*) FROM {BENCH_TABLE}
+        WHERE MATCH(name) AGAINST(%(match)s IN BOOLEAN MODE)
+        AND name LIKE %(like)s
+    """
+
+    results = []
+    try:
+        for term in terms:
+            args = {'like': f'%{term}%', 'match': f'"{term}"'}
+            like_seconds, like_count   = time_query(conn, like_sql, args, repeat)
+            ngram_seconds, ngram_count = time_query(conn, ngram_sql, args, repeat)
+
+            # 전문 검색이 LIKE 와 같은 결과를 내는지도 확인한다.
+            if like_count != ngram_count:
+                raise AssertionError(f'{term}: LIKE {like_count} != NGRAM {ngram_count}')
+
+            results.append({
+                'term'         : term,
+                'like_seconds' : like_seconds,
+                'ngram_seconds': ngram_seconds,
+                'count'        : like_count
+            })
+    finally:
+        if not keep:
+            with conn.cursor() as cursor:
+                cursor.execute(f'DROP TABLE IF EXISTS {BENCH_TABLE}')
+
+    return results
@@ -1,4 +1,7 @@
 import re
+import json
+import base64
+import binascii
 import datetime
 
 from flask_request_validator import AbstractRule
@@ -154,6 +157,28 @@ def validate_products_offset(offset):
 
     return result
 
+def validate_products_cursor(cursor):
+    # 커서가 없으면 offset 모드, 빈 문자열은 커서 모드의 첫 페이지
+    if cursor is None:
+        return None
+
+    if cursor == '':
+        return ()
+
+    try:
+        decoded = json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))
+        register_date = decoded['register_date']
+        product_id    = decoded['id']
+
+        datetime.datetime.strptime(register_date, '%Y-%m-%d %H:%M:%S')
+    except (ValueError, KeyError, TypeError, UnicodeEncodeError, binascii.Error):
+        raise ValidationError("INVALID_CURSOR")
+
+    if not isinstance(product_id, int) or product_id < 1:
+        raise ValidationError("INVALID_CURSOR")
+
+    return register_date, product_id
+
 def validate_products_start_end_date(start_date, end_date):
     try:
         if start_date and end_date:
@@ -11,6 +11,8 @@ from .product_view import (
 )
 from .order_view   import (
     GetOrderDataView,
+    GetOrderSummaryView,
+    OrderDownloadView,
     PutOrderStatusView,
     GetOrderDetailDataView,
     PutAddress
@@ -35,7 +37,13 @@ from .coupon_view import (
     CouponCodeView
 )
 from .event_view import(
-    EventView
+    EventView,
+    EventViewCountView
+)
+from .export_view import (
+    ExportsView,
+    ExportView,
+    ExportDownloadView
 )
 
 def create_endpoints(app, services):
@@ -45,6 +53,8 @@ def create_endpoints(app, services):
     user_service    = services.user_service
     coupon_service  = services.coupon_service
     event_service   = services.event_service
+    event_view_count_service = services.event_view_count_service
+    export_service  = services.export_service
 
     # 상품
     app.add_url_rule('/products/sellers', 
@@ -82,6 +92,12 @@ def create_endpoints(app, services):
     app.add_url_rule('/order',
         view_func = GetOrderDataView.as_view('order_data_view', order_service)
     )
+    app.add_url_rule('/order/summary',
+        view_func = GetOrderSummaryView.as_view('order_summary_view', order_service)
+    )
+    app.add_url_rule('/order/download',
+        view_func = OrderDownloadView.as_view('order_download_view', order_service)
+    )
     app.add_url_rule('/order-status',
         view_func = PutOrderStatusView.as_view('order_status_view', order_service)
     )
@@ -106,3 +122,9 @@ def create_endpoints(app, services):
 
     # 기획전
     app.add_url_rule('/events', view_func=EventView.as_view('event_view', event_service))
+    app.add_url_rule('/events/<int:event_id>/view-count', view_func=EventViewCountView.as_view('event_view_count_view', event_view_count_service))
+
+    # 파일 내보내기 작업
+    app.add_url_rule('/exports', view_func=ExportsView.as_view('exports_view', export_service))
+    app.add_url_rule('/exports/<job_id>', view_func=ExportView.as_view('export_view', export_service))
+    app.add_url_rule('/exports/<job_id>/download', view_func=ExportDownloadView.as_view('export_download_view', export_service))
@@ -3,13 +3,13 @@ import datetime
 import traceback
 from json.decoder import JSONDecodeError
 
-from flask       import jsonify, request, send_file
+from flask       import jsonify, request, send_file, Response
 from flask.views import MethodView
 from pymysql     import err
 from varname     import Wrapper
 
 import config
-from connection import get_connection
+from connection import get_connection, get_pool
 from utils.validation import (
     CouponValidationError,
     validate_coupon_int_required,
@@ -20,6 +20,7 @@ from utils.validation import (
     validate_coupon_bool_optional
 )
 from utils.decorator import login_decorator2
+from utils.export import iter_gzip, make_attachment_header
 
 class VarnameException(Exception):
     def __init__(self, message, var):
@@ -323,10 +324,11 @@ class CouponSerialsView(MethodView):
 
         Args:
             coupon_id: 쿠폰 아이디
+            stream   : 'Y' 이면 임시 파일 없이 스트리밍으로 내려준다 (선택)
 
         Returns:
             200: 시리얼 넘버를 담은 CSV 파일 리턴
-            400: 존재하지 않는 쿠폰 아이디로 쿠폰 조회
+            400: 존재하지 않는 쿠폰 아이디로 쿠폰 조회, 파라미터 유효성 검사 에러
             500: 데이터베이스 조작 에러, 내부 에러
             
         Author:
@@ -334,14 +336,22 @@ class CouponSerialsView(MethodView):
 
         History:
             2020-10-11(이충희): 초기 생성
+            2026-10-18(김태수): stream 파라미터 추가 (서버 사이드 커서 스트리밍)
         """
         try:
             conn = get_connection()
 
             coupon_id = validate_coupon_int_required(coupon_id, 'coupon_id')
+            stream    = validate_coupon_bool_optional(request.args.get('stream', None), 'stream')
+
+            if stream == 'Y':
+                return self.stream_serials_file(coupon_id)
 
             tmp_filename, download_filename = self.service.download_serials(conn, coupon_id)
 
+        except CouponValidationError as e:
+            return jsonify(e.to_dict()), 400
+
         except (err.OperationalError, err.InternalError) as e: 
             return jsonify({ "errno": e.args[0], "errval": e.args[1] }), 500
 
@@ -357,6 +367,41 @@ class CouponSerialsView(MethodView):
         finally:
             conn.close()
 
+    def stream_serials_file(self, coupon_id):
+        """
+        시리얼 넘버 CSV 스트리밍 응답 만들기
+        응답 본문을 다 보낼 때까지 커넥션을 써야 하므로 요청 범위 커넥션과 별도로 풀에서 꺼내고,
+        응답이 닫힐 때 반환한다. 클라이언트가 gzip 을 받으면 압축해서 보낸다.
+
+        Args:
+            coupon_id: 쿠폰 아이디
+
+        Returns:
+            청크 단위 CSV 응답
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        stream_conn = get_pool().acquire()
+        try:
+            chunks, mimetype, download_filename = self.service.stream_serials(stream_conn, coupon_id)
+        except Exception:
+            stream_conn.close()
+            raise
+
+        use_gzip = request.accept_encodings['gzip'] > 0
+
+        response = Response(iter_gzip(chunks) if use_gzip else chunks, mimetype = mimetype)
+        response.headers['Content-Disposition'] = make_attachment_header(download_filename)
+        response.headers['Vary'] = 'Accept-Encoding'
+        if use_gzip:
+            response.headers['Content-Encoding'] = 'gzip'
+        response.call_on_close(stream_conn.close)
+        return response
+
 class CouponView(MethodView):
     def __init__(self, service):
         self.service = service
@@ -109,11 +109,25 @@ class EventView(MethodView):
                 'start_date'   : request.args.get('start_date', None),
                 'end_date'     : request.args.get('end_date', None),
                 'is_exposed'   : request.args.get('is_exposed', None),
-                'event_type'   : ast.literal_eval(request.args.get('event_type', None))
+                'event_type'   : ast.literal_eval(request.args.get('event_type', None)),
+                'cursor'       : request.args.get('cursor', None),
+                'limit'        : request.args.get('limit', 10)
             }
 
+            # 커서는 이전 페이지 마지막 기획전 번호
+            if arguments['cursor']:
+                arguments['cursor'] = int(arguments['cursor'])
+
+            arguments['limit'] = int(arguments['limit'])
+            if arguments['limit'] not in (10, 20, 50, 100):
+                raise ValueError
+
             event_list = self.service.get_event_list(db, arguments)
 
+        except ValueError:
+            traceback.print_exc()
+            return jsonify({'message':'VALUE_ERROR'}), 400
+
         except Exception as e:
             traceback.print_exc()
             return jsonify({'message':e.message}), 400
@@ -153,7 +167,7 @@ class EventView(MethodView):
         try:
             db = connection.get_connection()
 
-            result = str(self.service.put_event_status(db))
+            result = self.service.put_event_status(db)
 
         except:
             db.rollback()
@@ -162,7 +176,28 @@ class EventView(MethodView):
 
         else:
             db.commit()
-            return jsonify({'message':f'{result}_EVENT_WAS_CHANGED'}), 200
+            return jsonify({'message':f"{result['count']}_EVENT_WAS_CHANGED", 'result':result}), 200
 
         finally:
             db.close()
+
+class EventViewCountView(MethodView):
+    def __init__(self, service):
+        self.service = service
+
+    def post(self, event_id):
+        """
+        기획전 조회수 증가 - Presentation Layer(view) function
+        DB 에 바로 쓰지 않고 메모리에 모았다가 주기적으로 반영한다.
+        Args:
+            event_id : 기획전 아이디
+        Returns :
+            {'message':'SUCCESS'}, 202
+        Author :
+            김태수
+        History:
+            2026-10-18 : 초기 생성
+        """
+        self.service.increase_view_count(event_id)
+
+        return jsonify({'message':'SUCCESS'}), 202
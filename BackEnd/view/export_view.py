@@ -0,0 +1,227 @@
+from flask          import jsonify, request, send_file
+from flask.views    import MethodView
+
+from exceptions import (
+    ValidationError,
+    ExportJobNotFoundError,
+    ExportJobLimitError,
+    ExportJobNotReadyError
+)
+from utils.validation import (
+    validate_products_product_id,
+    validate_products_start_end_date
+)
+from utils.decorator import login_decorator2
+
+# 셀러 리스트 내보내기에서 받는 검색 조건 (SellerExcelDownloadView 와 같음)
+SELLER_SEARCH_KEYS = (
+    'id',
+    'seller_account',
+    'korean_name',
+    'english_name',
+    'seller_status',
+    'seller_property',
+    'manager_name',
+    'manager_phone',
+    'manager_email',
+    'start_date',
+    'end_date'
+)
+
+def validate_export_params(export_type, params):
+    """
+    내보내기 작업 종류별 파라미터 검사
+
+    Args:
+        export_type: 'products' | 'sellers' | 'coupon_serials'
+        params     : 요청 바디의 params
+
+    Returns:
+        작업에 저장할 파라미터 딕셔너리
+
+    Author:
+        김태수
+
+    History:
+        2026-10-18(김태수): 초기 생성
+    """
+    if not isinstance(params, dict):
+        raise ValidationError("PARAMS_MUST_BE_OBJECT")
+
+    if export_type == "products":
+        file_format = params.get('format', 'xlsx')
+        if file_format not in ("xlsx", "csv"):
+            raise ValidationError("FORMAT_MUST_BE_XLSX_OR_CSV")
+
+        product_ids = params.get('product_ids', None)
+        if product_ids:
+            if not isinstance(product_ids, list):
+                raise ValidationError("PRODUCT_IDS_MUST_BE_LIST")
+            for product_id in product_ids:
+                validate_products_product_id(str(product_id))
+            return {"format": file_format, "product_ids": [int(product_id) for product_id in product_ids]}
+
+        start_date = params.get('start_date', None)
+        end_date   = params.get('end_date', None)
+        if not start_date or not end_date:
+            raise ValidationError("BOTH_DATES_MUST_BE_PROVIDED")
+        validate_products_start_end_date(start_date, end_date)
+        return {"format": file_format, "start_date": start_date, "end_date": end_date}
+
+    if export_type == "sellers":
+        search_info = {key: params.get(key, None) for key in SELLER_SEARCH_KEYS}
+        for key, value in search_info.items():
+            if value is not None:
+                search_info[key] = str(value)
+
+        search_info['order'] = params.get('order', 'DESC')
+        if search_info['order'] not in ('asc', 'desc', 'ASC', 'DESC'):
+            raise ValidationError("INVALID_ORDER")
+        return search_info
+
+    if export_type == "coupon_serials":
+        coupon_id = params.get('coupon_id', None)
+        if not str(coupon_id).isnumeric() or int(coupon_id) <= 0:
+            raise ValidationError("INVALID_COUPON_ID")
+        return {"coupon_id": int(coupon_id)}
+
+    raise ValidationError(f"INVALID_EXPORT_TYPE_{export_type}")
+
+def make_export_status(job):
+    return {
+        "job_id"     : job['job_id'],
+        "type"       : job['kind'],
+        "status"     : job['status'],
+        "progress"   : job['progress'],
+        "error"      : job['error'],
+        "created_at" : job['created_at'],
+        "finished_at": job['finished_at'],
+        "expires_at" : job['expires_at']
+    }
+
+class ExportsView(MethodView):
+    def __init__(self, service):
+        self.service = service
+
+    @login_decorator2
+    def post(self, seller_id):
+        """
+        내보내기 작업 등록 뷰
+        파일은 백그라운드에서 만들고, 작업 아이디로 상태 조회 / 다운로드한다.
+
+        Args:
+            body:
+                {
+                    "type"  : "products" | "sellers" | "coupon_serials",
+                    "params": 작업 종류별 조건
+                              products      : {"format", "start_date", "end_date"} 또는 {"format", "product_ids"}
+                              sellers       : 셀러 검색 조건, "order"
+                              coupon_serials: {"coupon_id"}
+                }
+
+        Returns:
+            202:
+                SUCCESS: {"job_id", "type", "status", "progress", ...}
+            400:
+                ValidationError: 요청 바디 검사 에러
+            429:
+                ExportJobLimitError: 셀러의 진행 중인 작업이 너무 많음
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        try:
+            body = request.get_json(silent=True)
+            if not isinstance(body, dict):
+                raise ValidationError("INVALID_JSON_FORMAT")
+
+            export_type = body.get('type', None)
+            params      = validate_export_params(export_type, body.get('params', {}))
+
+            job = self.service.submit_export(seller_id, export_type, params)
+        except ValidationError as e:
+            message = {"message": e.message}
+            return jsonify(message), 400
+        except ExportJobLimitError as e:
+            message = {"message": e.message}
+            return jsonify(message), 429
+        else:
+            return jsonify(make_export_status(job)), 202
+
+class ExportView(MethodView):
+    def __init__(self, service):
+        self.service = service
+
+    @login_decorator2
+    def get(self, job_id, seller_id):
+        """
+        내보내기 작업 상태 / 진행 상황 조회 뷰
+
+        Args:
+            job_id: 작업 아이디
+
+        Returns:
+            200:
+                SUCCESS: {"job_id", "type", "status", "progress", "error", "created_at", "finished_at", "expires_at"}
+                         status: PENDING | RUNNING | DONE | FAILED, progress: 지금까지 쓴 row 수
+            404:
+                ExportJobNotFoundError: 없거나 만료된 작업
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        try:
+            job = self.service.get_export(seller_id, job_id)
+        except ExportJobNotFoundError as e:
+            message = {"message": e.message}
+            return jsonify(message), 404
+        else:
+            return jsonify(make_export_status(job)), 200
+
+class ExportDownloadView(MethodView):
+    def __init__(self, service):
+        self.service = service
+
+    @login_decorator2
+    def get(self, job_id, seller_id):
+        """
+        내보내기 결과 파일 다운로드 뷰
+        결과 파일은 보관 시간(EXPORT_RESULT_TTL) 동안 여러 번 받을 수 있다.
+
+        Args:
+            job_id: 작업 아이디
+
+        Returns:
+            200:
+                SUCCESS: 파일 다운로드
+            404:
+                ExportJobNotFoundError: 없거나 만료된 작업
+            409:
+                ExportJobNotReadyError: 아직 끝나지 않았거나 실패한 작업
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        try:
+            job = self.service.get_export_file(seller_id, job_id)
+        except ExportJobNotFoundError as e:
+            message = {"message": e.message}
+            return jsonify(message), 404
+        except ExportJobNotReadyError as e:
+            message = {"message": e.message}
+            return jsonify(message), 409
+        else:
+            return send_file(job['path'],
+                mimetype=job['mimetype'],
+                as_attachment=True,
+                attachment_filename=job['filename'],
+                conditional=False)
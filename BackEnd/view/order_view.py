@@ -1,13 +1,71 @@
-from flask import jsonify, request
+from flask import jsonify, request, Response
 from flask.views import MethodView
 
-from datetime import date, timedelta
+from datetime import date, datetime, timedelta
 from pymysql  import err
 
+from utils.export import make_attachment_header
+
 import config, connection, ast
 
 import traceback
 
+def make_order_filter_arguments(args):
+    """
+    주문 리스트 / 다운로드에서 함께 쓰는 조회 조건 만들기
+    Args:
+        args = 요청 쿼리 파라미터 (request.args)
+    Returns :
+        arguments = {
+            'start_date', 'end_date', 'status_id', 'seller_properties',
+            'order_number', 'detail_number', 'user_name', 'phone_number', 'seller_name', 'product_name',
+            'order_cancel_reason', 'order_refund_reason'
+        }
+
+        ValueError : 날짜 형식이 잘못된 경우 발생
+    Author :
+        김태수
+    History:
+        2026-10-18 : 초기 생성 (GetOrderDataView 에서 분리)
+    """
+
+    start_date        = args.get('start_date', None)
+    end_date          = args.get('end_date', None)
+    seller_properties = ast.literal_eval(args.get('seller_properties', None))
+
+    # seller_properties가 여러 개의 값이 아닌 하나로 들어올 경우
+    # int형으로 오는 것을 tuple로 변환
+    if isinstance(seller_properties, int):
+        seller_properties = [seller_properties]
+
+    # start_date가 들어오지 않았을 경우 가장 앞선 날짜로 설정
+    if not start_date:
+        start_date = str(date.min)
+
+    # end_date가 들어오지 않았을 경우 오늘 날짜로 설정
+    if not end_date:
+        end_date = str(date.today())
+
+    # 날짜만 들어와서 00시를 기준으로 비교하게 되기에
+    # 하루를 더해서 마지막 날짜로 들어온 값도 포함되도록 설정
+    day      = timedelta(days = 1)
+    end_date = str(date.fromisoformat(end_date) + day)
+
+    return {
+        'start_date'          : start_date,
+        'end_date'            : end_date,
+        'status_id'           : args.get('status_id', None),
+        'order_number'        : "%" + args.get('order_number', "") + "%",
+        'detail_number'       : "%" + args.get('detail_number', "") + "%",
+        'user_name'           : "%" + args.get('user_name', "") + "%",
+        'phone_number'        : "%" + args.get('phone_number', "") + "%",
+        'seller_name'         : "%" + args.get('seller_name', "") + "%",
+        'product_name'        : "%" + args.get('product_name', "") + "%",
+        'seller_properties'   : seller_properties,
+        'order_cancel_reason' : args.get('order_cancel_reason', None),
+        'order_refund_reason' : args.get('order_refund_reason', None)
+    }
+
 class GetOrderDataView(MethodView):
     def __init__(self, service):
         self.service = service
@@ -30,7 +88,8 @@ class GetOrderDataView(MethodView):
                 'offset'              : 페이지네이션 시작지점,
                 'limit'               : 전달할 주문 리스트 개수,
                 'order_cancel_reason' : 주문 취소 사유(검색),
-                'order_refund_reason' : 환불 요청 사유(검색)
+                'order_refund_reason' : 환불 요청 사유(검색),
+                'cursor'              : 커서 페이지네이션 (빈 값이면 첫 페이지, 이후 응답의 next_cursor)
             }
         Returns :
             KEY_ERROR, 400
@@ -58,35 +117,153 @@ class GetOrderDataView(MethodView):
             김태수
         History:
             2020-09-28 : 초기 생성
+            2026-10-18 : limit 을 offset 과 더하지 않도록 수정, 커서 페이지네이션 추가
+            2026-10-18 : 조회 조건 만들기를 make_order_filter_arguments 로 분리
         """
 
         try:
             db = connection.get_connection()
 
-            start_date          = request.args.get('start_date', None)
-            end_date            = request.args.get('end_date', None)
-            seller_properties   = ast.literal_eval(request.args.get('seller_properties', None))
-            status_id           = request.args.get('status_id', None)
-            offset              = int(request.args.get('offset', -1))
-            limit               = offset + int(request.args.get('limit', -1))
-            order_cancel_reason = request.args.get('order_cancel_reason', None)
-            order_refund_reason = request.args.get('order_refund_reason', None)
-            order_number        = "%" + request.args.get('order_number', "") + "%"
-            detail_number       = "%" + request.args.get('detail_number', "") + "%"
-            user_name           = "%" + request.args.get('user_name', "") + "%"
-            phone_number        = "%" + request.args.get('phone_number', "") + "%"
-            seller_name         = "%" + request.args.get('seller_name', "") + "%"
-            product_name        = "%" + request.args.get('product_name', "") + "%"
-
-            # seller_properties가 여러 개의 값이 아닌 하나로 들어올 경우
-            # int형으로 오는 것을 tuple로 변환
-            if isinstance(seller_properties, int):
-                seller_properties = [seller_properties]
+            arguments = make_order_filter_arguments(request.args)
+            offset    = int(request.args.get('offset', -1))
+            limit     = int(request.args.get('limit', -1))
+            cursor    = request.args.get('cursor', None)
+
+            # 필수로 들어와야할 Key가 들어오지 않았을 경우 KEY_ERROR 반환
+            if (not arguments['status_id']) or (offset == -1) or (limit == -1):
+                return jsonify({'message':'KEY_ERROR'}), 400
+
+            # start_date가 end_date보다 뒤의 날짜일 경우 INVALID_DATE 반환
+            if arguments['start_date'] > arguments['end_date']:
+                return jsonify({'message':'INVALID_DATE'}), 400
+
+            arguments.update({
+                'offset' : offset,
+                'limit'  : limit,
+                'cursor' : cursor
+            })
+
+            order_data = self.service.get_order_data(db, arguments)
+
+        except ValueError:
+            traceback.print_exc()
+            return jsonify({'message':'VALUE_ERROR'}), 400
+
+        except err.OperationalError:
+            return jsonify({'message':'DB_DISCONNECTED'}), 500
+
+        except:
+            traceback.print_exc()
+            return jsonify({'message':'UNSUCCESS'}), 400
+
+        else:
+            return jsonify(order_data), 200
+
+        finally:
+            db.close()
+
+class OrderDownloadView(MethodView):
+    def __init__(self, service):
+        self.service = service
+
+    def get(self):
+        """
+        주문 리스트 다운로드 (CSV / XLSX 스트리밍) - Presentation Layer(view) function
+        주문 리스트와 같은 조건으로 조회한 주문을 서버 사이드 커서로 읽으면서 바로 응답으로 보낸다.
+        Args:
+            arguments = GetOrderDataView 의 조회 조건 (offset, limit, cursor 제외),
+            format    = 'xlsx'(기본) 또는 'csv'
+        Returns :
+            KEY_ERROR, 400
+            VALUE_ERROR, 400
+            INVALID_DATE, 400
+            INVALID_FORMAT, 400
+            파일 다운로드, 200
+        Author :
+            김태수
+        History:
+            2026-10-18 : 초기 생성
+            2026-10-18 : 잘못된 seller_properties (SyntaxError) 를 VALUE_ERROR 로 처리
+        """
+
+        try:
+            arguments   = make_order_filter_arguments(request.args)
+            file_format = request.args.get('format', 'xlsx')
 
             # 필수로 들어와야할 Key가 들어오지 않았을 경우 KEY_ERROR 반환
-            if (not status_id) or (offset == -1) or (limit == -1):
+            if not arguments['status_id']:
                 return jsonify({'message':'KEY_ERROR'}), 400
 
+            if file_format not in ('xlsx', 'csv'):
+                return jsonify({'message':'INVALID_FORMAT'}), 400
+
+            # start_date가 end_date보다 뒤의 날짜일 경우 INVALID_DATE 반환
+            if arguments['start_date'] > arguments['end_date']:
+                return jsonify({'message':'INVALID_DATE'}), 400
+
+        # seller_properties 가 잘못된 형식이면 literal_eval 이 SyntaxError 를 낸다.
+        except (ValueError, SyntaxError):
+            traceback.print_exc()
+            return jsonify({'message':'VALUE_ERROR'}), 400
+
+        # 응답 본문을 다 보낼 때까지 커넥션을 써야 하므로 요청 범위 커넥션과 별도로 풀에서 꺼내고,
+        # 응답이 닫힐 때 반환한다.
+        stream_db = connection.get_pool().acquire()
+
+        try:
+            chunks, mimetype, filename_for_user = self.service.stream_order_file(stream_db, file_format, arguments)
+        except:
+            stream_db.close()
+            raise
+
+        now_date = datetime.now().strftime("%Y%m%d")
+        response = Response(chunks, mimetype = mimetype)
+        response.headers['Content-Disposition'] = make_attachment_header(now_date + "_" + filename_for_user)
+        response.call_on_close(stream_db.close)
+        return response
+
+class GetOrderSummaryView(MethodView):
+    def __init__(self, service):
+        self.service = service
+
+    def get(self):
+        """
+        주문 상태별 건수 (대시보드) - Presentation Layer(view) function
+        Args:
+            arguments = {
+                'start_date'        : 조회 시작일 (상태 진입 일자),
+                'end_date'          : 조회 종료일 (상태 진입 일자),
+                'seller_properties' : 셀러속성 (없으면 전체)
+            }
+        Returns :
+            VALUE_ERROR, 400
+            INVALID_DATE, 400
+            DB_DISCONNECTED, 500
+            {
+                "statuses"          : [{"order_status_id", "count"}],
+                "seller_properties" : [{"order_status_id", "seller_property_id", "count"}],
+                "dates"             : [{"order_status_id", "date", "count"}]
+            }, 200
+        Author :
+            김태수
+        History:
+            2026-10-18 : 초기 생성
+        """
+
+        try:
+            db = connection.get_connection()
+
+            start_date        = request.args.get('start_date', None)
+            end_date          = request.args.get('end_date', None)
+            seller_properties = request.args.get('seller_properties', None)
+
+            if seller_properties:
+                seller_properties = ast.literal_eval(seller_properties)
+
+                # seller_properties가 하나로 들어올 경우 리스트로 변환
+                if isinstance(seller_properties, int):
+                    seller_properties = [seller_properties]
+
             # start_date가 들어오지 않았을 경우 가장 앞선 날짜로 설정
             if not start_date:
                 start_date = str(date.min)
@@ -95,35 +272,22 @@ class GetOrderDataView(MethodView):
             if not end_date:
                 end_date = str(date.today())
 
-            # 날짜만 들어와서 00시를 기준으로 비교하게 되기에
-            # 하루를 더해서 마지막 날짜로 들어온 값도 포함되도록 설정
-            day      = timedelta(days = 1)
-            end_date = str(date.fromisoformat(end_date) + day)
+            date.fromisoformat(start_date)
+            date.fromisoformat(end_date)
 
             # start_date가 end_date보다 뒤의 날짜일 경우 INVALID_DATE 반환
             if start_date > end_date:
                 return jsonify({'message':'INVALID_DATE'}), 400
 
             arguments = {
-                'start_date'          : start_date,
-                'end_date'            : end_date,
-                'status_id'           : status_id,
-                'order_number'        : order_number,
-                'detail_number'       : detail_number,
-                'user_name'           : user_name,
-                'phone_number'        : phone_number,
-                'seller_name'         : seller_name,
-                'product_name'        : product_name,
-                'seller_properties'   : seller_properties,
-                'offset'              : offset,
-                'limit'               : limit,
-                'order_cancel_reason' : order_cancel_reason,
-                'order_refund_reason' : order_refund_reason
+                'start_date'        : start_date,
+                'end_date'          : end_date,
+                'seller_properties' : seller_properties
             }
 
-            order_data = self.service.get_order_data(db, arguments)
+            order_summary = self.service.get_order_summary(db, arguments)
 
-        except ValueError:
+        except (ValueError, SyntaxError):
             traceback.print_exc()
             return jsonify({'message':'VALUE_ERROR'}), 400
 
@@ -135,7 +299,7 @@ class GetOrderDataView(MethodView):
             return jsonify({'message':'UNSUCCESS'}), 400
 
         else:
-            return jsonify(order_data), 200
+            return jsonify(order_summary), 200
 
         finally:
             db.close()
@@ -155,33 +319,54 @@ class PutOrderStatusView(MethodView):
             db = DATABASE Connection Instance
         Returns :
             KEY_ERROR, 400
-            VALUE_ERROR, 400
-            SUCCESS, 200
+            VALUE_ERROR, 400 (to_status 가 상태 아이디가 아닌 경우 포함)
+            {
+                'message' : SUCCESS (모두 변경) | PARTIAL_SUCCESS (일부만 변경) | FAILED (하나도 변경 못함),
+                'results' : [{
+                    'order_detail_id' : 주문 상세 아이디,
+                    'result'          : SUCCESS | ORDER_NOT_FOUND | INVALID_STATUS_TRANSITION
+                }]
+            }, 200 (FAILED 는 400)
         Author :
             김태수
         History:
             2020-09-28 : 초기 생성
+            2026-10-18 : 주문별 변경 결과 반환
+            2026-10-18 : to_status 를 int 로 변환, 일부 / 전체 실패를 message 로 구분
+            2026-10-18 : 커밋한 뒤에 주문 상세 페이지 캐시 비우기
         """
 
         try:
             db = connection.get_connection()
             data = request.get_json()
 
+            order_detail_id = ast.literal_eval(data['order_detail_id'])
+
+            # 주문 상세 아이디가 하나만 들어올 경우 리스트로 변환
+            if isinstance(order_detail_id, int):
+                order_detail_id = [order_detail_id]
+
+            # JSON / 폼에서 문자열("2")로 들어올 수 있다.
+            try:
+                to_status = int(data['to_status'])
+            except (TypeError, ValueError):
+                raise ValueError
+
             arguments = {
-                'order_detail_id'     : ast.literal_eval(data['order_detail_id']),
-                'to_status'           : data['to_status'],
+                'order_detail_id'     : list(order_detail_id),
+                'to_status'           : to_status,
                 'order_cancel_reason' : None,
                 'order_refund_reason' : None
             }
 
-            if data['to_status'] == 6:
+            if to_status == 6:
                 arguments['order_cancel_reason'] = data['order_cancel_reason']
                 arguments['order_refund_reason'] = None
-            elif data['to_status'] == 7:
+            elif to_status == 7:
                 arguments['order_refund_reason'] = data['order_refund_reason']
                 arguments['order_cancel_reason'] = None
 
-            self.service.update_order_status(db, arguments)
+            results = self.service.update_order_status(db, arguments)
 
         except KeyError:
             traceback.print_exc()
@@ -203,7 +388,20 @@ class PutOrderStatusView(MethodView):
 
         else:
             db.commit()
-            return jsonify({'message':'SUCCESS'}), 200
+
+            succeeded = [result['order_detail_id'] for result in results if result['result'] == 'SUCCESS']
+            success_count = len(succeeded)
+
+            # 커밋한 뒤에 캐시를 비워야 동시에 들어온 조회가 이전 값을 다시 캐시에 넣지 않는다.
+            self.service.invalidate_order_detail(succeeded)
+
+            if results and success_count == len(results):
+                return jsonify({'message':'SUCCESS', 'results':results}), 200
+
+            if success_count:
+                return jsonify({'message':'PARTIAL_SUCCESS', 'results':results}), 200
+
+            return jsonify({'message':'FAILED', 'results':results}), 400
 
         finally:
             db.close()
@@ -307,6 +505,7 @@ class PutAddress(MethodView):
             김태수
         History:
             2020-10-04 : 초기 생성
+            2026-10-18 : 커밋한 뒤에 주문 상세 페이지 캐시 비우기
         """
 
         try:
@@ -341,6 +540,9 @@ class PutAddress(MethodView):
 
         else:
             db.commit()
+
+            # 커밋한 뒤에 캐시를 비워야 동시에 들어온 조회가 이전 값을 다시 캐시에 넣지 않는다.
+            self.service.invalidate_order_detail([arguments['order_detail_id']])
             return jsonify({'message':'SUCCESS'}), 200
 
         finally:
@@ -3,7 +3,7 @@ import datetime
 import os
 from ast import literal_eval
 
-from flask          import jsonify, request, send_file
+from flask          import jsonify, request, send_file, Response
 from flask.views    import MethodView
 from pymysql        import err
 
@@ -12,7 +12,7 @@ from botocore.exceptions import ClientError
 import traceback
 
 import config
-from connection import get_connection
+from connection import get_connection, get_pool
 from exceptions import (
     NonImageFilenameError, 
     NonPrimaryImageError,
@@ -24,6 +24,7 @@ from exceptions import (
 from utils.validation import (
     validate_products_limit,
     validate_products_offset,
+    validate_products_cursor,
     validate_products_product_id,
     validate_products_seller_property_ids,
     validate_products_start_end_date,
@@ -34,6 +35,31 @@ from utils.validation import (
     validate_image_status
 )
 from utils.decorator import login_decorator2
+from utils.export import make_attachment_header
+
+def make_reference_data_response(results, etag):
+    """
+    기준 데이터 응답 만들기
+    강한 ETag 를 붙이고, If-None-Match 가 같으면 304 로 바꾼다.
+
+    Args:
+        results: 응답 데이터
+        etag   : 데이터 내용으로 만든 ETag
+
+    Returns:
+        200 또는 304 응답 객체
+
+    Author:
+        김태수
+
+    History:
+        2026-10-18(김태수): 초기 생성
+    """
+    response = jsonify(results)
+    response.set_etag(etag)
+    # 매번 서버에 확인하되, 바뀌지 않았으면 본문 없이 304
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
 
 class FirstCategoriesBySellerPropertyIdView(MethodView):
     def __init__(self, service):
@@ -49,6 +75,8 @@ class FirstCategoriesBySellerPropertyIdView(MethodView):
         Returns:
             200: 
                 1차 카테고리 딕셔너리 리스트를 JSON으로 리턴
+            304:
+                If-None-Match 의 ETag 와 같으면 본문 없이 리턴
             400: 
                 INVALID_QUERY_PARAMS: 쿼리 스트링의 값이 올바르지 않음
             500:
@@ -60,10 +88,9 @@ class FirstCategoriesBySellerPropertyIdView(MethodView):
 
         History:
             2020-09-22(이충희): 초기 생성
+            2026-10-18(김태수): 기준 데이터 캐시 + ETag 적용
         """
         try:
-            conn = get_connection()
-
             seller_property_id = request.args.get('seller-property-id', None)
             if not seller_property_id or not seller_property_id.isnumeric():
                 message = {"message": "INVALID_QUERY_PARAMS"}
@@ -71,14 +98,12 @@ class FirstCategoriesBySellerPropertyIdView(MethodView):
 
             seller_property_id = int(seller_property_id)
 
-            results = self.service.find_first_categories_by_seller_property_id(conn, seller_property_id)
+            results, etag = self.service.find_first_categories_by_seller_property_id(seller_property_id)
         except (err.OperationalError, err.InternalError) as e:
             message = {"errno": e.args[0], "errval": e.args[1]}
             return jsonify(message), 500
         else:
-            return jsonify(results), 200
-        finally:
-            conn.close()
+            return make_reference_data_response(results, etag)
 
 class SecondCategoriesByFirstCategoryIdView(MethodView):
     def __init__(self, service):
@@ -94,6 +119,8 @@ class SecondCategoriesByFirstCategoryIdView(MethodView):
         Returns:
             200: 
                 2차 카테고리 딕셔너리 리스트를 JSON으로 리턴
+            304:
+                If-None-Match 의 ETag 와 같으면 본문 없이 리턴
             400: 
                 INVALID_QUERY_PARAMS: 쿼리 스트링의 값이 올바르지 않음
             500:
@@ -105,10 +132,9 @@ class SecondCategoriesByFirstCategoryIdView(MethodView):
 
         History:
             2020-09-22(이충희): 초기 생성
+            2026-10-18(김태수): 기준 데이터 캐시 + ETag 적용
         """
         try:
-            conn = get_connection()
-
             first_category_id = request.args.get('first-category-id', None)
             if not first_category_id or not first_category_id.isnumeric():
                 message = {"message": "INVALID_QUERY_PARAMS"}
@@ -116,14 +142,12 @@ class SecondCategoriesByFirstCategoryIdView(MethodView):
 
             first_category_id = int(first_category_id)
 
-            results = self.service.find_second_categories_by_first_category_id(conn, first_category_id)
+            results, etag = self.service.find_second_categories_by_first_category_id(first_category_id)
         except (err.OperationalError, err.InternalError) as e:
             message = {"errno": e.args[0], "errval": e.args[1]}
             return jsonify(message), 500
         else:
-            return jsonify(results), 200
-        finally:
-            conn.close()
+            return make_reference_data_response(results, etag)
 
 class ProductsView(MethodView):
     def __init__(self, service):
@@ -158,7 +182,11 @@ class ProductsView(MethodView):
         History:
             2020-09-28(이충희): 초기 생성
             2020-09-29(이충희): 커스텀 에러 처리 추가
+            2026-10-18(김태수): 커밋 실패 시 S3에 올린 이미지 삭제
+            2026-10-18(김태수): 트랜잭션 시작 전에 이미지 업로드, 실패 시 정리는 뷰에서 한 번만
         """
+        # S3에 올린 이미지 (등록이 실패하면 지운다)
+        uploaded = []
         try:
             conn = get_connection()
             
@@ -169,8 +197,12 @@ class ProductsView(MethodView):
 
             body  = json.loads(request.form.get('body', None))
             
+            # 업로드하는 동안 트랜잭션을 열어 두지 않도록 먼저 올린다.
+            code, uploaded, urls = self.service.upload_product_images(images)
+
             conn.begin()
-            self.service.add_product(conn, images, body)
+            self.service.add_product(conn, body, code, urls)
+            conn.commit()
 
         except ClientError as e:
             conn.rollback()
@@ -178,6 +210,7 @@ class ProductsView(MethodView):
             return jsonify(message), 500
         except (err.OperationalError, err.InternalError, err.IntegrityError) as e:
             conn.rollback()
+            self.delete_uploaded_images(uploaded)
             message = { "errno": e.args[0], "errval": e.args[1] }
             return jsonify(message), 500
         except (NonPrimaryImageError, NonImageFilenameError) as e:
@@ -186,6 +219,7 @@ class ProductsView(MethodView):
             return jsonify(message), 400
         except KeyError as e:
             conn.rollback()
+            self.delete_uploaded_images(uploaded)
             message = { "message": "FORM_DATA_KEY_ERROR" }
             return jsonify(message), 400
         except json.decoder.JSONDecodeError as e:
@@ -193,12 +227,30 @@ class ProductsView(MethodView):
             message = { "message": "INVALID_JSON_FORMAT" }
             return jsonify(message), 400
         else:
-            conn.commit()
             message = { "message": "SUCCESS" }
             return jsonify(message), 200
         finally:
             conn.close()
 
+    def delete_uploaded_images(self, filenames):
+        """
+        등록에 실패한 상품의 S3 이미지 삭제
+        원래 에러를 응답해야 하므로 삭제 실패는 로그만 남긴다.
+
+        Args:
+            filenames: S3에 올린 이미지 파일 이름(키) 리스트
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        try:
+            self.service.delete_images_from_s3(filenames)
+        except ClientError:
+            traceback.print_exc()
+
     @login_decorator2
     def get(self, seller_id):
         """
@@ -208,7 +260,7 @@ class ProductsView(MethodView):
 
         Returns:
             200: 
-                SUCCESS: 상품 리스트 리턴
+                SUCCESS: {"total_count", "is_exact_count", "products"} 리턴 (cursor 쿼리스트링이 있으면 "next_cursor" 포함)
             400: 
                 ValidationError: 쿼리스트링 검사 에러
             500:
@@ -220,6 +272,8 @@ class ProductsView(MethodView):
 
         History:
             2020-09-30(이충희): 초기 생성
+            2026-10-18(김태수): cursor 쿼리스트링으로 커서 페이지네이션 지원
+            2026-10-18(김태수): 응답에 전체 개수 추가
         """
         try:
             conn = get_connection()
@@ -237,10 +291,12 @@ class ProductsView(MethodView):
             is_sold             = request.args.get('is_sold', None)
             is_displayed        = request.args.get('is_displayed', None)
             is_discounted       = request.args.get('is_discounted', None)
+            cursor              = request.args.get('cursor', None)
 
             # 쿼리 스트링 검사
             limit  = validate_products_limit(limit)
             offset = validate_products_offset(offset)
+            cursor = validate_products_cursor(cursor)
             validate_products_start_end_date(start_date, end_date)
             product_id    = validate_products_product_id(product_id)
             is_sold       = validate_products_is_sold(is_sold)
@@ -261,7 +317,8 @@ class ProductsView(MethodView):
                 seller_property_ids,
                 is_sold,
                 is_displayed,
-                is_discounted
+                is_discounted,
+                cursor
             )
         except ValidationError as e:
             message = {"message": e.message}
@@ -413,6 +470,8 @@ class ProductCountriesView(MethodView):
         Returns:
             200: 
                 SUCCESS: 원산지 국가 리스트 리턴
+            304:
+                If-None-Match 의 ETag 와 같으면 본문 없이 리턴
             500:
                 OperationalError: 데이터베이스 조작 에러
                 InternalError   : 데이터베이스 내부 에러
@@ -422,18 +481,15 @@ class ProductCountriesView(MethodView):
 
         History:
             2020-10-02(이충희): 초기 생성
+            2026-10-18(김태수): 기준 데이터 캐시 + ETag 적용
         """
         try:
-            conn = get_connection()
-
-            results = self.service.get_countries(conn)
+            results, etag = self.service.get_countries()
         except (err.OperationalError, err.InternalError) as e:
             message = {"errno": e.args[0], "errval": e.args[1]}
             return jsonify(message), 500
         else:
-            return jsonify(results), 200
-        finally:
-            conn.close()
+            return make_reference_data_response(results, etag)
 
 class ProductColorsView(MethodView):
     def __init__(self, service):
@@ -449,6 +505,8 @@ class ProductColorsView(MethodView):
         Returns:
             200: 
                 SUCCESS: 상품 옵션 색상 리스트 리턴
+            304:
+                If-None-Match 의 ETag 와 같으면 본문 없이 리턴
             500:
                 OperationalError: 데이터베이스 조작 에러
                 InternalError   : 데이터베이스 내부 에러
@@ -458,19 +516,16 @@ class ProductColorsView(MethodView):
 
         History:
             2020-10-02(이충희): 초기 생성
+            2026-10-18(김태수): 기준 데이터 캐시 + ETag 적용
         """
 
         try:
-            conn = get_connection()
-
-            results = self.service.get_colors(conn)
+            results, etag = self.service.get_colors()
         except (err.OperationalError, err.InternalError) as e:
             message = {"errno": e.args[0], "errval": e.args[1]}
             return jsonify(message), 500
         else:
-            return jsonify(results), 200
-        finally:
-            conn.close()
+            return make_reference_data_response(results, etag)
 
 class ProductSizesView(MethodView):
     def __init__(self, service):
@@ -486,6 +541,8 @@ class ProductSizesView(MethodView):
         Returns:
             200: 
                 SUCCESS: 상품 옵션 사이즈 리스트 리턴
+            304:
+                If-None-Match 의 ETag 와 같으면 본문 없이 리턴
             500:
                 OperationalError: 데이터베이스 조작 에러
                 InternalError   : 데이터베이스 내부 에러
@@ -495,19 +552,16 @@ class ProductSizesView(MethodView):
 
         History:
             2020-10-02(이충희): 초기 생성
+            2026-10-18(김태수): 기준 데이터 캐시 + ETag 적용
         """
 
         try:
-            conn = get_connection()
-
-            results = self.service.get_sizes(conn)
+            results, etag = self.service.get_sizes()
         except (err.OperationalError, err.InternalError) as e:
             message = {"errno": e.args[0], "errval": e.args[1]}
             return jsonify(message), 500
         else:
-            return jsonify(results), 200
-        finally:
-            conn.close()
+            return make_reference_data_response(results, etag)
 
 class ProductsDownloadView(MethodView):
     def __init__(self, service):
@@ -523,6 +577,7 @@ class ProductsDownloadView(MethodView):
         Returns:
             200: 
                 SUCCESS: 엑셀 파일 다운로드
+                         (format=xlsx|csv 이면 임시 파일 없이 스트리밍, 없으면 기존 xls 파일)
             400:
                 ValidationError         : 상품 아이디 검사 에러
                 OneOfDatesAreNoneError  : 시작날짜 종료날짜 중 하나가 없음 에러
@@ -537,10 +592,16 @@ class ProductsDownloadView(MethodView):
 
         History:
             2020-10-03(이충희): 초기 생성
+            2026-10-18(김태수): xlsx / csv 스트리밍 다운로드 추가
         """
         try:
             conn = get_connection()
 
+            # 파일 형식 xlsx / csv (스트리밍), 없으면 기존 xls
+            file_format = request.args.get('format', None)
+            if file_format not in (None, "xlsx", "csv"):
+                raise InvalidDownloadTypeError("FORMAT_MUST_BE_XLSX_OR_CSV")
+
             # 다운로드 타입 all(날짜 조건의 모든 상품) / select (선택상품)
             download_type = request.args.get('type', '')
             if download_type == "all":
@@ -552,6 +613,9 @@ class ProductsDownloadView(MethodView):
 
                 validate_products_start_end_date(start_date, end_date)
 
+                if file_format:
+                    return self.stream_products_file(file_format, start_date = start_date, end_date = end_date)
+
                 directory, filename, filename_for_user = self.service.make_excel_all(conn, start_date, end_date)
 
             elif download_type == "select":
@@ -563,6 +627,9 @@ class ProductsDownloadView(MethodView):
                 for product_id in product_ids:
                     validate_products_product_id(str(product_id))
 
+                if file_format:
+                    return self.stream_products_file(file_format, product_ids = tuple(product_ids))
+
                 directory, filename, filename_for_user = self.service.make_excel_select(conn, tuple(product_ids))
             else:
                 raise InvalidDownloadTypeError("TYPE_MUST_BE_ALL_OR_SELECT")
@@ -587,6 +654,39 @@ class ProductsDownloadView(MethodView):
         finally:
             conn.close()
 
+    def stream_products_file(self, file_format, start_date=None, end_date=None, product_ids=None):
+        """
+        상품 리스트 파일 스트리밍 응답 만들기
+        응답 본문을 다 보낼 때까지 커넥션을 써야 하므로 요청 범위 커넥션과 별도로 풀에서 꺼내고,
+        응답이 닫힐 때 반환한다.
+
+        Args:
+            file_format: 'xlsx' 또는 'csv'
+            start_date : 조건 시작 날짜
+            end_date   : 조건 종료 날짜
+            product_ids: 선택한 상품 아이디 튜플
+
+        Returns:
+            청크 단위 파일 응답
+
+        Author:
+            김태수
+
+        History:
+            2026-10-18(김태수): 초기 생성
+        """
+        stream_conn = get_pool().acquire()
+
+        chunks, mimetype, filename_for_user = self.service.stream_products_file(
+            stream_conn, file_format, start_date, end_date, product_ids
+        )
+
+        now_date = datetime.datetime.now().strftime("%Y%m%d")
+        response = Response(chunks, mimetype = mimetype)
+        response.headers['Content-Disposition'] = make_attachment_header(now_date + "_" + filename_for_user)
+        response.call_on_close(stream_conn.close)
+        return response
+
 class ProductHistoryView(MethodView):
     def __init__(self, service):
         self.service = service